@@ -0,0 +1,95 @@
+"""Circuit breaker suspending requests to failing hosts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+from urllib.parse import urlsplit
+
+from .consts import (
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT,
+)
+from .exceptions import GeoRssException
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Suspend requests to hosts that keep failing.
+
+    After a number of consecutive failed requests to a host, its circuit
+    opens and further requests to the host are rejected without sending
+    them. Feeds record one failure per update, once its retries are used up. Once the reset timeout has passed, a single trial request is let
+    through. The circuit closes if it succeeds, and otherwise stays open for
+    another timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialise circuit breaker."""
+        if failure_threshold < 1:
+            raise GeoRssException(f"Invalid failure threshold: {failure_threshold}")
+        self._failure_threshold: int = failure_threshold
+        self._reset_timeout: float = reset_timeout
+        self._clock: Callable[[], float] = clock
+        # Consecutive failures by host.
+        self._failures: dict[str, int] = {}
+        # Clock time the circuit of a host opened, or let the last trial through.
+        self._opened: dict[str, float] = {}
+
+    def __repr__(self):
+        """Return string representation of this circuit breaker."""
+        return f"<{self.__class__.__name__}(open={len(self._opened)})>"
+
+    @staticmethod
+    def _host(url: str) -> str:
+        """Return the host of the URL."""
+        return urlsplit(url).hostname or ""
+
+    def allow(self, url: str) -> bool:
+        """Check if a request to the URL may be sent."""
+        host = self._host(url)
+        opened: float | None = self._opened.get(host)
+        if opened is None:
+            return True
+        now = self._clock()
+        if now - opened < self._reset_timeout:
+            return False
+        # Let one trial request through, and keep rejecting the others.
+        self._opened[host] = now
+        return True
+
+    def record_success(self, url: str):
+        """Close the circuit of the host after a successful request."""
+        host = self._host(url)
+        self._failures.pop(host, None)
+        if self._opened.pop(host, None) is not None:
+            _LOGGER.info("Requests to %s resumed", host)
+
+    def record_failure(self, url: str):
+        """Count the failed request, and open the circuit of the host if needed."""
+        host = self._host(url)
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if failures >= self._failure_threshold:
+            if host not in self._opened:
+                _LOGGER.warning(
+                    "Requests to %s suspended after %s failures", host, failures
+                )
+            self._opened[host] = self._clock()
+
+    def is_open(self, url: str) -> bool:
+        """Check if requests to the host of the URL are suspended."""
+        return self._host(url) in self._opened
+
+    @property
+    def open_hosts(self) -> list[str]:
+        """Return the hosts whose requests are suspended."""
+        return list(self._opened)
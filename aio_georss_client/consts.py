@@ -3,13 +3,100 @@
 from typing import Final
 
 ATTR_ATTRIBUTION: Final = "attribution"
+# Keys of feed and feed manager snapshots.
+ATTR_DIGEST: Final = "digest"
+ATTR_ETAG: Final = "etag"
+ATTR_FEED: Final = "feed"
+ATTR_FEED_DATA: Final = "feed_data"
+ATTR_FINGERPRINTS: Final = "fingerprints"
+ATTR_LAST_MODIFIED: Final = "last_modified"
+ATTR_LAST_TIMESTAMP: Final = "last_timestamp"
+ATTR_LAST_UPDATE: Final = "last_update"
+ATTR_LAST_UPDATE_SUCCESSFUL: Final = "last_update_successful"
+ATTR_MANAGED_EXTERNAL_IDS: Final = "managed_external_ids"
+ATTR_URL: Final = "url"
+ATTR_VERSION: Final = "version"
 CUSTOM_ATTRIBUTE: Final = "custom_attribute"
 
 DEFAULT_REQUEST_TIMEOUT: Final = 10
+DEFAULT_RESPONSE_CHUNK_SIZE: Final = 65536
+
+# Content encodings of responses.
+CONTENT_ENCODING_BROTLI: Final = "br"
+CONTENT_ENCODING_DEFLATE: Final = "deflate"
+CONTENT_ENCODING_GZIP: Final = "gzip"
+CONTENT_ENCODING_IDENTITY: Final = "identity"
+CONTENT_ENCODING_ZSTD: Final = "zstd"
+
+# Size of the spatial index grid cells in degrees.
+DEFAULT_SPATIAL_INDEX_CELL_SIZE: Final = 1.0
+# Geometries and queries covering more cells are not looked up cell by cell.
+SPATIAL_INDEX_MAX_CELLS: Final = 1024
+
+# Feeds polled at the same time, in total and per host.
+DEFAULT_SCHEDULER_MAX_CONCURRENCY: Final = 10
+DEFAULT_SCHEDULER_MAX_CONCURRENCY_PER_HOST: Final = 2
+# Random deviation of poll intervals, as a fraction of the interval.
+DEFAULT_SCHEDULER_JITTER: Final = 0.1
+# Upper limit of poll intervals in seconds after backing off.
+DEFAULT_SCHEDULER_MAX_INTERVAL: Final = 3600.0
+# Growth of poll intervals per consecutive failed or unchanged poll.
+SCHEDULER_ERROR_BACKOFF: Final = 2.0
+SCHEDULER_UNCHANGED_BACKOFF: Final = 1.5
+
+# Format version of feed manager snapshots.
+SNAPSHOT_VERSION: Final = 1
+
+# Connections of a feed fetcher per host, how long idle connections are kept
+# alive (seconds) and how long DNS lookups are cached (seconds).
+DEFAULT_FETCHER_LIMIT_PER_HOST: Final = 4
+DEFAULT_FETCHER_KEEPALIVE_TIMEOUT: Final = 60.0
+DEFAULT_FETCHER_DNS_CACHE_TTL: Final = 300
+
+# Attempts of a request including retries, delay (seconds) before the first
+# retry, upper limit of the delay (seconds) and its random deviation, as a
+# fraction of the delay.
+DEFAULT_RETRY_MAX_ATTEMPTS: Final = 3
+DEFAULT_RETRY_BACKOFF: Final = 1.0
+DEFAULT_RETRY_MAX_DELAY: Final = 30.0
+DEFAULT_RETRY_JITTER: Final = 0.2
+# Growth of the delay per failed attempt.
+RETRY_BACKOFF_FACTOR: Final = 2.0
+# Response status codes of transient errors, worth retrying.
+RETRY_STATUS_CODES: Final = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+# Consecutive failed requests opening the circuit of a host, and how long
+# (seconds) requests to the host are then suspended.
+DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final = 5
+DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT: Final = 60.0
+
+# Stages of a feed update measured by update metrics.
+METRIC_STAGE_REQUEST: Final = "request"
+METRIC_STAGE_DOWNLOAD: Final = "download"
+METRIC_STAGE_DECODE: Final = "decode"
+METRIC_STAGE_PARSE: Final = "parse"
+METRIC_STAGE_ENTRIES: Final = "entries"
+METRIC_STAGE_FILTER: Final = "filter"
+METRIC_STAGE_STORE: Final = "store"
+METRIC_STAGE_REMOVE_CALLBACKS: Final = "remove_callbacks"
+METRIC_STAGE_UPDATE_CALLBACKS: Final = "update_callbacks"
+METRIC_STAGE_GENERATE_CALLBACKS: Final = "generate_callbacks"
+# Counts of a feed update recorded by update metrics. Bytes are counted after
+# decompression, wire bytes before.
+METRIC_COUNT_BYTES: Final = "bytes"
+METRIC_COUNT_WIRE_BYTES: Final = "wire_bytes"
+METRIC_COUNT_ITEMS: Final = "items"
+METRIC_COUNT_ENTRIES: Final = "entries"
+
+PARSER_BACKEND_EXPAT: Final = "expat"
+PARSER_BACKEND_XMLTODICT: Final = "xmltodict"
 
 UPDATE_OK: Final = "OK"
 UPDATE_OK_NO_DATA: Final = "OK_NO_DATA"
+UPDATE_OK_UNCHANGED: Final = "OK_UNCHANGED"
 UPDATE_ERROR: Final = "ERROR"
+# Response exceeded the configured size, item or polygon vertex limits.
+UPDATE_ERROR_LIMIT_EXCEEDED: Final = "ERROR_LIMIT_EXCEEDED"
 
 XML_ATTR_HREF: Final = "@href"
 XML_ATTR_TERM: Final = "@term"
@@ -3,3 +3,7 @@
 
 class GeoRssException(Exception):
     """GeoRSS Exception."""
+
+
+class GeoRssLimitExceeded(GeoRssException):
+    """GeoRSS response exceeding a configured limit."""
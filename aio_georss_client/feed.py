@@ -5,28 +5,98 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
 import codecs
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
+import hashlib
+from http import HTTPStatus
 import logging
 from pyexpat import ExpatError
+import time
 from typing import Generic, TypeVar
 
 import aiohttp
-from aiohttp import ClientSession, client_exceptions
+from aiohttp import ClientResponse, ClientSession, client_exceptions, hdrs
 
+from .circuit_breaker import CircuitBreaker
 from .consts import (
     ATTR_ATTRIBUTION,
+    ATTR_DIGEST,
+    ATTR_ETAG,
+    ATTR_FEED_DATA,
+    ATTR_LAST_MODIFIED,
+    ATTR_LAST_TIMESTAMP,
+    ATTR_URL,
+    CONTENT_ENCODING_BROTLI,
+    CONTENT_ENCODING_DEFLATE,
+    CONTENT_ENCODING_GZIP,
+    CONTENT_ENCODING_IDENTITY,
+    CONTENT_ENCODING_ZSTD,
     DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_RESPONSE_CHUNK_SIZE,
+    METRIC_COUNT_BYTES,
+    METRIC_COUNT_ENTRIES,
+    METRIC_COUNT_ITEMS,
+    METRIC_COUNT_WIRE_BYTES,
+    METRIC_STAGE_DECODE,
+    METRIC_STAGE_DOWNLOAD,
+    METRIC_STAGE_ENTRIES,
+    METRIC_STAGE_FILTER,
+    METRIC_STAGE_PARSE,
+    METRIC_STAGE_REQUEST,
+    PARSER_BACKEND_XMLTODICT,
     UPDATE_ERROR,
+    UPDATE_ERROR_LIMIT_EXCEEDED,
     UPDATE_OK,
     UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
 )
+from .exceptions import GeoRssLimitExceeded
 from .feed_entry import FeedEntry
+from .feed_fetcher import FeedFetcher
+from .geo_rss_distance_helper import GeoRssDistanceHelper
+from .retry_policy import RetryPolicy, is_transient_error
+from .update_metrics import UpdateMetrics, measure_stage
 from .xml_parser import Feed, XmlParser
+from .xml_parser.encoding import detect_encoding, is_complete_head
 from .xml_parser.feed_item import FeedItem
+from .xml_parser.geometry import BoundingBox
+from .xml_parser.streaming_parser import StreamingXmlParser
+
+try:
+    from aiohttp import compression_utils
+except ImportError:
+    compression_utils = None
 
 _LOGGER = logging.getLogger(__name__)
 
 T_FEED_ENTRY = TypeVar("T_FEED_ENTRY", bound=FeedEntry)
+T_RESULT = TypeVar("T_RESULT")
+
+
+def _supported_content_encodings() -> str:
+    """Return the content encodings that aiohttp can decompress."""
+    encodings = [CONTENT_ENCODING_GZIP, CONTENT_ENCODING_DEFLATE]
+    # Brotli and Zstandard depend on optional libraries.
+    if getattr(compression_utils, "HAS_BROTLI", False):
+        encodings.append(CONTENT_ENCODING_BROTLI)
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        encodings.append(CONTENT_ENCODING_ZSTD)
+    return ", ".join(encodings)
+
+
+SUPPORTED_CONTENT_ENCODINGS = _supported_content_encodings()
+# Keys of feed snapshots.
+FEED_SNAPSHOT_KEYS = frozenset(
+    [
+        ATTR_URL,
+        ATTR_ETAG,
+        ATTR_LAST_MODIFIED,
+        ATTR_LAST_TIMESTAMP,
+        ATTR_DIGEST,
+        ATTR_FEED_DATA,
+    ]
+)
 
 
 class GeoRssFeed(Generic[T_FEED_ENTRY], ABC):
@@ -47,6 +117,13 @@ class GeoRssFeed(Generic[T_FEED_ENTRY], ABC):
         self._filter_categories: list[str] | None = filter_categories
         self._url: str = url
         self._last_timestamp: datetime | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._last_digest: bytes | None = None
+        self._last_entries: list[T_FEED_ENTRY] | None = None
+        self.parser: XmlParser | None = None
+        self.feed_data: Feed | None = None
+        self._metrics: UpdateMetrics | None = None
 
     def __repr__(self):
         """Return string representation of this feed."""
@@ -65,114 +142,636 @@ class GeoRssFeed(Generic[T_FEED_ENTRY], ABC):
         """Define client session timeout in seconds. Override if necessary."""
         return DEFAULT_REQUEST_TIMEOUT
 
+    def _accept_encoding(self) -> str | None:
+        """Define the content encodings to request the feed in.
+
+        By default all encodings that can be decompressed; None leaves the
+        header to the client session. Override if necessary.
+        """
+        return SUPPORTED_CONTENT_ENCODINGS
+
     def _additional_namespaces(self):
         """Provide additional namespaces, relevant for this feed."""
 
+    def _parser_backend(self) -> str:
+        """Define the XML parser backend. Override if necessary."""
+        return PARSER_BACKEND_XMLTODICT
+
+    def _lazy_conversion(self) -> bool:
+        """Define whether to convert dates and coordinates on first access.
+
+        Values of entries that are filtered out are then never converted.
+        Override if necessary.
+        """
+        return False
+
+    def _streaming_response(self) -> bool:
+        """Define whether to parse the response while downloading it.
+
+        Streaming always uses the expat parser backend. Override if necessary.
+        """
+        return False
+
+    def _executor(self) -> Executor | None:
+        """Define the executor parsing responses and creating entries.
+
+        By default both run inline on the event loop. A thread pool executor
+        runs parsing, entry creation and filtering; a process pool executor
+        only runs parsing and returns the parsed document. Streamed responses
+        are always parsed inline. Override if necessary.
+        """
+        return None
+
+    def _fetcher(self) -> FeedFetcher | None:
+        """Define the fetcher sharing connections and requests with other feeds.
+
+        By default requests are sent through the client session of this feed.
+        Feeds returning the same fetcher use its client session per host, and
+        concurrent identical requests of these feeds are only sent and parsed
+        once. Override if necessary.
+        """
+        return None
+
+    def _retry_policy(self) -> RetryPolicy | None:
+        """Define how to retry requests failing with transient errors.
+
+        By default failed requests are not retried. Override if necessary.
+        """
+        return None
+
+    def _circuit_breaker(self) -> CircuitBreaker | None:
+        """Define the circuit breaker suspending requests to failing hosts.
+
+        Feeds returning the same circuit breaker share the state of each host.
+        Override if necessary.
+        """
+        return None
+
+    def _collect_metrics(self) -> bool:
+        """Define whether to measure the stages of each update.
+
+        Override if necessary.
+        """
+        return False
+
+    def _detect_unchanged_response(self) -> bool:
+        """Define whether to skip processing a response identical to the last one.
+
+        Unchanged responses are reported with status OK_UNCHANGED and the
+        previously processed entries. Override if necessary.
+        """
+        return False
+
+    def _max_response_size(self) -> int | None:
+        """Define the maximum size (bytes) of the decompressed response.
+
+        Streamed responses are aborted as soon as they exceed the maximum.
+        Override if necessary.
+        """
+        return None
+
+    def _max_items(self) -> int | None:
+        """Define the maximum number of items in the feed. Override if necessary."""
+        return None
+
+    def _max_polygon_vertices(self) -> int | None:
+        """Define the maximum number of vertices of a polygon.
+
+        Override if necessary.
+        """
+        return None
+
     async def update(self) -> tuple[str, list[T_FEED_ENTRY] | None]:
         """Update from external source and return filtered entries."""
+        self._metrics = UpdateMetrics() if self._collect_metrics() else None
         status, rss_data = await self._fetch()
         if status == UPDATE_OK:
             if rss_data:
-                global_data = self._extract_from_feed(rss_data)
-                # Extract data from feed entries.
-                entries: list = [
-                    self._new_entry(self._home_coordinates, rss_entry, global_data)
-                    for rss_entry in rss_data.entries
-                ]
-                filtered_entries = self._filter_entries(entries)
+                filtered_entries = await self._run_in_executor(
+                    self._create_entries, rss_data, picklable=False
+                )
                 self._last_timestamp = self._extract_last_timestamp(filtered_entries)
+                self._last_entries = filtered_entries
                 return UPDATE_OK, filtered_entries
             # Should not happen.
             return UPDATE_OK, None
+        if status == UPDATE_OK_UNCHANGED:
+            # Response body identical to the last one processed.
+            return UPDATE_OK_UNCHANGED, self._last_entries
         if status == UPDATE_OK_NO_DATA:
             # Happens for example if the server returns 304
             return UPDATE_OK_NO_DATA, None
-        # Error happened while fetching the feed.
+        # Error happened while fetching the feed, or response exceeded limits.
+        self._reset_update_state()
+        return status, None
+
+    def _create_entries(self, rss_data: Feed) -> list[T_FEED_ENTRY]:
+        """Create entries from the feed and filter them."""
+        with measure_stage(self._metrics, METRIC_STAGE_ENTRIES):
+            global_data = self._extract_from_feed(rss_data)
+            # Extract data from feed entries.
+            entries: list = [
+                self._new_entry(self._home_coordinates, rss_entry, global_data)
+                for rss_entry in rss_data.entries
+            ]
+        with measure_stage(self._metrics, METRIC_STAGE_FILTER):
+            filtered_entries = self._filter_entries(entries)
+        if self._metrics is not None:
+            self._metrics.add_count(METRIC_COUNT_ITEMS, len(entries))
+            self._metrics.add_count(METRIC_COUNT_ENTRIES, len(filtered_entries))
+        return filtered_entries
+
+    async def _run_in_executor(
+        self, func: Callable[..., T_RESULT], *args, picklable: bool = True
+    ) -> T_RESULT:
+        """Run the function in the configured executor, or inline without one.
+
+        Functions that are not picklable, or whose arguments or results are
+        not, never run in a process pool executor.
+        """
+        executor = self._executor()
+        if executor is None or (
+            not picklable and isinstance(executor, ProcessPoolExecutor)
+        ):
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    def _reset_update_state(self):
+        """Forget everything learned from previous updates."""
         self._last_timestamp = None
-        return UPDATE_ERROR, None
+        # Make sure that the next request fetches the full feed again.
+        self._etag = None
+        self._last_modified = None
+        self._last_digest = None
+        self._last_entries = None
+
+    def snapshot(self, include_feed_data: bool = False) -> dict:
+        """Return the state of this feed needed to resume after a restart.
+
+        If requested and available, this contains the parsed data of the last
+        response together with its validators for conditional requests.
+        """
+        feed_data = (
+            self.feed_data if include_feed_data and self._has_last_entries() else None
+        )
+        return {
+            ATTR_URL: self._url,
+            ATTR_ETAG: self._etag if feed_data else None,
+            ATTR_LAST_MODIFIED: self._last_modified if feed_data else None,
+            ATTR_LAST_TIMESTAMP: self._last_timestamp,
+            ATTR_DIGEST: self._last_digest if feed_data else None,
+            ATTR_FEED_DATA: feed_data._source if feed_data else None,  # noqa: SLF001
+        }
+
+    def restore(self, snapshot: dict) -> list[T_FEED_ENTRY] | None:
+        """Restore the state of this feed from a snapshot.
+
+        Entries are created again from the parsed data, and returned, if the
+        snapshot contains any. Validators are only restored together with the
+        data, because an unmodified response could not be processed without.
+        """
+        self._last_timestamp = snapshot[ATTR_LAST_TIMESTAMP]
+        if snapshot[ATTR_FEED_DATA]:
+            self._etag = snapshot[ATTR_ETAG]
+            self._last_modified = snapshot[ATTR_LAST_MODIFIED]
+            self.feed_data = Feed(snapshot[ATTR_FEED_DATA])
+            self._last_digest = snapshot[ATTR_DIGEST]
+            return self._restore_entries(self.feed_data)
+        self._etag = None
+        self._last_modified = None
+        return None
+
+    def _restore_entries(self, feed_data: Feed) -> list[T_FEED_ENTRY]:
+        """Create the entries of the last update from restored feed data."""
+        self._last_entries = self._create_entries(feed_data)
+        return self._last_entries
+
+    def _has_last_entries(self) -> bool:
+        """Check if the entries of the last successful update are known."""
+        return self._last_entries is not None
 
     async def _fetch(
         self, method: str = "GET", headers=None, params=None
     ) -> tuple[str, Feed | None]:
         """Fetch GeoRSS data from external source."""
-        try:
-            timeout = aiohttp.ClientTimeout(total=self._client_session_timeout())
-            async with self._websession.request(
-                method, self._url, headers=headers, params=params, timeout=timeout
-            ) as response:
-                try:
-                    response.raise_for_status()
-                    text = await self._read_response(response)
-                    parser = XmlParser(self._additional_namespaces())
-                    feed_data = parser.parse(text)
-                    self.parser = parser
-                    self.feed_data = feed_data
-                    return UPDATE_OK, feed_data
-                except client_exceptions.ClientError as client_error:
+        headers = {
+            **self._content_negotiation_headers(),
+            **self._conditional_request_headers(),
+            **(headers or {}),
+        }
+        fetcher = self._fetcher()
+        if fetcher is None:
+            return await self._request(self._websession, method, headers, params)
+
+        async def _shared_request() -> tuple[GeoRssFeed, tuple[str, Feed | None]]:
+            websession = fetcher.session(self._url)
+            return self, await self._request(websession, method, headers, params)
+
+        feed, (status, feed_data) = await fetcher.coalesce(
+            self._request_key(method, headers, params), _shared_request
+        )
+        if feed is self:
+            return status, feed_data
+        return self._adopt_response(feed, status, feed_data)
+
+    def _request_key(self, method: str, headers: dict, params) -> tuple:
+        """Return the key of the request and parser settings.
+
+        Feeds sending the same request and parsing the response the same way
+        share the response.
+        """
+        return (
+            method,
+            self._url,
+            frozenset(headers.items()),
+            repr(params),
+            frozenset((self._additional_namespaces() or {}).items()),
+            self._parser_backend(),
+            self._lazy_conversion(),
+            self._streaming_response(),
+            self._detect_unchanged_response(),
+            self._max_response_size(),
+            self._max_items(),
+            self._max_polygon_vertices(),
+        )
+
+    def _adopt_response(
+        self, feed: GeoRssFeed, status: str, feed_data: Feed | None
+    ) -> tuple[str, Feed | None]:
+        """Take over the response another feed fetched and processed."""
+        if status not in (UPDATE_OK, UPDATE_OK_UNCHANGED):
+            return status, feed_data
+        self._etag = feed.etag
+        self._last_modified = feed.last_modified
+        self.parser = feed.parser
+        digest: bytes | None = feed._last_digest
+        if (
+            digest is not None
+            and self._has_last_entries()
+            and digest == self._last_digest
+        ):
+            return UPDATE_OK_UNCHANGED, self.feed_data
+        # A response unchanged for the other feed may still be new to this one.
+        self.feed_data = feed_data
+        self._last_digest = digest
+        self._last_entries = None
+        return UPDATE_OK, feed_data
+
+    async def _request(
+        self, websession: ClientSession, method: str, headers: dict, params
+    ) -> tuple[str, Feed | None]:
+        """Request GeoRSS data, retrying and suspending requests as configured."""
+        retry_policy: RetryPolicy | None = self._retry_policy()
+        circuit_breaker: CircuitBreaker | None = self._circuit_breaker()
+        attempt: int = 1
+        while True:
+            if circuit_breaker is not None and not circuit_breaker.allow(self._url):
+                _LOGGER.warning(
+                    "Requesting data from %s suspended after repeated failures",
+                    self._url,
+                )
+                return UPDATE_ERROR, None
+            try:
+                result = await self._send_request(websession, method, headers, params)
+            except (client_exceptions.ClientError, asyncio.TimeoutError) as error:
+                delay: float | None = (
+                    retry_policy.delay(attempt, error) if retry_policy else None
+                )
+                if delay is None:
+                    # Count one failure per update, not per attempt.
+                    if circuit_breaker is not None:
+                        if is_transient_error(error):
+                            circuit_breaker.record_failure(self._url)
+                        else:
+                            circuit_breaker.record_success(self._url)
                     _LOGGER.warning(
-                        "Fetching data from %s failed with %s", self._url, client_error
+                        "Requesting data from %s failed with %s",
+                        self._url,
+                        str(error) or type(error).__name__,
                     )
                     return UPDATE_ERROR, None
-                except ExpatError as expat_error:
-                    _LOGGER.warning(
-                        "Parsing data from %s failed with %s", self._url, expat_error
-                    )
-                    return UPDATE_OK_NO_DATA, None
-        except client_exceptions.ClientError as client_error:
-            _LOGGER.warning(
-                "Requesting data from %s failed with client error: %s",
+                _LOGGER.debug(
+                    "Retrying request to %s in %.1f seconds after %s",
+                    self._url,
+                    delay,
+                    str(error) or type(error).__name__,
+                )
+                await retry_policy.sleep(delay)
+                attempt += 1
+            else:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success(self._url)
+                return result
+
+    async def _send_request(
+        self, websession: ClientSession, method: str, headers: dict, params
+    ) -> tuple[str, Feed | None]:
+        """Send the request once and process the response.
+
+        Errors of the request are raised, errors parsing the response are
+        reported with their status.
+        """
+        timeout = aiohttp.ClientTimeout(total=self._client_session_timeout())
+        request_start = time.perf_counter()
+        async with websession.request(
+            method, self._url, headers=headers, params=params, timeout=timeout
+        ) as response:
+            if self._metrics is not None:
+                self._metrics.add_duration(
+                    METRIC_STAGE_REQUEST, time.perf_counter() - request_start
+                )
+            response.raise_for_status()
+            try:
+                return await self._process_response(response)
+            except (ExpatError, ValueError) as parse_error:
+                # Expat raises ValueError for encodings it does not support.
+                _LOGGER.warning(
+                    "Parsing data from %s failed with %s", self._url, parse_error
+                )
+                return UPDATE_OK_NO_DATA, None
+            except GeoRssLimitExceeded as limit_error:
+                _LOGGER.warning(
+                    "Processing data from %s aborted: %s", self._url, limit_error
+                )
+                return UPDATE_ERROR_LIMIT_EXCEEDED, None
+
+    def _is_unchanged_response(self, hasher) -> bool:
+        """Check if the response is identical to the last processed response."""
+        return (
+            hasher is not None
+            and self._has_last_entries()
+            and hasher.digest() == self._last_digest
+        )
+
+    def _check_response_size(self, size: int):
+        """Reject a response larger than the maximum response size."""
+        max_size: int | None = self._max_response_size()
+        if max_size is not None and size > max_size:
+            raise GeoRssLimitExceeded(
+                f"Response exceeds the maximum size of {max_size} bytes"
+            )
+
+    def _content_negotiation_headers(self) -> dict[str, str]:
+        """Return headers negotiating the content encoding of the response."""
+        accept_encoding: str | None = self._accept_encoding()
+        if accept_encoding:
+            return {hdrs.ACCEPT_ENCODING: accept_encoding}
+        return {}
+
+    def _count_wire_bytes(self, response: ClientResponse):
+        """Count the bytes transferred for the response, if known.
+
+        Compressed responses are transferred with their compressed length,
+        unless sent in chunks without a content length.
+        """
+        if self._metrics is None:
+            return
+        encoding: str = response.headers.get(
+            hdrs.CONTENT_ENCODING, CONTENT_ENCODING_IDENTITY
+        ).lower()
+        if encoding == CONTENT_ENCODING_IDENTITY:
+            wire_bytes = self._metrics.counts.get(METRIC_COUNT_BYTES, 0)
+        else:
+            wire_bytes = response.content_length
+        if wire_bytes is not None:
+            _LOGGER.debug(
+                "Received %s bytes (%s) from %s, %s bytes decompressed",
+                wire_bytes,
+                encoding,
                 self._url,
-                client_error,
+                self._metrics.counts.get(METRIC_COUNT_BYTES, 0),
             )
-            return UPDATE_ERROR, None
-        except asyncio.TimeoutError:
-            _LOGGER.warning(
-                "Requesting data from %s failed with timeout error", self._url
+            self._metrics.add_count(METRIC_COUNT_WIRE_BYTES, wire_bytes)
+
+    def _conditional_request_headers(self) -> dict[str, str]:
+        """Return headers for a conditional request based on the last response."""
+        headers: dict[str, str] = {}
+        if self._etag:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        if self._last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+        return headers
+
+    def _store_validators(self, response: ClientResponse):
+        """Remember the validators of a successful response."""
+        self._etag = response.headers.get(hdrs.ETAG)
+        self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+
+    async def _read_response(self, response: ClientResponse) -> bytes:
+        """Read the whole response body, within the maximum response size."""
+        if self._max_response_size() is None:
+            return await response.read()
+        chunks: list[bytes] = []
+        size: int = 0
+        async for chunk in response.content.iter_chunked(DEFAULT_RESPONSE_CHUNK_SIZE):
+            size += len(chunk)
+            self._check_response_size(size)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _prepare_document(
+        response: ClientResponse, body: bytes
+    ) -> tuple[bytes | str, str | None]:
+        """Return the document to parse and the encoding to parse it with.
+
+        The body is passed to the parser as is, unless expat does not support
+        its encoding.
+        """
+        encoding, decode_encoding = detect_encoding(body, response.charset)
+        _LOGGER.debug(
+            "Response charset %s, parsing as %s",
+            response.charset,
+            decode_encoding or encoding or "detected by parser",
+        )
+        if decode_encoding:
+            return body.decode(decode_encoding), encoding
+        return body, encoding
+
+    async def _process_response(
+        self, response: ClientResponse
+    ) -> tuple[str, Feed | None]:
+        """Process the response and parse its GeoRSS data."""
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            _LOGGER.debug("Data from %s not modified", self._url)
+            return UPDATE_OK_NO_DATA, None
+        parser = XmlParser(
+            self._additional_namespaces(),
+            backend=self._parser_backend(),
+            lazy_conversion=self._lazy_conversion(),
+            max_items=self._max_items(),
+            max_polygon_vertices=self._max_polygon_vertices(),
+        )
+        streaming: bool = self._streaming_response()
+        hasher = (
+            hashlib.blake2b(digest_size=16)
+            if self._detect_unchanged_response()
+            else None
+        )
+        if streaming:
+            # The response is parsed before its digest is known.
+            with measure_stage(self._metrics, METRIC_STAGE_DOWNLOAD):
+                feed_data = await self._parse_response_stream(response, parser, hasher)
+        else:
+            # Reject responses announced as too large before downloading them.
+            encoding: str = response.headers.get(
+                hdrs.CONTENT_ENCODING, CONTENT_ENCODING_IDENTITY
             )
-            return UPDATE_ERROR, None
-
-    async def _read_response(self, response):
-        """Pre-process the response."""
-        if response:
-            raw_response = await response.read()
-            _LOGGER.debug("Response encoding %s", response.get_encoding())
-            if raw_response.startswith(codecs.BOM_UTF8):
-                return await response.text("utf-8-sig")
-            return await response.text()
-        return None
+            if encoding.lower() == CONTENT_ENCODING_IDENTITY:
+                self._check_response_size(response.content_length or 0)
+            with measure_stage(self._metrics, METRIC_STAGE_DOWNLOAD):
+                body: bytes = await self._read_response(response)
+            if self._metrics is not None:
+                self._metrics.add_count(METRIC_COUNT_BYTES, len(body))
+            if hasher:
+                hasher.update(body)
+        self._count_wire_bytes(response)
+        if self._is_unchanged_response(hasher):
+            _LOGGER.debug("Data from %s unchanged", self._url)
+            self._store_validators(response)
+            return UPDATE_OK_UNCHANGED, self.feed_data
+        if not streaming:
+            with measure_stage(self._metrics, METRIC_STAGE_DECODE):
+                document, encoding = self._prepare_document(response, body)
+            with measure_stage(self._metrics, METRIC_STAGE_PARSE):
+                feed_data = XmlParser.create_feed(
+                    await self._run_in_executor(
+                        parser.parse_to_dict, document, encoding
+                    )
+                )
+        self.parser = parser
+        self.feed_data = feed_data
+        self._store_validators(response)
+        self._last_digest = hasher.digest() if hasher else None
+        self._last_entries = None
+        return UPDATE_OK, feed_data
+
+    async def _parse_response_stream(
+        self, response: ClientResponse, parser: XmlParser, hasher=None
+    ) -> Feed | None:
+        """Parse the response chunk by chunk while it is being downloaded."""
+        streaming_parser: StreamingXmlParser | None = None
+        decoder: codecs.IncrementalDecoder | None = None
+        head: bytes = b""
+        size: int = 0
+        async for chunk in response.content.iter_chunked(DEFAULT_RESPONSE_CHUNK_SIZE):
+            size += len(chunk)
+            self._check_response_size(size)
+            if hasher:
+                hasher.update(chunk)
+            if self._metrics is not None:
+                self._metrics.add_count(METRIC_COUNT_BYTES, len(chunk))
+            if streaming_parser is None:
+                # Collect enough data to detect the encoding first.
+                head += chunk
+                if not is_complete_head(head):
+                    continue
+                streaming_parser, decoder = self._create_streaming_parser(
+                    response, parser, head
+                )
+                data = head
+            else:
+                data = chunk
+            streaming_parser.feed(decoder.decode(data) if decoder else data)
+        if streaming_parser is None:
+            if not head:
+                # Empty response.
+                return None
+            streaming_parser, decoder = self._create_streaming_parser(
+                response, parser, head
+            )
+            streaming_parser.feed(decoder.decode(head) if decoder else head)
+        if decoder:
+            streaming_parser.feed(decoder.decode(b"", True))
+        return XmlParser.create_feed(streaming_parser.close())
+
+    @staticmethod
+    def _create_streaming_parser(
+        response: ClientResponse, parser: XmlParser, head: bytes
+    ) -> tuple[StreamingXmlParser, codecs.IncrementalDecoder | None]:
+        """Create streaming parser and decoder matching the response encoding."""
+        encoding, decode_encoding = detect_encoding(head, response.charset)
+        _LOGGER.debug(
+            "Response charset %s, parsing as %s",
+            response.charset,
+            decode_encoding or encoding or "detected by parser",
+        )
+        if decode_encoding:
+            # Encodings not supported by expat are decoded on the fly.
+            return (
+                parser.streaming_parser(encoding=encoding),
+                codecs.getincrementaldecoder(decode_encoding)(),
+            )
+        return parser.streaming_parser(encoding=encoding), None
 
     def _filter_entries(self, entries: list[T_FEED_ENTRY]):
         """Filter the provided entries."""
-        filtered_entries = entries
-        _LOGGER.debug("Entries before filtering %s", filtered_entries)
+        _LOGGER.debug("Entries before filtering %s", entries)
+        filtered_entries = self._select_entries(
+            self._candidate_entries(
+                entries, self._home_coordinates, self._filter_radius
+            ),
+            self._filter_radius,
+            self._filter_categories,
+        )
+        _LOGGER.debug("Entries after filtering %s", filtered_entries)
+        return filtered_entries
+
+    @staticmethod
+    def _candidate_entries(
+        entries: list[T_FEED_ENTRY],
+        home_coordinates: tuple[float, float],
+        filter_radius: float | None,
+    ) -> list[T_FEED_ENTRY]:
+        """Remove entries that can't be within the radius of home."""
         # Always remove entries without geometry
         filtered_entries = list(
             filter(
                 lambda entry: entry.geometries is not None
                 and len(entry.geometries) >= 1,
-                filtered_entries,
+                entries,
             )
         )
+        if filter_radius:
+            # Quickly reject entries that can't be within the radius, so that
+            # only the exact distance of the remaining entries is calculated.
+            envelope: BoundingBox = GeoRssDistanceHelper.envelope_around(
+                home_coordinates, filter_radius
+            )
+            filtered_entries = list(
+                filter(
+                    lambda entry: entry.intersects_envelope(envelope),
+                    filtered_entries,
+                )
+            )
+        return filtered_entries
+
+    @staticmethod
+    def _select_entries(
+        entries: list[T_FEED_ENTRY],
+        filter_radius: float | None,
+        filter_categories: list[str] | None,
+    ) -> list[T_FEED_ENTRY]:
+        """Select the candidate entries matching radius and categories."""
+        filtered_entries = entries
         # Filter by distance.
-        if self._filter_radius:
+        if filter_radius:
+            FeedEntry.calculate_distances_to_home(filtered_entries)
             filtered_entries = list(
                 filter(
-                    lambda entry: entry.distance_to_home <= self._filter_radius,
+                    lambda entry: entry.distance_to_home <= filter_radius,
                     filtered_entries,
                 )
             )
         # Filter by category.
-        if self._filter_categories:
+        if filter_categories:
             filtered_entries = list(
                 filter(
-                    lambda entry: len(
-                        {entry.category}.intersection(self._filter_categories)
-                    )
+                    lambda entry: len({entry.category}.intersection(filter_categories))
                     > 0,
                     filtered_entries,
                 )
             )
-        _LOGGER.debug("Entries after filtering %s", filtered_entries)
         return filtered_entries
 
     def _extract_from_feed(self, feed: Feed) -> dict:
@@ -198,7 +797,34 @@ class GeoRssFeed(Generic[T_FEED_ENTRY], ABC):
                 return last_timestamp
         return None
 
+    @property
+    def metrics(self) -> UpdateMetrics | None:
+        """Return the metrics of the last update, if collected."""
+        return self._metrics
+
+    @property
+    def url(self) -> str:
+        """Return the URL of this feed."""
+        return self._url
+
+    @property
+    def ttl(self) -> int | None:
+        """Return the time to live in minutes of the last parsed feed."""
+        ttl = self.feed_data.ttl if self.feed_data else None
+        # Invalid values are not converted.
+        return ttl if isinstance(ttl, int) else None
+
     @property
     def last_timestamp(self) -> datetime | None:
         """Return the last timestamp extracted from this feed."""
         return self._last_timestamp
+
+    @property
+    def etag(self) -> str | None:
+        """Return the entity tag of the last successful response."""
+        return self._etag
+
+    @property
+    def last_modified(self) -> str | None:
+        """Return the last modified date of the last successful response."""
+        return self._last_modified
@@ -16,14 +16,29 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_FEATURES = [Point, Polygon, BoundingBox]
 
+# Marker for values that have not been computed yet.
+_NOT_COMPUTED = object()
+
 
 class FeedEntry(ABC):
     """Feed entry base class."""
 
+    __slots__ = (
+        "_coordinates",
+        "_distance_to_home",
+        "_geometries",
+        "_home_coordinates",
+        "_rss_entry",
+    )
+
     def __init__(self, home_coordinates: tuple[float, float], rss_entry: FeedItem):
         """Initialise this feed entry."""
         self._home_coordinates: tuple[float, float] = home_coordinates
         self._rss_entry: FeedItem = rss_entry
+        # Derived values are computed on first access.
+        self._geometries = _NOT_COMPUTED
+        self._coordinates = _NOT_COMPUTED
+        self._distance_to_home = _NOT_COMPUTED
 
     def __repr__(self):
         """Return string representation of this entry."""
@@ -37,24 +52,40 @@ class FeedEntry(ABC):
     @property
     def geometries(self) -> list[Geometry] | None:
         """Return all geometries of this entry."""
+        if self._geometries is _NOT_COMPUTED:
+            self._geometries = self._create_geometries()
+        return self._geometries
+
+    def _create_geometries(self) -> list[Geometry] | None:
+        """Create all geometries of this entry."""
         if self._rss_entry:
             # Return all geometries that are of type defined in features.
-            return list(
-                filter(lambda x: type(x) in self.features, self._rss_entry.geometries)
-            )
+            features = self.features
+            return [
+                geometry
+                for geometry in self._rss_entry.geometries
+                if type(geometry) in features
+            ]
         return None
 
     @property
     def coordinates(self) -> tuple[float, float] | None:
         """Return the best coordinates (latitude, longitude) of this entry."""
+        if self._coordinates is _NOT_COMPUTED:
+            self._coordinates = self._create_coordinates()
+        return self._coordinates
+
+    def _create_coordinates(self) -> tuple[float, float] | None:
+        """Find the best coordinates (latitude, longitude) of this entry."""
         # This looks for the first point in the list of geometries. If there
         # is no point then return the first entry.
-        if self.geometries and len(self.geometries) >= 1:
-            for entry in self.geometries:
+        geometries = self.geometries
+        if geometries and len(geometries) >= 1:
+            for entry in geometries:
                 if isinstance(entry, Point):
                     return GeoRssDistanceHelper.extract_coordinates(entry)
             # No point found.
-            return GeoRssDistanceHelper.extract_coordinates(self.geometries[0])
+            return GeoRssDistanceHelper.extract_coordinates(geometries[0])
         return None
 
     @property
@@ -70,6 +101,13 @@ class FeedEntry(ABC):
             return external_id
         return None
 
+    @property
+    def fingerprint(self) -> str | None:
+        """Return a fingerprint of this entry's data, to detect changes."""
+        if self._rss_entry:
+            return self._rss_entry.fingerprint
+        return None
+
     def _search_in_external_id(self, regexp) -> str | None:
         """Find a sub-string in the entry's external id."""
         if self.external_id:
@@ -114,11 +152,18 @@ class FeedEntry(ABC):
     @property
     def distance_to_home(self) -> float:
         """Return the distance in km of this entry to the home coordinates."""
+        if self._distance_to_home is _NOT_COMPUTED:
+            self._distance_to_home = self._calculate_distance_to_home()
+        return self._distance_to_home
+
+    def _calculate_distance_to_home(self) -> float:
+        """Calculate the distance in km of this entry to the home coordinates."""
         # This goes through all geometries and reports back the closest
         # distance to any of them.
         distance: float = float("inf")
-        if self.geometries and len(self.geometries) >= 1:
-            for geometry in self.geometries:
+        geometries = self.geometries
+        if geometries and len(geometries) >= 1:
+            for geometry in geometries:
                 distance = min(
                     distance,
                     GeoRssDistanceHelper.distance_to_geometry(
@@ -127,6 +172,39 @@ class FeedEntry(ABC):
                 )
         return distance
 
+    def intersects_envelope(self, envelope: BoundingBox) -> bool:
+        """Check if any geometry of this entry may lie within the envelope."""
+        for geometry in self.geometries or []:
+            geometry_envelope: BoundingBox | None = geometry.envelope
+            if geometry_envelope is None or geometry_envelope.intersects(envelope):
+                return True
+        return False
+
+    @staticmethod
+    def calculate_distances_to_home(entries: list[FeedEntry]):
+        """Calculate the distance to home of all provided entries in a batch."""
+        # Collect the geometries of all entries sharing the same home.
+        pending: dict[tuple[float, float], list[FeedEntry]] = {}
+        for entry in entries:
+            if entry._distance_to_home is _NOT_COMPUTED:  # noqa: SLF001
+                pending.setdefault(entry._home_coordinates, []).append(entry)  # noqa: SLF001
+        for home_coordinates, home_entries in pending.items():
+            geometries: list[Geometry] = [
+                geometry
+                for entry in home_entries
+                for geometry in entry.geometries or []
+            ]
+            distances = iter(
+                GeoRssDistanceHelper.distances_to_geometries(
+                    home_coordinates, geometries
+                )
+            )
+            for entry in home_entries:
+                entry._distance_to_home = min(  # noqa: SLF001
+                    (next(distances) for _ in entry.geometries or []),
+                    default=float("inf"),
+                )
+
     @property
     def description(self) -> str | None:
         """Return the description of this entry."""
@@ -0,0 +1,102 @@
+"""Fetcher sharing connections and concurrent requests across feeds."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+from typing import Self, TypeVar
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .consts import (
+    DEFAULT_FETCHER_DNS_CACHE_TTL,
+    DEFAULT_FETCHER_KEEPALIVE_TIMEOUT,
+    DEFAULT_FETCHER_LIMIT_PER_HOST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+T_RESULT = TypeVar("T_RESULT")
+
+
+class FeedFetcher:
+    """Share connections and concurrent requests across feeds.
+
+    Each host gets its own client session, whose connector keeps connections
+    alive and caches DNS lookups. Concurrent requests with the same key are
+    coalesced: only the first one is sent, and all callers receive its
+    result.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int = DEFAULT_FETCHER_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_FETCHER_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int = DEFAULT_FETCHER_DNS_CACHE_TTL,
+    ):
+        """Initialise feed fetcher."""
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def __repr__(self):
+        """Return string representation of this fetcher."""
+        return f"<{self.__class__.__name__}(hosts={len(self._sessions)}, in_flight={len(self._in_flight)})>"
+
+    async def __aenter__(self) -> Self:
+        """Enter the context of this fetcher."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the sessions when leaving the context of this fetcher."""
+        await self.close()
+
+    def session(self, url: str) -> aiohttp.ClientSession:
+        """Return the client session for the host of the URL."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    ttl_dns_cache=self._ttl_dns_cache,
+                )
+            )
+            self._sessions[origin] = session
+        return session
+
+    async def coalesce(
+        self, key: Hashable, request: Callable[[], Awaitable[T_RESULT]]
+    ) -> T_RESULT:
+        """Return the result of the request, sharing it with concurrent callers.
+
+        The request only runs if no request with the same key is in progress.
+        Cancelling one caller does not cancel the request for the others.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            _LOGGER.debug("Sharing request in progress for %s", key)
+        return await asyncio.shield(future)
+
+    async def close(self):
+        """Close the client sessions of all hosts."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+    @property
+    def hosts(self) -> list[str]:
+        """Return the hosts with a client session, as scheme and network location."""
+        return list(self._sessions)
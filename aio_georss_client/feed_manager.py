@@ -2,17 +2,53 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 import logging
+import os
+from pathlib import Path
+import pickle
 
-from .consts import UPDATE_OK, UPDATE_OK_NO_DATA
-from .feed import GeoRssFeed
+from .consts import (
+    ATTR_FEED,
+    ATTR_FINGERPRINTS,
+    ATTR_LAST_UPDATE,
+    ATTR_LAST_UPDATE_SUCCESSFUL,
+    ATTR_MANAGED_EXTERNAL_IDS,
+    ATTR_URL,
+    ATTR_VERSION,
+    METRIC_STAGE_GENERATE_CALLBACKS,
+    METRIC_STAGE_REMOVE_CALLBACKS,
+    METRIC_STAGE_STORE,
+    METRIC_STAGE_UPDATE_CALLBACKS,
+    SNAPSHOT_VERSION,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from .exceptions import GeoRssException
+from .feed import FEED_SNAPSHOT_KEYS, GeoRssFeed
 from .feed_entry import FeedEntry
+from .spatial_index import SpatialIndex
 from .status_update import StatusUpdate
+from .update_metrics import UpdateMetrics, measure_stage
+from .xml_parser.geometry import BoundingBox
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys of feed manager snapshots.
+SNAPSHOT_KEYS = frozenset(
+    [
+        ATTR_VERSION,
+        ATTR_MANAGED_EXTERNAL_IDS,
+        ATTR_FINGERPRINTS,
+        ATTR_LAST_UPDATE,
+        ATTR_LAST_UPDATE_SUCCESSFUL,
+        ATTR_FEED,
+    ]
+)
+
 
 class FeedManagerBase:
     """Generic Feed manager."""
@@ -20,29 +56,84 @@ class FeedManagerBase:
     def __init__(
         self,
         feed: GeoRssFeed,
-        generate_async_callback: Callable[[str], Awaitable[None]],
-        update_async_callback: Callable[[str], Awaitable[None]],
-        remove_async_callback: Callable[[str], Awaitable[None]],
+        generate_async_callback: Callable[[str], Awaitable[None]] | None,
+        update_async_callback: Callable[[str], Awaitable[None]] | None,
+        remove_async_callback: Callable[[str], Awaitable[None]] | None,
         status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        *,
+        spatial_index: SpatialIndex | None = None,
+        metrics_async_callback: Callable[[UpdateMetrics], Awaitable[None]]
+        | None = None,
+        max_concurrent_callbacks: int | None = None,
+        generate_batch_async_callback: Callable[[dict[str, FeedEntry]], Awaitable[None]]
+        | None = None,
+        update_batch_async_callback: Callable[[dict[str, FeedEntry]], Awaitable[None]]
+        | None = None,
+        remove_batch_async_callback: Callable[
+            [dict[str, FeedEntry | None]], Awaitable[None]
+        ]
+        | None = None,
+        detect_changes: bool = False,
     ):
-        """Initialise feed manager."""
+        """Initialise feed manager.
+
+        By default the generate, update and remove callbacks are awaited one
+        after another, and an exception raised by a callback ends the update.
+        With `max_concurrent_callbacks`, up to that many callbacks run at the
+        same time, and the exceptions they raise are reported in the status
+        update instead.
+
+        A batch callback replaces the corresponding callback per external id.
+        It is awaited once per update with all created, updated or removed
+        entries by external id, and only if there are any. Removed entries
+        are the ones from the previous update, or None if unknown because the
+        previous update was restored from a snapshot without entries.
+
+        With `detect_changes`, entries found again are only updated if their
+        fingerprint differs from the one of the last update reported to the
+        callbacks. The others are counted as unchanged.
+        """
+        if max_concurrent_callbacks is not None and max_concurrent_callbacks < 1:
+            raise GeoRssException(
+                f"Invalid maximum of concurrent callbacks: {max_concurrent_callbacks}"
+            )
         self._feed: GeoRssFeed = feed
         self.feed_entries: dict = {}
+        self._spatial_index: SpatialIndex | None = spatial_index
         self._managed_external_ids: set = set()
         self._last_update: datetime | None = None
         self._last_update_successful: datetime | None = None
-        self._generate_async_callback: Callable[[str], Awaitable[None]] = (
+        self._last_status: str | None = None
+        self._previous_feed_entries: dict = {}
+        self._generate_async_callback: Callable[[str], Awaitable[None]] | None = (
             generate_async_callback
         )
-        self._update_async_callback: Callable[[str], Awaitable[None]] = (
+        self._update_async_callback: Callable[[str], Awaitable[None]] | None = (
             update_async_callback
         )
-        self._remove_async_callback: Callable[[str], Awaitable[None]] = (
+        self._remove_async_callback: Callable[[str], Awaitable[None]] | None = (
             remove_async_callback
         )
+        self._generate_batch_async_callback: (
+            Callable[[dict[str, FeedEntry]], Awaitable[None]] | None
+        ) = generate_batch_async_callback
+        self._update_batch_async_callback: (
+            Callable[[dict[str, FeedEntry]], Awaitable[None]] | None
+        ) = update_batch_async_callback
+        self._remove_batch_async_callback: (
+            Callable[[dict[str, FeedEntry | None]], Awaitable[None]] | None
+        ) = remove_batch_async_callback
         self._status_async_callback: Callable[[StatusUpdate], Awaitable[None]] = (
             status_async_callback
         )
+        self._metrics_async_callback: (
+            Callable[[UpdateMetrics], Awaitable[None]] | None
+        ) = metrics_async_callback
+        self._max_concurrent_callbacks: int | None = max_concurrent_callbacks
+        self._callback_errors: dict[str, Exception] = {}
+        self._detect_changes: bool = detect_changes
+        self._fingerprints: dict[str, str | None] = {}
+        self._feed_fingerprints: dict[str, str | None] = {}
 
     def __repr__(self):
         """Return string representation of this feed."""
@@ -53,9 +144,14 @@ class FeedManagerBase:
         status, feed_entries = await self._feed.update()
         # Record current time of update.
         self._last_update = datetime.now()
+        self._last_status = status
+        self._callback_errors = {}
         count_created: int = 0
         count_updated: int = 0
         count_removed: int = 0
+        count_unchanged: int = 0
+        # Keep the entries of the previous update to report removed entries.
+        self._previous_feed_entries = self.feed_entries
         await self._store_feed_entries(status, feed_entries)
         if status == UPDATE_OK:
             _LOGGER.debug("Data retrieved %s", feed_entries)
@@ -63,9 +159,22 @@ class FeedManagerBase:
             self._last_update_successful = self._last_update
             # For entity management the external ids from the feed are used.
             feed_external_ids = {entry.external_id for entry in feed_entries}
+            if self._detect_changes:
+                # Fingerprint entries before callbacks read and convert values.
+                self._feed_fingerprints = {
+                    external_id: entry.fingerprint
+                    for external_id, entry in self.feed_entries.items()
+                }
             count_removed = await self._update_feed_remove_entries(feed_external_ids)
-            count_updated = await self._update_feed_update_entries(feed_external_ids)
+            (
+                count_updated,
+                count_unchanged,
+            ) = await self._update_feed_update_entries(feed_external_ids)
             count_created = await self._update_feed_create_entries(feed_external_ids)
+        elif status == UPDATE_OK_UNCHANGED:
+            _LOGGER.debug("Update successful, but data unchanged from %s", self._feed)
+            # Record current time of update.
+            self._last_update_successful = self._last_update
         elif status == UPDATE_OK_NO_DATA:
             _LOGGER.debug("Update successful, but no data received from %s", self._feed)
             # Record current time of update.
@@ -76,18 +185,32 @@ class FeedManagerBase:
             )
             # Remove all entities.
             count_removed = await self._update_feed_remove_entries(set())
+        self._previous_feed_entries = {}
+        if self._detect_changes:
+            self._store_fingerprints()
         # Send status update to subscriber.
-        await self._status_update(status, count_created, count_updated, count_removed)
+        await self._status_update(
+            status,
+            count_created,
+            count_updated,
+            count_removed,
+            count_unchanged=count_unchanged,
+        )
 
     async def _store_feed_entries(
         self, status: str, feed_entries: list[FeedEntry] | None
     ):
         """Keep a copy of all feed entries for future lookups."""
-        if feed_entries or status == UPDATE_OK_NO_DATA:
-            if status == UPDATE_OK:
-                self.feed_entries = {entry.external_id: entry for entry in feed_entries}
-        else:
-            self.feed_entries.clear()
+        with measure_stage(self._feed.metrics, METRIC_STAGE_STORE):
+            if feed_entries or status == UPDATE_OK_NO_DATA:
+                if status in (UPDATE_OK, UPDATE_OK_UNCHANGED):
+                    self.feed_entries = {
+                        entry.external_id: entry for entry in feed_entries
+                    }
+            else:
+                self.feed_entries = {}
+            if self._spatial_index is not None:
+                self._spatial_index.update(self.feed_entries)
 
     async def _update_feed_create_entries(self, feed_external_ids: set[str]) -> int:
         """Create entities after feed update."""
@@ -98,14 +221,38 @@ class FeedManagerBase:
         await self._generate_new_entities(create_external_ids)
         return count_created
 
-    async def _update_feed_update_entries(self, feed_external_ids: set[str]) -> int:
-        """Update entities after feed update."""
+    async def _update_feed_update_entries(
+        self, feed_external_ids: set[str]
+    ) -> tuple[int, int]:
+        """Update entities after feed update, and count unchanged entities."""
         update_external_ids: set[str] = self._managed_external_ids.intersection(
             feed_external_ids
         )
+        count_unchanged = 0
+        if self._detect_changes:
+            changed_external_ids = {
+                external_id
+                for external_id in update_external_ids
+                if self._fingerprints.get(external_id)
+                != self._feed_fingerprints.get(external_id)
+            }
+            count_unchanged = len(update_external_ids) - len(changed_external_ids)
+            update_external_ids = changed_external_ids
         count_updated = len(update_external_ids)
         await self._update_entities(update_external_ids)
-        return count_updated
+        return count_updated, count_unchanged
+
+    def _store_fingerprints(self):
+        """Keep the fingerprints of managed entities as reported to callbacks."""
+        fingerprints: dict[str, str | None] = {}
+        for external_id in self._managed_external_ids:
+            fingerprint = self._fingerprints.get(external_id)
+            # Entities whose callback failed are updated again next time.
+            if external_id not in self._callback_errors:
+                fingerprint = self._feed_fingerprints.get(external_id, fingerprint)
+            fingerprints[external_id] = fingerprint
+        self._fingerprints = fingerprints
+        self._feed_fingerprints = {}
 
     async def _update_feed_remove_entries(self, feed_external_ids: set[str]) -> int:
         """Remove entities after feed update."""
@@ -118,26 +265,105 @@ class FeedManagerBase:
 
     async def _generate_new_entities(self, external_ids: set[str]):
         """Generate new entities for events."""
-        for external_id in external_ids:
+
+        async def _generate(external_id: str):
             await self._generate_async_callback(external_id)
             _LOGGER.debug("New entity added %s", external_id)
             self._managed_external_ids.add(external_id)
 
+        with measure_stage(self._feed.metrics, METRIC_STAGE_GENERATE_CALLBACKS):
+            if self._generate_batch_async_callback:
+                if external_ids:
+                    await self._generate_batch_async_callback(
+                        self._entries(self.feed_entries, external_ids)
+                    )
+                    _LOGGER.debug("New entities added %s", external_ids)
+                    self._managed_external_ids.update(external_ids)
+            else:
+                await self._dispatch_callbacks(_generate, external_ids)
+
     async def _update_entities(self, external_ids: set[str]):
         """Update entities."""
-        for external_id in external_ids:
+
+        async def _update(external_id: str):
             _LOGGER.debug("Existing entity found %s", external_id)
             await self._update_async_callback(external_id)
 
+        with measure_stage(self._feed.metrics, METRIC_STAGE_UPDATE_CALLBACKS):
+            if self._update_batch_async_callback:
+                if external_ids:
+                    _LOGGER.debug("Existing entities found %s", external_ids)
+                    await self._update_batch_async_callback(
+                        self._entries(self.feed_entries, external_ids)
+                    )
+            else:
+                await self._dispatch_callbacks(_update, external_ids)
+
     async def _remove_entities(self, external_ids: set[str]):
         """Remove entities."""
-        for external_id in external_ids:
+
+        async def _remove(external_id: str):
             _LOGGER.debug("Entity not current anymore %s", external_id)
             self._managed_external_ids.remove(external_id)
             await self._remove_async_callback(external_id)
 
+        with measure_stage(self._feed.metrics, METRIC_STAGE_REMOVE_CALLBACKS):
+            if self._remove_batch_async_callback:
+                if external_ids:
+                    _LOGGER.debug("Entities not current anymore %s", external_ids)
+                    self._managed_external_ids.difference_update(external_ids)
+                    await self._remove_batch_async_callback(
+                        self._entries(self._previous_feed_entries, external_ids)
+                    )
+            else:
+                await self._dispatch_callbacks(_remove, external_ids)
+
+    @staticmethod
+    def _entries(
+        feed_entries: dict[str, FeedEntry], external_ids: set[str]
+    ) -> dict[str, FeedEntry | None]:
+        """Return the feed entries with the external ids, None if unknown."""
+        return {
+            external_id: feed_entries.get(external_id) for external_id in external_ids
+        }
+
+    async def _dispatch_callbacks(
+        self,
+        callback: Callable[[str], Awaitable[None]],
+        external_ids: Iterable[str],
+    ):
+        """Call the callback for each external id.
+
+        Without a concurrency limit the callbacks run one after another. With
+        a limit, that many workers take the next external id in turn, and the
+        exceptions raised are recorded per external id instead of propagated.
+        """
+        if self._max_concurrent_callbacks is None:
+            for external_id in external_ids:
+                await callback(external_id)
+            return
+        external_ids = list(external_ids)
+        remaining = iter(external_ids)
+
+        async def _worker():
+            for external_id in remaining:
+                try:
+                    await callback(external_id)
+                except Exception as error:
+                    _LOGGER.exception("Callback for entity %s failed", external_id)
+                    self._callback_errors[external_id] = error
+
+        workers = min(self._max_concurrent_callbacks, len(external_ids))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+
     async def _status_update(
-        self, status: str, count_created: int, count_updated: int, count_removed: int
+        self,
+        status: str,
+        count_created: int,
+        count_updated: int,
+        count_removed: int,
+        *,
+        count_unchanged: int = 0,
     ):
         """Provide status update."""
         if self._status_async_callback:
@@ -151,8 +377,110 @@ class FeedManagerBase:
                     count_created,
                     count_updated,
                     count_removed,
+                    metrics=self._feed.metrics,
+                    errors=self._callback_errors,
+                    unchanged=count_unchanged,
                 )
             )
+        if self._metrics_async_callback and self._feed.metrics is not None:
+            await self._metrics_async_callback(self._feed.metrics)
+
+    async def save_snapshot(
+        self, path: str | os.PathLike, *, include_entries: bool = False
+    ):
+        """Save the state of this feed manager to a file.
+
+        The snapshot contains the managed external ids, their fingerprints,
+        the update timestamps and the validators of the last response. With
+        `include_entries`, it also contains the parsed data of the last
+        response, so that the feed entries are available right after loading
+        the snapshot.
+        """
+        snapshot = {
+            ATTR_VERSION: SNAPSHOT_VERSION,
+            ATTR_MANAGED_EXTERNAL_IDS: list(self._managed_external_ids),
+            ATTR_FINGERPRINTS: self._fingerprints,
+            ATTR_LAST_UPDATE: self._last_update,
+            ATTR_LAST_UPDATE_SUCCESSFUL: self._last_update_successful,
+            ATTR_FEED: self._feed.snapshot(include_feed_data=include_entries),
+        }
+        data: bytes = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        await asyncio.to_thread(_write_file, Path(path), data)
+
+    async def load_snapshot(self, path: str | os.PathLike) -> bool:
+        """Restore the state of this feed manager from a file, before updating.
+
+        Return whether a snapshot of this feed was restored. Only load
+        snapshots saved by this application, because unpickling untrusted
+        data is not secure.
+        """
+        try:
+            data: bytes = await asyncio.to_thread(Path(path).read_bytes)
+            snapshot = pickle.loads(data)
+        except FileNotFoundError:
+            _LOGGER.debug("No snapshot found at %s", path)
+            return False
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            # Raised for snapshots referring to classes that changed.
+            AttributeError,
+            ImportError,
+            ValueError,
+        ) as error:
+            _LOGGER.warning("Loading snapshot from %s failed: %s", path, error)
+            return False
+        if not self._is_compatible_snapshot(snapshot):
+            _LOGGER.warning("Ignoring incompatible snapshot at %s", path)
+            return False
+        self._managed_external_ids = set(snapshot[ATTR_MANAGED_EXTERNAL_IDS])
+        self._fingerprints = snapshot[ATTR_FINGERPRINTS]
+        self._last_update = snapshot[ATTR_LAST_UPDATE]
+        self._last_update_successful = snapshot[ATTR_LAST_UPDATE_SUCCESSFUL]
+        feed_entries = self._feed.restore(snapshot[ATTR_FEED])
+        if feed_entries is not None:
+            self.feed_entries = {entry.external_id: entry for entry in feed_entries}
+            if self._spatial_index is not None:
+                self._spatial_index.update(self.feed_entries)
+        return True
+
+    def _is_compatible_snapshot(self, snapshot) -> bool:
+        """Check if the snapshot is complete and was saved for this feed."""
+        return (
+            isinstance(snapshot, dict)
+            and snapshot.get(ATTR_VERSION) == SNAPSHOT_VERSION
+            and snapshot.keys() >= SNAPSHOT_KEYS
+            and isinstance(snapshot[ATTR_FEED], dict)
+            and snapshot[ATTR_FEED].keys() >= FEED_SNAPSHOT_KEYS
+            and snapshot[ATTR_FEED][ATTR_URL] == self._feed.url
+        )
+
+    def entries_within_radius(
+        self, coordinates: tuple[float, float], radius: float
+    ) -> list[FeedEntry]:
+        """Return current entries within radius (km) of the coordinates, nearest first."""
+        if self._spatial_index is not None:
+            return self._spatial_index.entries_within_radius(coordinates, radius)
+        return SpatialIndex.filter_within_radius(
+            self.feed_entries.values(), coordinates, radius
+        )
+
+    def entries_within_bounding_box(self, bbox: BoundingBox) -> list[FeedEntry]:
+        """Return current entries intersecting the bounding box."""
+        if self._spatial_index is not None:
+            return self._spatial_index.entries_within_bounding_box(bbox)
+        return SpatialIndex.filter_within_bounding_box(self.feed_entries.values(), bbox)
+
+    @property
+    def feed(self) -> GeoRssFeed:
+        """Return the feed managed by this feed manager."""
+        return self._feed
+
+    @property
+    def last_status(self) -> str | None:
+        """Return the status of the last update of this feed."""
+        return self._last_status
 
     @property
     def last_timestamp(self) -> datetime | None:
@@ -168,3 +496,10 @@ class FeedManagerBase:
     def last_update_successful(self) -> datetime | None:
         """Return the last successful update of this feed."""
         return self._last_update_successful
+
+
+def _write_file(path: Path, data: bytes):
+    """Replace the file with the data, without ever leaving it incomplete."""
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_bytes(data)
+    temporary_path.replace(path)
@@ -0,0 +1,220 @@
+"""Scheduler polling many feed managers concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import random
+import time
+from urllib.parse import urlsplit
+
+from .consts import (
+    DEFAULT_SCHEDULER_JITTER,
+    DEFAULT_SCHEDULER_MAX_CONCURRENCY,
+    DEFAULT_SCHEDULER_MAX_CONCURRENCY_PER_HOST,
+    DEFAULT_SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_ERROR_BACKOFF,
+    SCHEDULER_UNCHANGED_BACKOFF,
+    UPDATE_ERROR,
+    UPDATE_ERROR_LIMIT_EXCEEDED,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from .exceptions import GeoRssException
+from .feed_manager import FeedManagerBase
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _ScheduledFeed:
+    """Polling state of a feed manager."""
+
+    __slots__ = ("base_interval", "feed_manager", "host", "interval", "next_poll")
+
+    def __init__(
+        self, feed_manager: FeedManagerBase, interval: float, next_poll: float
+    ):
+        """Initialise polling state."""
+        self.feed_manager: FeedManagerBase = feed_manager
+        self.host: str = urlsplit(feed_manager.feed.url).hostname or ""
+        self.base_interval: float = interval
+        self.interval: float = interval
+        # None while the feed is being polled.
+        self.next_poll: float | None = next_poll
+
+
+class FeedScheduler:
+    """Poll many feed managers concurrently.
+
+    Feeds are polled when they are due, with at most a fixed number of polls
+    in progress in total and per host. Each feed's interval is at least the
+    time to live announced by the feed, grows while the feed returns errors
+    or unchanged data, and returns to the configured interval as soon as the
+    feed returns new data. Polls are spread with random jitter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_SCHEDULER_MAX_CONCURRENCY,
+        max_concurrency_per_host: int = DEFAULT_SCHEDULER_MAX_CONCURRENCY_PER_HOST,
+        jitter: float = DEFAULT_SCHEDULER_JITTER,
+        max_interval: float = DEFAULT_SCHEDULER_MAX_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        random_generator: random.Random | None = None,
+    ):
+        """Initialise feed scheduler."""
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency_per_host: int = max_concurrency_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._jitter: float = jitter
+        self._max_interval: float = max_interval
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._random: random.Random = random_generator or random.Random()
+        self._feeds: dict[FeedManagerBase, _ScheduledFeed] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._running: bool = False
+        self._sleep_task: asyncio.Future | None = None
+
+    def __repr__(self):
+        """Return string representation of this scheduler."""
+        return f"<{self.__class__.__name__}(feeds={len(self)})>"
+
+    def __len__(self) -> int:
+        """Return the number of scheduled feeds."""
+        return len(self._feeds)
+
+    def add(self, feed_manager: FeedManagerBase, interval: float):
+        """Poll the feed manager every interval (seconds), starting soon."""
+        if interval <= 0:
+            raise GeoRssException(f"Invalid interval: {interval}")
+        # Spread the first polls of feeds added at the same time.
+        self._feeds[feed_manager] = _ScheduledFeed(
+            feed_manager,
+            interval,
+            self._clock() + self._random.uniform(0, interval * self._jitter),
+        )
+        self._wake_up()
+
+    def remove(self, feed_manager: FeedManagerBase):
+        """Stop polling the feed manager."""
+        self._feeds.pop(feed_manager, None)
+
+    def interval(self, feed_manager: FeedManagerBase) -> float:
+        """Return the current interval (seconds) of the feed manager."""
+        return self._feeds[feed_manager].interval
+
+    def next_poll(self, feed_manager: FeedManagerBase) -> float | None:
+        """Return the clock time of the next poll, or None while polling."""
+        return self._feeds[feed_manager].next_poll
+
+    async def poll_due(self) -> int:
+        """Poll all feeds that are due, and wait for the polls to finish."""
+        tasks = self._start_due_polls()
+        if tasks:
+            await asyncio.gather(*tasks)
+        return len(tasks)
+
+    async def run(self):
+        """Poll feeds when they are due until stopped."""
+        self._running = True
+        try:
+            while self._running:
+                self._start_due_polls()
+                delay: float | None = self._next_delay()
+                self._sleep_task = (
+                    asyncio.ensure_future(self._sleep(delay))
+                    if delay is not None
+                    # Nothing due, wait for a poll to finish or a new feed.
+                    else asyncio.get_running_loop().create_future()
+                )
+                await asyncio.wait({self._sleep_task})
+            # Let polls in progress finish.
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+        finally:
+            self._running = False
+            if self._sleep_task:
+                self._sleep_task.cancel()
+                self._sleep_task = None
+            for task in self._tasks:
+                task.cancel()
+
+    def stop(self):
+        """Stop polling after the polls in progress have finished."""
+        self._running = False
+        self._wake_up()
+
+    def _wake_up(self):
+        """Interrupt the scheduler waiting for the next poll."""
+        if self._sleep_task and not self._sleep_task.done():
+            self._sleep_task.cancel()
+
+    def _next_delay(self) -> float | None:
+        """Return the time until the next feed is due."""
+        next_polls = [
+            scheduled.next_poll
+            for scheduled in self._feeds.values()
+            if scheduled.next_poll is not None
+        ]
+        if next_polls:
+            return max(0.0, min(next_polls) - self._clock())
+        return None
+
+    def _start_due_polls(self) -> list[asyncio.Task]:
+        """Start polling all feeds that are due."""
+        now: float = self._clock()
+        tasks: list[asyncio.Task] = []
+        for scheduled in self._feeds.values():
+            if scheduled.next_poll is not None and scheduled.next_poll <= now:
+                scheduled.next_poll = None
+                task = asyncio.create_task(self._poll(scheduled))
+                self._tasks.add(task)
+                task.add_done_callback(self._poll_done)
+                tasks.append(task)
+        return tasks
+
+    def _poll_done(self, task: asyncio.Task):
+        """Forget the finished poll and reconsider the next poll."""
+        self._tasks.discard(task)
+        self._wake_up()
+
+    async def _poll(self, scheduled: _ScheduledFeed):
+        """Poll the feed within the concurrency limits and reschedule it."""
+        host_semaphore = self._host_semaphores.get(scheduled.host)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[scheduled.host] = asyncio.Semaphore(
+                self._max_concurrency_per_host
+            )
+        status: str | None = UPDATE_ERROR
+        try:
+            # Wait for the host first, so that polls queued behind a busy host
+            # don't hold global slots needed by other hosts.
+            async with host_semaphore, self._semaphore:
+                await scheduled.feed_manager.update()
+                status = scheduled.feed_manager.last_status
+        except Exception:
+            _LOGGER.exception("Polling %s failed", scheduled.feed_manager)
+        finally:
+            self._reschedule(scheduled, status)
+
+    def _reschedule(self, scheduled: _ScheduledFeed, status: str | None):
+        """Adapt the interval of the feed to the outcome of the last poll."""
+        # Time to live is defined in minutes.
+        ttl: int | None = scheduled.feed_manager.feed.ttl
+        base_interval: float = max(scheduled.base_interval, (ttl or 0) * 60.0)
+        if status in (UPDATE_ERROR, UPDATE_ERROR_LIMIT_EXCEEDED):
+            interval = scheduled.interval * SCHEDULER_ERROR_BACKOFF
+        elif status in (UPDATE_OK_NO_DATA, UPDATE_OK_UNCHANGED):
+            interval = scheduled.interval * SCHEDULER_UNCHANGED_BACKOFF
+        else:
+            interval = base_interval
+        scheduled.interval = min(
+            max(interval, base_interval), max(self._max_interval, base_interval)
+        )
+        scheduled.next_poll = self._clock() + scheduled.interval * (
+            1 + self._random.uniform(-self._jitter, self._jitter)
+        )
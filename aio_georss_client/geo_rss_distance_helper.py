@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import logging
+import math
 
-from haversine import haversine
+from haversine import Unit, haversine, haversine_vector
+from haversine.haversine import get_avg_earth_radius
 
 from .xml_parser.geometry import BoundingBox, Geometry, Point, Polygon
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# Widens envelopes slightly so that rounding can't reject a candidate.
+ENVELOPE_MARGIN_DEGREES = 1e-6
+
 
 class GeoRssDistanceHelper:
     """Helper to calculate distances between GeoRSS geometries."""
@@ -54,6 +64,165 @@ class GeoRssDistanceHelper:
             _LOGGER.debug("Not implemented: %s", type(geometry))
         return distance
 
+    @staticmethod
+    def envelope_around(
+        home_coordinates: tuple[float, float], radius: float
+    ) -> BoundingBox:
+        """Return an envelope containing all points within radius of home."""
+        latitude, longitude = home_coordinates
+        angular_radius: float = radius / get_avg_earth_radius(Unit.KILOMETERS)
+        delta_latitude: float = math.degrees(angular_radius) + ENVELOPE_MARGIN_DEGREES
+        south: float = latitude - delta_latitude
+        north: float = latitude + delta_latitude
+        if (
+            north >= 90.0
+            or south <= -90.0
+            or angular_radius >= math.pi / 2
+            or math.sin(angular_radius) >= math.cos(math.radians(latitude))
+        ):
+            # Radius reaches a pole, so all longitudes are within the radius.
+            return BoundingBox(
+                Point(max(south, -90.0), -180.0), Point(min(north, 90.0), 180.0)
+            )
+        delta_longitude: float = (
+            math.degrees(
+                math.asin(math.sin(angular_radius) / math.cos(math.radians(latitude)))
+            )
+            + ENVELOPE_MARGIN_DEGREES
+        )
+        west: float = longitude - delta_longitude
+        east: float = longitude + delta_longitude
+        # Envelope spans across 180 degree longitude.
+        if west < -180.0:
+            west += 360.0
+        if east > 180.0:
+            east -= 360.0
+        return BoundingBox(Point(south, west), Point(north, east))
+
+    @staticmethod
+    def distances_to_geometries(
+        home_coordinates: tuple[float, float], geometries: list[Geometry]
+    ) -> list[float]:
+        """Calculate the distances between home coordinates and all geometries.
+
+        Uses NumPy to calculate the distances to points and polygons in a
+        single batch if available, and falls back to calculating the distance
+        to each geometry separately otherwise.
+        """
+        if np is None or not geometries:
+            return [
+                GeoRssDistanceHelper.distance_to_geometry(home_coordinates, geometry)
+                for geometry in geometries
+            ]
+        return GeoRssDistanceHelper._distances_to_geometries_vectorised(
+            home_coordinates, geometries
+        )
+
+    @staticmethod
+    def _distances_to_geometries_vectorised(
+        home_coordinates: tuple[float, float], geometries: list[Geometry]
+    ) -> list[float]:
+        """Calculate the distances to all geometries with NumPy."""
+        distances: list[float] = [float("inf")] * len(geometries)
+        home_point = Point(home_coordinates[0], home_coordinates[1])
+        # Coordinates of all points, and of all polygon vertices and edges,
+        # each with the index of the geometry they belong to.
+        points: list[tuple[float, float]] = []
+        point_indexes: list[int] = []
+        vertices: list = []
+        vertex_indexes: list = []
+        edge_starts: list = []
+        edge_ends: list = []
+        edge_indexes: list = []
+        for index, geometry in enumerate(geometries):
+            if isinstance(geometry, Point):
+                points.append((geometry.latitude, geometry.longitude))
+                point_indexes.append(index)
+            elif isinstance(geometry, Polygon):
+                if not geometry.coordinates:
+                    continue
+                if geometry.is_inside(home_point):
+                    distances[index] = 0.0
+                    continue
+                coordinates = np.frombuffer(geometry.coordinates).reshape(-1, 2)
+                vertices.append(coordinates)
+                vertex_indexes.append(np.full(len(coordinates), index))
+                edge_starts.append(coordinates[:-1])
+                edge_ends.append(coordinates[1:])
+                edge_indexes.append(np.full(len(coordinates[1:]), index))
+            else:
+                distances[index] = GeoRssDistanceHelper.distance_to_geometry(
+                    home_coordinates, geometry
+                )
+        if points:
+            vertices.append(np.array(points))
+            vertex_indexes.append(np.array(point_indexes))
+        result = np.array(distances)
+        home = np.array([home_coordinates])
+        if vertices:
+            np.minimum.at(
+                result,
+                np.concatenate(vertex_indexes),
+                haversine_vector(np.concatenate(vertices), home, comb=True)[0],
+            )
+        if edge_starts:
+            valid, latitudes, longitudes = (
+                GeoRssDistanceHelper._perpendicular_points_vectorised(
+                    np.concatenate(edge_starts),
+                    np.concatenate(edge_ends),
+                    home_coordinates,
+                )
+            )
+            if valid.any():
+                np.minimum.at(
+                    result,
+                    np.concatenate(edge_indexes)[valid],
+                    haversine_vector(
+                        np.column_stack((latitudes[valid], longitudes[valid])),
+                        home,
+                        comb=True,
+                    )[0],
+                )
+        return result.tolist()
+
+    @staticmethod
+    def _perpendicular_points_vectorised(starts, ends, home_coordinates):
+        """Find perpendicular points on all edges to the home coordinates.
+
+        Same calculation as _perpendicular_point, applied to arrays of edges.
+        Returns a mask of edges that have a perpendicular point, and the
+        latitudes and longitudes of these points.
+        """
+        ay, ax = starts[:, 0], starts[:, 1]
+        by, bx = ends[:, 0], ends[:, 1]
+        # Safety check: a and b can't be an edge if they are the same point.
+        distinct = (ax != bx) | (ay != by)
+        py, px = home_coordinates
+        # Alter longitude to cater for 180 degree crossings.
+        if px < 0:
+            px += 360.0
+        ax = np.where(ax < 0, ax + 360.0, ax)
+        bx = np.where(bx < 0, bx + 360.0, bx)
+        swap = (ay > by) | (ax > bx)
+        ax, ay, bx, by = (
+            np.where(swap, bx, ax),
+            np.where(swap, by, ay),
+            np.where(swap, ax, bx),
+            np.where(swap, ay, by),
+        )
+        dx = np.abs(bx - ax)
+        dy = np.abs(by - ay)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shortest_length = ((dx * (px - ax)) + (dy * (py - ay))) / (
+                (dx * dx) + (dy * dy)
+            )
+        rx = ax + dx * shortest_length
+        ry = ay + dy * shortest_length
+        valid = distinct & (bx >= rx) & (rx >= ax) & (by >= ry) & (ry >= ay)
+        # Correct longitude.
+        rx = np.where(rx > 180, rx - 360.0, rx)
+        return valid, ry, rx
+
     @staticmethod
     def _distance_to_point(
         home_coordinates: tuple[float, float], point: Point
@@ -0,0 +1,44 @@
+"""Home Location."""
+
+from __future__ import annotations
+
+
+class HomeLocation:
+    """Named home coordinates with their own filters."""
+
+    def __init__(
+        self,
+        name: str,
+        coordinates: tuple[float, float],
+        filter_radius: float | None = None,
+        filter_categories: list[str] | None = None,
+    ):
+        """Initialise this home location."""
+        self._name: str = name
+        self._coordinates: tuple[float, float] = coordinates
+        self._filter_radius: float | None = filter_radius
+        self._filter_categories: list[str] | None = filter_categories
+
+    def __repr__(self):
+        """Return string representation of this home location."""
+        return f"<{self.__class__.__name__}(name={self.name}, coordinates={self.coordinates}, radius={self.filter_radius}, categories={self.filter_categories})>"
+
+    @property
+    def name(self) -> str:
+        """Return the name."""
+        return self._name
+
+    @property
+    def coordinates(self) -> tuple[float, float]:
+        """Return the coordinates."""
+        return self._coordinates
+
+    @property
+    def filter_radius(self) -> float | None:
+        """Return the radius (km) to filter entries by."""
+        return self._filter_radius
+
+    @property
+    def filter_categories(self) -> list[str] | None:
+        """Return the categories to filter entries by."""
+        return self._filter_categories
@@ -0,0 +1,145 @@
+"""GeoRSS feed evaluated for multiple home locations."""
+
+from __future__ import annotations
+
+from aiohttp import ClientSession
+
+from .consts import (
+    METRIC_COUNT_ENTRIES,
+    METRIC_COUNT_ITEMS,
+    METRIC_STAGE_ENTRIES,
+    METRIC_STAGE_FILTER,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from .feed import T_FEED_ENTRY, GeoRssFeed
+from .feed_entry import FeedEntry
+from .home_location import HomeLocation
+from .update_metrics import UpdateMetrics, measure_stage
+from .xml_parser import Feed
+from .xml_parser.feed_item import FeedItem
+
+
+class MultiHomeGeoRssFeed(GeoRssFeed[T_FEED_ENTRY]):
+    """GeoRSS feed filtered for multiple home locations.
+
+    The feed is fetched and parsed once per update, and the entries are
+    filtered separately for each home location.
+    """
+
+    def __init__(
+        self,
+        websession: ClientSession,
+        home_locations: list[HomeLocation],
+        url: str,
+    ):
+        """Initialise this service."""
+        super().__init__(websession, None, url)
+        self._home_locations: dict[str, HomeLocation] = {
+            home_location.name: home_location for home_location in home_locations
+        }
+        self._last_entries_by_home: dict[str, list[T_FEED_ENTRY]] | None = None
+
+    def __repr__(self):
+        """Return string representation of this feed."""
+        return f"<{self.__class__.__name__}(homes={list(self._home_locations)}, url={self._url})>"
+
+    @property
+    def home_locations(self) -> list[HomeLocation]:
+        """Return the home locations."""
+        return list(self._home_locations.values())
+
+    async def update(self) -> tuple[str, dict[str, list[T_FEED_ENTRY]] | None]:
+        """Update from external source and return filtered entries by home name."""
+        self._metrics = UpdateMetrics() if self._collect_metrics() else None
+        status, rss_data = await self._fetch()
+        if status == UPDATE_OK:
+            if rss_data:
+                entries_by_home = await self._run_in_executor(
+                    self._create_entries_by_home, rss_data, picklable=False
+                )
+                self._last_timestamp = self._extract_last_timestamp(
+                    [entry for entries in entries_by_home.values() for entry in entries]
+                )
+                self._last_entries_by_home = entries_by_home
+                return UPDATE_OK, entries_by_home
+            # Should not happen.
+            return UPDATE_OK, None
+        if status == UPDATE_OK_UNCHANGED:
+            # Response body identical to the last one processed.
+            return UPDATE_OK_UNCHANGED, self._last_entries_by_home
+        if status == UPDATE_OK_NO_DATA:
+            # Happens for example if the server returns 304
+            return UPDATE_OK_NO_DATA, None
+        # Error happened while fetching the feed, or response exceeded limits.
+        self._reset_update_state()
+        return status, None
+
+    def _reset_update_state(self):
+        """Forget everything learned from previous updates."""
+        super()._reset_update_state()
+        self._last_entries_by_home = None
+
+    def _has_last_entries(self) -> bool:
+        """Check if the entries of the last successful update are known."""
+        return self._last_entries_by_home is not None
+
+    def _restore_entries(self, feed_data: Feed) -> dict[str, list[T_FEED_ENTRY]]:
+        """Create the entries of the last update from restored feed data."""
+        self._last_entries_by_home = self._create_entries_by_home(feed_data)
+        return self._last_entries_by_home
+
+    def _create_entries_by_home(self, rss_data: Feed) -> dict[str, list[T_FEED_ENTRY]]:
+        """Create entries from the feed and filter them for each home location."""
+        with measure_stage(self._metrics, METRIC_STAGE_ENTRIES):
+            global_data = self._extract_from_feed(rss_data)
+            # Share the parsed feed items, and their geometries, across all
+            # home locations.
+            rss_entries: list[FeedItem] = rss_data.entries
+            entries_by_home = {
+                name: [
+                    self._new_entry(home_location.coordinates, rss_entry, global_data)
+                    for rss_entry in rss_entries
+                ]
+                for name, home_location in self._home_locations.items()
+            }
+        with measure_stage(self._metrics, METRIC_STAGE_FILTER):
+            filtered_entries_by_home = self._filter_entries_by_home(entries_by_home)
+        if self._metrics is not None:
+            self._metrics.add_count(METRIC_COUNT_ITEMS, len(rss_entries))
+            self._metrics.add_count(
+                METRIC_COUNT_ENTRIES,
+                sum(len(entries) for entries in filtered_entries_by_home.values()),
+            )
+        return filtered_entries_by_home
+
+    def _filter_entries_by_home(
+        self, entries_by_home: dict[str, list[T_FEED_ENTRY]]
+    ) -> dict[str, list[T_FEED_ENTRY]]:
+        """Filter the provided entries of each home location."""
+        candidates_by_home: dict[str, list[T_FEED_ENTRY]] = {
+            name: self._candidate_entries(
+                entries,
+                self._home_locations[name].coordinates,
+                self._home_locations[name].filter_radius,
+            )
+            for name, entries in entries_by_home.items()
+        }
+        # Calculate the distances of all candidates in one batch per home.
+        FeedEntry.calculate_distances_to_home(
+            [
+                entry
+                for name, entries in candidates_by_home.items()
+                if self._home_locations[name].filter_radius
+                for entry in entries
+            ]
+        )
+        return {
+            name: self._select_entries(
+                entries,
+                self._home_locations[name].filter_radius,
+                self._home_locations[name].filter_categories,
+            )
+            for name, entries in candidates_by_home.items()
+        }
@@ -0,0 +1,110 @@
+"""Policy retrying failed requests with exponential backoff."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import random
+
+from aiohttp import client_exceptions, hdrs
+
+from .consts import (
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_JITTER,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_DELAY,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_CODES,
+)
+from .exceptions import GeoRssException
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Check if the request failed with an error worth retrying.
+
+    Connection errors, timeouts and responses with a status like 503 are
+    transient, while for example 404 is not.
+    """
+    if isinstance(error, client_exceptions.ClientResponseError):
+        return error.status in RETRY_STATUS_CODES
+    return isinstance(error, (client_exceptions.ClientError, asyncio.TimeoutError))
+
+
+def retry_after(error: Exception) -> float | None:
+    """Return the delay (seconds) requested by the Retry-After header, if any."""
+    headers = getattr(error, "headers", None)
+    value: str | None = headers.get(hdrs.RETRY_AFTER) if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=UTC)
+    return max(0.0, (date - datetime.now(UTC)).total_seconds())
+
+
+class RetryPolicy:
+    """Retry requests failing with transient errors.
+
+    Requests are attempted up to a maximum number of times. The delay before
+    each retry grows exponentially up to a maximum, and is spread with random
+    jitter. A Retry-After header of the response replaces the delay, and
+    requests asking for a delay longer than the maximum are not retried.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_RETRY_BACKOFF,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        jitter: float = DEFAULT_RETRY_JITTER,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        random_generator: random.Random | None = None,
+    ):
+        """Initialise retry policy."""
+        if max_attempts < 1:
+            raise GeoRssException(f"Invalid maximum of attempts: {max_attempts}")
+        self._max_attempts: int = max_attempts
+        self._backoff: float = backoff
+        self._max_delay: float = max_delay
+        self._jitter: float = jitter
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._random: random.Random = random_generator or random.Random()
+
+    def __repr__(self):
+        """Return string representation of this retry policy."""
+        return f"<{self.__class__.__name__}(max_attempts={self._max_attempts}, backoff={self._backoff}, max_delay={self._max_delay})>"
+
+    def delay(self, attempt: int, error: Exception) -> float | None:
+        """Return the delay (seconds) before retrying the failed attempt.
+
+        Attempts are counted from 1. Returns None if the request should not
+        be retried.
+        """
+        if attempt >= self._max_attempts or not is_transient_error(error):
+            return None
+        requested_delay: float | None = retry_after(error)
+        if requested_delay is not None:
+            return requested_delay if requested_delay <= self._max_delay else None
+        delay = min(
+            self._backoff * RETRY_BACKOFF_FACTOR ** (attempt - 1), self._max_delay
+        )
+        return delay * (1 + self._random.uniform(-self._jitter, self._jitter))
+
+    async def sleep(self, delay: float):
+        """Wait for the delay (seconds) before the next attempt."""
+        await self._sleep(delay)
+
+    @property
+    def max_attempts(self) -> int:
+        """Return the maximum number of attempts of a request."""
+        return self._max_attempts
@@ -0,0 +1,183 @@
+"""Spatial index over feed entries."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import math
+
+from .consts import DEFAULT_SPATIAL_INDEX_CELL_SIZE, SPATIAL_INDEX_MAX_CELLS
+from .feed_entry import FeedEntry
+from .geo_rss_distance_helper import GeoRssDistanceHelper
+from .xml_parser.geometry import BoundingBox
+
+Cell = tuple[int, int]
+
+
+class SpatialIndex:
+    """Grid of latitude/longitude cells over feed entries.
+
+    Each entry is registered in all cells that the envelopes of its
+    geometries cover, and queries only evaluate the entries registered in
+    the cells covered by the query. Entries with geometries that have no
+    envelope, or that cover too many cells, are evaluated by every query.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_SPATIAL_INDEX_CELL_SIZE):
+        """Initialise spatial index."""
+        self._cell_size: float = cell_size
+        self._latitude_cells: int = math.ceil(180.0 / cell_size)
+        self._longitude_cells: int = math.ceil(360.0 / cell_size)
+        self._entries: dict[str, FeedEntry] = {}
+        self._cells: dict[Cell, set[str]] = {}
+        self._entry_cells: dict[str, list[Cell]] = {}
+        self._unbounded: set[str] = set()
+
+    def __repr__(self):
+        """Return string representation of this spatial index."""
+        return f"<{self.__class__.__name__}(cell_size={self._cell_size}, entries={len(self)})>"
+
+    def __len__(self) -> int:
+        """Return the number of indexed entries."""
+        return len(self._entries)
+
+    def update(self, entries: dict[str, FeedEntry]):
+        """Synchronise the index with the provided entries by external id."""
+        for external_id in self._entries.keys() - entries.keys():
+            self._remove(external_id)
+        for external_id, entry in entries.items():
+            indexed_entry: FeedEntry | None = self._entries.get(external_id)
+            if indexed_entry is entry:
+                continue
+            if indexed_entry is not None:
+                if indexed_entry.geometries == entry.geometries:
+                    # Same location, no need to update the cells.
+                    self._entries[external_id] = entry
+                    continue
+                self._remove(external_id)
+            self._insert(external_id, entry)
+
+    def clear(self):
+        """Remove all entries from the index."""
+        self._entries.clear()
+        self._cells.clear()
+        self._entry_cells.clear()
+        self._unbounded.clear()
+
+    def entries_within_radius(
+        self, coordinates: tuple[float, float], radius: float
+    ) -> list[FeedEntry]:
+        """Return the entries within radius (km) of the coordinates, nearest first."""
+        envelope: BoundingBox = GeoRssDistanceHelper.envelope_around(
+            coordinates, radius
+        )
+        return SpatialIndex.filter_within_radius(
+            self._candidates(envelope), coordinates, radius
+        )
+
+    def entries_within_bounding_box(self, bbox: BoundingBox) -> list[FeedEntry]:
+        """Return the entries intersecting the bounding box, in no particular order."""
+        return SpatialIndex.filter_within_bounding_box(self._candidates(bbox), bbox)
+
+    @staticmethod
+    def filter_within_radius(
+        entries: Iterable[FeedEntry], coordinates: tuple[float, float], radius: float
+    ) -> list[FeedEntry]:
+        """Return the entries within radius (km) of the coordinates, nearest first."""
+        envelope: BoundingBox = GeoRssDistanceHelper.envelope_around(
+            coordinates, radius
+        )
+        candidates: list[FeedEntry] = [
+            entry for entry in entries if entry.intersects_envelope(envelope)
+        ]
+        distances = iter(
+            GeoRssDistanceHelper.distances_to_geometries(
+                coordinates,
+                [geometry for entry in candidates for geometry in entry.geometries],
+            )
+        )
+        results: list[tuple[float, FeedEntry]] = []
+        for entry in candidates:
+            distance: float = min(next(distances) for _ in entry.geometries)
+            if distance <= radius:
+                results.append((distance, entry))
+        results.sort(key=lambda result: result[0])
+        return [entry for _, entry in results]
+
+    @staticmethod
+    def filter_within_bounding_box(
+        entries: Iterable[FeedEntry], bbox: BoundingBox
+    ) -> list[FeedEntry]:
+        """Return the entries with geometry envelopes intersecting the bounding box."""
+        return [entry for entry in entries if entry.intersects_envelope(bbox)]
+
+    def _insert(self, external_id: str, entry: FeedEntry):
+        """Add the entry to the cells covered by its geometries."""
+        self._entries[external_id] = entry
+        cells: list[Cell] = []
+        for geometry in entry.geometries or []:
+            envelope: BoundingBox | None = geometry.envelope
+            geometry_cells: list[Cell] | None = (
+                self._cells_covering(envelope) if envelope else None
+            )
+            if geometry_cells is None:
+                self._unbounded.add(external_id)
+                return
+            cells.extend(geometry_cells)
+        cells = list(dict.fromkeys(cells))
+        self._entry_cells[external_id] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(external_id)
+
+    def _remove(self, external_id: str):
+        """Remove the entry from all cells."""
+        del self._entries[external_id]
+        self._unbounded.discard(external_id)
+        for cell in self._entry_cells.pop(external_id, []):
+            external_ids: set[str] = self._cells[cell]
+            external_ids.discard(external_id)
+            if not external_ids:
+                del self._cells[cell]
+
+    def _candidates(self, envelope: BoundingBox) -> list[FeedEntry]:
+        """Return all entries registered in the cells covered by the envelope."""
+        cells: list[Cell] | None = self._cells_covering(envelope)
+        if cells is None:
+            return list(self._entries.values())
+        external_ids: set[str] = set(self._unbounded)
+        for cell in cells:
+            cell_external_ids: set[str] | None = self._cells.get(cell)
+            if cell_external_ids:
+                external_ids.update(cell_external_ids)
+        return [self._entries[external_id] for external_id in external_ids]
+
+    def _cells_covering(self, envelope: BoundingBox) -> list[Cell] | None:
+        """Return the cells covered by the envelope, or None if too many."""
+        south: int = self._latitude_cell(envelope.bottom_left.latitude)
+        north: int = self._latitude_cell(envelope.top_right.latitude)
+        longitude_cells: list[int] = []
+        for west, east in envelope.longitude_ranges():
+            longitude_cells.extend(
+                range(self._longitude_cell(west), self._longitude_cell(east) + 1)
+            )
+        longitude_cells = list(dict.fromkeys(longitude_cells))
+        if (north - south + 1) * len(longitude_cells) > SPATIAL_INDEX_MAX_CELLS:
+            return None
+        return [
+            (latitude_cell, longitude_cell)
+            for latitude_cell in range(south, north + 1)
+            for longitude_cell in longitude_cells
+        ]
+
+    def _latitude_cell(self, latitude: float) -> int:
+        """Return the grid row of the latitude."""
+        return min(
+            max(math.floor((latitude + 90.0) / self._cell_size), 0),
+            self._latitude_cells - 1,
+        )
+
+    def _longitude_cell(self, longitude: float) -> int:
+        """Return the grid column of the longitude."""
+        return min(
+            max(math.floor((longitude + 180.0) / self._cell_size), 0),
+            self._longitude_cells - 1,
+        )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from .update_metrics import UpdateMetrics
+
 
 class StatusUpdate:
     """Status Update class."""
@@ -18,6 +20,10 @@ class StatusUpdate:
         created: int,
         updated: int,
         removed: int,
+        *,
+        metrics: UpdateMetrics | None = None,
+        errors: dict[str, Exception] | None = None,
+        unchanged: int = 0,
     ):
         """Initialise this status update."""
         self._status: str = status
@@ -28,6 +34,9 @@ class StatusUpdate:
         self._created: int = created
         self._updated: int = updated
         self._removed: int = removed
+        self._metrics: UpdateMetrics | None = metrics
+        self._errors: dict[str, Exception] = errors or {}
+        self._unchanged: int = unchanged
 
     def __repr__(self):
         """Return string representation of this entry."""
@@ -68,7 +77,22 @@ class StatusUpdate:
         """Return the number of updated entries."""
         return self._updated
 
+    @property
+    def unchanged(self) -> int:
+        """Return the number of entries found again without changes."""
+        return self._unchanged
+
     @property
     def removed(self) -> int:
         """Return the number of removed entries."""
         return self._removed
+
+    @property
+    def metrics(self) -> UpdateMetrics | None:
+        """Return the durations and sizes of the update stages, if collected."""
+        return self._metrics
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Return the exceptions raised by entity callbacks, by external id."""
+        return self._errors
@@ -0,0 +1,68 @@
+"""Durations and sizes of the stages of a feed update."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+import time
+
+
+class UpdateMetrics:
+    """Durations and sizes of the stages of a feed update.
+
+    Durations are measured with a monotonic clock in seconds and accumulated
+    per stage. Counts, like the number of bytes received or feed items
+    parsed, are accumulated per name.
+    """
+
+    __slots__ = ("_counts", "_durations")
+
+    def __init__(self):
+        """Initialise update metrics."""
+        self._durations: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+    def __repr__(self):
+        """Return string representation of these metrics."""
+        return f"<{self.__class__.__name__}(durations={self._durations}, counts={self._counts})>"
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the duration of the stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_duration(name, time.perf_counter() - start)
+
+    def add_duration(self, name: str, duration: float):
+        """Add the duration (seconds) to the stage."""
+        self._durations[name] = self._durations.get(name, 0.0) + duration
+
+    def add_count(self, name: str, count: int):
+        """Add the count to the named counter."""
+        self._counts[name] = self._counts.get(name, 0) + count
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """Return the durations (seconds) by stage."""
+        return self._durations
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Return the counts by name."""
+        return self._counts
+
+    @property
+    def total_duration(self) -> float:
+        """Return the sum of all stage durations (seconds)."""
+        return sum(self._durations.values())
+
+
+def measure_stage(
+    metrics: UpdateMetrics | None, name: str
+) -> AbstractContextManager[None]:
+    """Measure the duration of the stage, unless metrics are disabled."""
+    if metrics is None:
+        return nullcontext()
+    return metrics.stage(name)
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta, timezone
 import logging
+import re
 
 import dateutil
 import xmltodict
 
 from ..consts import (
+    PARSER_BACKEND_EXPAT,
+    PARSER_BACKEND_XMLTODICT,
     XML_TAG_CHANNEL,
     XML_TAG_DC_DATE,
     XML_TAG_FEED,
@@ -28,7 +32,12 @@ from ..consts import (
     XML_TAG_UPDATED,
     XML_TAG_WIDTH,
 )
+from ..exceptions import GeoRssException
 from .feed import Feed
+from .feed_item import FeedItem
+from .lazy_value import LazyValue
+from .parse_limits import LimitingPostprocessor
+from .streaming_parser import StreamingXmlParser
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +57,32 @@ KEYS_DATE = [
     XML_TAG_PUBLISHED,
     XML_TAG_UPDATED,
 ]
+# Dates in formats that can be parsed without dateutil, for example
+# "Sun, 09 Dec 2018 07:40:00 GMT" (RFC 822) and "2018-12-09T07:45:00+00:00"
+# (ISO 8601).
+DATE_RFC_822 = re.compile(
+    r"(?:(?:mon|tue|wed|thu|fri|sat|sun),\s*)?(\d{1,2})\s+([a-z]{3})\s+(\d{4})\s+"
+    r"(\d{2}):(\d{2})(?::(\d{2}))?\s+(?:(?-i:(GMT|UTC|Z))|([+-])([01]\d|2[0-3])([0-5]\d))",
+    re.IGNORECASE,
+)
+DATE_ISO_8601 = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?"
+)
+MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
 KEYS_FLOAT = [XML_TAG_GEO_LAT, XML_TAG_GEO_LONG]
 KEYS_FLOAT_LIST = [
     XML_TAG_GEORSS_POLYGON,
@@ -57,16 +92,38 @@ KEYS_FLOAT_LIST = [
     XML_TAG_GDACS_BBOX,
 ]
 KEYS_INT = [XML_TAG_HEIGHT, XML_TAG_TTL, XML_TAG_WIDTH]
+KEYS_CONVERTED = frozenset(KEYS_DATE + KEYS_FLOAT + KEYS_FLOAT_LIST + KEYS_INT)
+PARSER_BACKENDS = [PARSER_BACKEND_XMLTODICT, PARSER_BACKEND_EXPAT]
 
 
 class XmlParser:
     """Built-in XML parser."""
 
-    def __init__(self, additional_namespaces: dict | None = None):
-        """Initialise the XML parser."""
+    def __init__(
+        self,
+        additional_namespaces: dict | None = None,
+        backend: str = PARSER_BACKEND_XMLTODICT,
+        lazy_conversion: bool = False,
+        *,
+        max_items: int | None = None,
+        max_polygon_vertices: int | None = None,
+    ):
+        """Initialise the XML parser.
+
+        Parsing fails with GeoRssLimitExceeded as soon as the feed has more
+        items, or a polygon more vertices, than the optional maximum.
+        """
+        if backend not in PARSER_BACKENDS:
+            raise GeoRssException(f"Unsupported parser backend: {backend}")
         self._namespaces = DEFAULT_NAMESPACES
         if additional_namespaces:
             self._namespaces.update(additional_namespaces)
+        self._backend: str = backend
+        self._postprocessor: Callable[[list[str], str, str], tuple] = (
+            XmlParser.lazy_postprocessor if lazy_conversion else XmlParser.postprocessor
+        )
+        self._max_items: int | None = max_items
+        self._max_polygon_vertices: int | None = max_polygon_vertices
 
     @staticmethod
     def postprocessor(
@@ -75,7 +132,7 @@ class XmlParser:
         """Conduct type conversion for selected keys."""
         try:
             if key in KEYS_DATE and value:
-                return key, dateutil.parser.parse(value)
+                return key, XmlParser._parse_date(value)
             if key in KEYS_FLOAT and value:
                 return key, float(value)
             if key in KEYS_FLOAT_LIST and value:
@@ -95,6 +152,44 @@ class XmlParser:
             _LOGGER.warning("Unable to process (%s/%s): %s", key, value, error)
         return key, value
 
+    @staticmethod
+    def lazy_postprocessor(
+        path: list[str], key: str, value: str
+    ) -> tuple[str, str | LazyValue]:
+        """Defer type conversion for selected keys until the value is read."""
+        if key in KEYS_CONVERTED and value:
+            return key, LazyValue(XmlParser.postprocessor, key, value)
+        return key, value
+
+    @staticmethod
+    def _parse_date(value: str) -> datetime:
+        """Parse date in common feed formats, or with dateutil otherwise."""
+        value = value.strip()
+        if DATE_ISO_8601.fullmatch(value):
+            return datetime.fromisoformat(value)
+        match = DATE_RFC_822.fullmatch(value)
+        if match:
+            month = MONTHS.get(match.group(2).lower())
+            if month:
+                day, _, year, hour, minute, second, utc, sign, hours, minutes = (
+                    match.groups()
+                )
+                tzinfo = UTC
+                if not utc and (hours != "00" or minutes != "00"):
+                    offset = timedelta(hours=int(hours), minutes=int(minutes))
+                    tzinfo = timezone(-offset if sign == "-" else offset)
+                return datetime(
+                    int(year),
+                    month,
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second or 0),
+                    tzinfo=tzinfo,
+                )
+        # Unusual format, fall back to the flexible but slow parser.
+        return dateutil.parser.parse(value)
+
     @staticmethod
     def _process_coordinates(value: str) -> list[float]:
         """Turn white-space separated list of numbers into list of floats."""
@@ -104,15 +199,69 @@ class XmlParser:
         ]
         return point_coordinates
 
-    def parse(self, xml: str) -> Feed | None:
+    def streaming_parser(
+        self,
+        item_callback: Callable[[FeedItem], None] | None = None,
+        encoding: str | None = None,
+    ) -> StreamingXmlParser:
+        """Create a streaming parser that can be fed chunk by chunk."""
+        return StreamingXmlParser(
+            self._namespaces,
+            self._limited_postprocessor(count_items=False),
+            KEYS_CONVERTED,
+            item_callback=item_callback,
+            encoding=encoding,
+            max_items=self._max_items,
+        )
+
+    def _limited_postprocessor(
+        self, count_items: bool
+    ) -> Callable[[list, str, str], tuple]:
+        """Return the postprocessor, enforcing the limits of a new document."""
+        if self._max_polygon_vertices is None and (
+            self._max_items is None or not count_items
+        ):
+            return self._postprocessor
+        return LimitingPostprocessor(
+            self._postprocessor,
+            max_items=self._max_items if count_items else None,
+            max_polygon_vertices=self._max_polygon_vertices,
+        )
+
+    def parse(self, xml: str | bytes, encoding: str | None = None) -> Feed | None:
         """Parse the provided xml."""
+        return XmlParser.create_feed(self.parse_to_dict(xml, encoding))
+
+    def parse_to_dict(
+        self, xml: str | bytes, encoding: str | None = None
+    ) -> dict | None:
+        """Parse the provided xml into a plain, picklable document.
+
+        Bytes are parsed in the encoding provided, or otherwise detected from
+        byte order mark or XML declaration.
+        """
         if xml:
-            parsed_dict = xmltodict.parse(
+            if isinstance(xml, str):
+                # Same as xmltodict: strings are always parsed as UTF-8.
+                xml = xml.encode("utf-8")
+                encoding = "utf-8"
+            if self._backend == PARSER_BACKEND_EXPAT:
+                streaming_parser = self.streaming_parser(encoding=encoding)
+                streaming_parser.feed(xml)
+                return streaming_parser.close()
+            return xmltodict.parse(
                 xml,
+                encoding=encoding,
                 process_namespaces=True,
                 namespaces=self._namespaces,
-                postprocessor=XmlParser.postprocessor,
+                postprocessor=self._limited_postprocessor(count_items=True),
             )
+        return None
+
+    @staticmethod
+    def create_feed(parsed_dict: dict | None) -> Feed | None:
+        """Create feed from the provided parsed document."""
+        if parsed_dict:
             if XML_TAG_RSS in parsed_dict:
                 return XmlParser._create_feed_from_rss(parsed_dict)
             if XML_TAG_FEED in parsed_dict:
@@ -0,0 +1,73 @@
+"""Encoding detection of XML documents."""
+
+from __future__ import annotations
+
+import codecs
+import re
+
+# Encodings decoded by expat itself, by Python codec name.
+EXPAT_ENCODINGS = {
+    "utf-8": "UTF-8",
+    "utf-16-le": "UTF-16LE",
+    "utf-16-be": "UTF-16BE",
+    "iso8859-1": "ISO-8859-1",
+    "ascii": "US-ASCII",
+}
+BYTE_ORDER_MARKS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+# Bytes collected at most before detecting the encoding of a document.
+MAX_HEAD_SIZE = 1024
+XML_DECLARATION_START = b"<?xml"
+XML_DECLARATION_END = b"?>"
+XML_DECLARATION_ENCODING = re.compile(
+    rb"<\?xml[^>]*?\sencoding\s*=\s*[\"']([A-Za-z][\w.:-]*)[\"']"
+)
+
+
+def detect_encoding(head: bytes, charset: str | None) -> tuple[str | None, str | None]:
+    """Return the encodings to parse and to decode the document with.
+
+    A byte order mark takes precedence over the charset of the response,
+    which takes precedence over the encoding of the XML declaration. The
+    parse encoding is None if expat detects the encoding itself. Documents
+    in encodings that expat does not support must be decoded first, and are
+    then parsed as UTF-8.
+    """
+    if head.startswith(BYTE_ORDER_MARKS):
+        return None, None
+    if charset:
+        name = _codec_name(charset)
+        if name is None:
+            return None, None
+        if name in EXPAT_ENCODINGS:
+            return EXPAT_ENCODINGS[name], None
+        return EXPAT_ENCODINGS["utf-8"], name
+    match = XML_DECLARATION_ENCODING.match(head)
+    if match:
+        name = _codec_name(match.group(1).decode("ascii"))
+        if name is not None and name not in EXPAT_ENCODINGS:
+            return EXPAT_ENCODINGS["utf-8"], name
+    return None, None
+
+
+def is_complete_head(head: bytes) -> bool:
+    """Check if the head of a document is long enough to detect its encoding.
+
+    The head is complete once it contains a byte order mark, the whole XML
+    declaration or other markup than the declaration, or its maximum size.
+    """
+    if len(head) >= MAX_HEAD_SIZE or head.startswith(BYTE_ORDER_MARKS):
+        return True
+    if any(bom.startswith(head) for bom in BYTE_ORDER_MARKS):
+        # The head may still turn out to start with a byte order mark.
+        return False
+    if XML_DECLARATION_START.startswith(head[: len(XML_DECLARATION_START)]):
+        return XML_DECLARATION_END in head
+    return True
+
+
+def _codec_name(encoding: str) -> str | None:
+    """Return the normalised name of the codec, or None if unknown."""
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
@@ -26,6 +26,8 @@ _LOGGER = logging.getLogger(__name__)
 class Feed(FeedOrFeedItem):
     """Represents a feed."""
 
+    __slots__ = ()
+
     @property
     def subtitle(self) -> str | None:
         """Return the subtitle of this feed."""
@@ -13,11 +13,14 @@ from ..consts import (
     XML_TAG_SUMMARY,
     XML_TAG_TITLE,
 )
+from .lazy_value import LazyValue
 
 
 class FeedDictSource:
     """Represents a subset of a feed based on a dict."""
 
+    __slots__ = ("_source",)
+
     def __init__(self, source: dict):
         """Initialise feed."""
         self._source: dict = source
@@ -31,11 +34,27 @@ class FeedDictSource:
         if self._source and names:
             # Try each name, and return the first value that is not None.
             for name in names:
-                value = self._source.get(name, None)
+                value = FeedDictSource._value(self._source, name)
                 if value:
                     return value
         return None
 
+    @staticmethod
+    def _value(obj: dict, key: str) -> Optional:
+        """Return the value of the key, converting lazy values."""
+        value = obj.get(key)
+        if isinstance(value, LazyValue):
+            return value.convert()
+        if isinstance(value, list) and any(
+            isinstance(element, LazyValue) for element in value
+        ):
+            # Repeated tags.
+            return [
+                element.convert() if isinstance(element, LazyValue) else element
+                for element in value
+            ]
+        return value
+
     def _attribute_with_text(self, names: list[str]) -> Optional:
         """Get an attribute with text from this feed or feed item."""
         value = self._attribute(names)
@@ -52,7 +71,7 @@ class FeedDictSource:
             return (
                 FeedDictSource._attribute_in_structure(obj[key], keys)
                 if keys
-                else obj[key]
+                else FeedDictSource._value(obj, key)
             )
         return None
 
@@ -9,6 +9,8 @@ from .feed_dict_source import FeedDictSource
 class FeedImage(FeedDictSource):
     """Represents a feed image."""
 
+    __slots__ = ()
+
     @property
     def url(self) -> str | None:
         """Return the url of this feed image."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 
 from ..consts import (
@@ -31,6 +32,14 @@ _LOGGER = logging.getLogger(__name__)
 class FeedItem(FeedOrFeedItem):
     """Represents a feed item."""
 
+    __slots__ = ("_fingerprint", "_geometries")
+
+    def __init__(self, source: dict):
+        """Initialise feed item."""
+        super().__init__(source)
+        self._geometries: list[Geometry] | None = None
+        self._fingerprint: str | None = None
+
     def __repr__(self):
         """Return string representation of this feed item."""
         return f"<{self.__class__.__name__}({self.guid})>"
@@ -50,9 +59,29 @@ class FeedItem(FeedOrFeedItem):
         """Return the source of this feed item."""
         return self._attribute([XML_TAG_SOURCE])
 
+    @property
+    def fingerprint(self) -> str:
+        """Return a digest of the source of this feed item.
+
+        Items parsed from the same XML with the same parser settings have the
+        same fingerprint. Lazily converted values contribute their raw value,
+        whether they have been read or not. The fingerprint is computed once.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.blake2b(
+                repr(self._source).encode("utf-8"), digest_size=16
+            ).hexdigest()
+        return self._fingerprint
+
     @property
     def geometries(self) -> list[Geometry] | None:
         """Return all geometries of this feed item."""
+        if self._geometries is None:
+            self._geometries = self._create_geometries()
+        return self._geometries
+
+    def _create_geometries(self) -> list[Geometry]:
+        """Create all geometries of this feed item."""
         geometries = []
         for entry in [
             self._geometry_georss_point(),
@@ -64,12 +93,8 @@ class FeedItem(FeedOrFeedItem):
         ]:
             if entry:
                 geometries.extend(entry)
-        # Filter out any duplicates.
-        unique_geometries = []
-        for i in geometries:
-            if i not in unique_geometries:
-                unique_geometries.append(i)
-        return unique_geometries
+        # Filter out any duplicates, preserving the order.
+        return list(dict.fromkeys(geometries))
 
     def _geometry_georss_point(self) -> list[Point] | None:
         """Check for georss:point tag."""
@@ -146,8 +171,8 @@ class FeedItem(FeedOrFeedItem):
         # </geo:Point>
         point = self._attribute([XML_TAG_GEO_POINT])
         if point:
-            lat = point.get(XML_TAG_GEO_LAT)
-            long = point.get(XML_TAG_GEO_LONG)
+            lat = self._attribute_in_structure(point, [XML_TAG_GEO_LAT])
+            long = self._attribute_in_structure(point, [XML_TAG_GEO_LONG])
             if long and lat:
                 return [Point(lat, long)]
         return None
@@ -188,7 +213,7 @@ class FeedItem(FeedOrFeedItem):
                     BoundingBox(Point(entry[2], entry[0]), Point(entry[3], entry[1]))
                 )
             else:
-                _LOGGER.warning("Insufficient data for " "bounding box: %s", entry)
+                _LOGGER.warning("Insufficient data for bounding box: %s", entry)
         return bounding_boxes
 
     def _geometry_georss_polygon(self) -> list[Polygon] | None:
@@ -222,14 +247,7 @@ class FeedItem(FeedOrFeedItem):
         if len(polygon_data) % 2 != 0:
             # Not even number of coordinates - chop last entry.
             polygon_data = polygon_data[0 : len(polygon_data) - 1]
-        return [
-            Polygon(
-                [
-                    Point(polygon_data[i], polygon_data[i + 1])
-                    for i in range(0, len(polygon_data), 2)
-                ]
-            )
-        ]
+        return [Polygon.from_coordinates(polygon_data)]
 
     @staticmethod
     def _create_polygon_multiple(polygon_data: list) -> list[Polygon]:
@@ -23,6 +23,8 @@ from .feed_dict_source import FeedDictSource
 class FeedOrFeedItem(FeedDictSource):
     """Represents the common base of feed and its items."""
 
+    __slots__ = ()
+
     @property
     def category(self) -> list[str] | None:
         """Return the categories of this feed item."""
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable
+
 
 class Geometry:
     """Represents a geometry."""
 
+    __slots__ = ()
+
+    @property
+    def envelope(self) -> BoundingBox | None:
+        """Return the bounding envelope of this geometry, if known."""
+        return None
+
 
 class Point(Geometry):
     """Represents a point."""
 
+    __slots__ = ("_latitude", "_longitude")
+
     def __init__(self, latitude: float, longitude: float):
         """Initialise point."""
         self._latitude: float = latitude
@@ -41,13 +53,38 @@ class Point(Geometry):
         """Return the longitude of this point."""
         return self._longitude
 
+    @property
+    def envelope(self) -> BoundingBox:
+        """Return the bounding envelope of this point."""
+        return BoundingBox(self, self)
+
 
 class Polygon(Geometry):
     """Represents a polygon."""
 
+    __slots__ = ("_centroid", "_coordinates", "_edges", "_envelope")
+
     def __init__(self, points: list[Point]):
         """Initialise polygon."""
-        self._points: list[Point] = points
+        coordinates = array("d")
+        for point in points:
+            coordinates.append(point.latitude)
+            coordinates.append(point.longitude)
+        self._init_coordinates(coordinates)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[float]) -> Polygon:
+        """Create polygon from interleaved latitudes and longitudes."""
+        polygon = cls.__new__(cls)
+        polygon._init_coordinates(array("d", coordinates))  # noqa: SLF001
+        return polygon
+
+    def _init_coordinates(self, coordinates: array):
+        """Initialise polygon from interleaved latitudes and longitudes."""
+        self._coordinates: array = coordinates
+        self._edges: list[tuple[Point, Point]] | None = None
+        self._centroid: Point | None = None
+        self._envelope: BoundingBox | None = None
 
     def __repr__(self):
         """Return string representation of this polygon."""
@@ -55,40 +92,76 @@ class Polygon(Geometry):
 
     def __hash__(self) -> int:
         """Return unique hash of this geometry."""
-        return hash(self.points)
+        return hash(tuple(self._coordinates))
 
     def __eq__(self, other: object) -> bool:
         """Return if this object is equal to other object."""
-        return self.__class__ == other.__class__ and self.points == other.points
+        return (
+            self.__class__ == other.__class__
+            and self._coordinates == other._coordinates
+        )
+
+    @property
+    def coordinates(self) -> array:
+        """Return the interleaved latitudes and longitudes of this polygon."""
+        return self._coordinates
 
     @property
     def points(self) -> list[Point] | None:
         """Return the points of this polygon."""
-        return self._points
+        coordinates = self._coordinates
+        return [
+            Point(coordinates[i], coordinates[i + 1])
+            for i in range(0, len(coordinates), 2)
+        ]
 
     @property
     def edges(self) -> list[tuple[Point, Point]]:
         """Return all edges of this polygon."""
-        edges: list[tuple[Point, Point]] = []
-        for i in range(1, len(self.points)):
-            previous = self.points[i - 1]
-            current = self.points[i]
-            edges.append((previous, current))
-        return edges
+        if self._edges is None:
+            points: list[Point] = self.points
+            self._edges = list(zip(points[:-1], points[1:], strict=True))
+        return self._edges
 
     @property
     def centroid(self) -> Point:
         """Find the polygon's centroid as a best approximation."""
-        longitudes_list: list[float] = [point.longitude for point in self.points]
-        latitudes_list: list[float] = [point.latitude for point in self.points]
-        number_of_points: int = len(self.points)
-        longitude: float = sum(longitudes_list) / number_of_points
-        latitude: float = sum(latitudes_list) / number_of_points
-        return Point(latitude, longitude)
+        if self._centroid is None:
+            number_of_points: int = len(self._coordinates) // 2
+            latitude: float = sum(self._coordinates[0::2]) / number_of_points
+            longitude: float = sum(self._coordinates[1::2]) / number_of_points
+            self._centroid = Point(latitude, longitude)
+        return self._centroid
+
+    @property
+    def envelope(self) -> BoundingBox | None:
+        """Return the bounding envelope of this polygon."""
+        if self._envelope is None and self._coordinates:
+            self._envelope = self._create_envelope()
+        return self._envelope
+
+    def _create_envelope(self) -> BoundingBox:
+        """Create the bounding envelope of this polygon."""
+        latitudes: array = self._coordinates[0::2]
+        longitudes: array = self._coordinates[1::2]
+        # Alter longitude to cater for 180 degree crossings, the same way
+        # as the edges are evaluated.
+        west: float = min(longitudes, key=Polygon._transposed_longitude)
+        east: float = max(longitudes, key=Polygon._transposed_longitude)
+        return BoundingBox(Point(min(latitudes), west), Point(max(latitudes), east))
+
+    @staticmethod
+    def _transposed_longitude(longitude: float) -> float:
+        """Transpose negative longitudes across 180 degree longitude."""
+        return longitude + 360.0 if longitude < 0 else longitude
 
     def is_inside(self, point: Point | None) -> bool:
         """Check if the provided point is inside this polygon."""
         if point:
+            # Quick reject of points outside of the envelope.
+            envelope: BoundingBox | None = self.envelope
+            if envelope is None or not envelope.is_inside(point):
+                return False
             crossings: int = 0
             for edge in self.edges:
                 if Polygon._ray_crosses_segment(point, edge):
@@ -137,6 +210,8 @@ class BoundingBox(Geometry):
     # <!--gdacs: bbox format = lonmin lonmax latmin latmax -->
     # <gdacs:bbox> 164.5652 172.5652 -24.9041 -16.9041 </gdacs:bbox>
 
+    __slots__ = ("_bottom_left", "_top_right")
+
     def __init__(self, bottom_left: Point, top_right: Point):
         """Initialise bounding box."""
         self._bottom_left: Point = bottom_left
@@ -181,6 +256,34 @@ class BoundingBox(Geometry):
         latitude: float = (self._bottom_left.latitude + self._top_right.latitude) / 2
         return Point(latitude, longitude)
 
+    @property
+    def envelope(self) -> BoundingBox:
+        """Return the bounding envelope of this bounding box."""
+        return self
+
+    def intersects(self, other: BoundingBox) -> bool:
+        """Check if the provided bounding box intersects this bounding box."""
+        if (
+            self._bottom_left.latitude > other.top_right.latitude
+            or other.bottom_left.latitude > self._top_right.latitude
+        ):
+            return False
+        return any(
+            west <= other_east and other_west <= east
+            for west, east in self.longitude_ranges()
+            for other_west, other_east in other.longitude_ranges()
+        )
+
+    def longitude_ranges(self) -> list[tuple[float, float]]:
+        """Return the longitude ranges covered by this bounding box."""
+        if self._bottom_left.longitude > self._top_right.longitude:
+            # bounding box spans across 180 degree longitude
+            return [
+                (self._bottom_left.longitude, 180.0),
+                (-180.0, self._top_right.longitude),
+            ]
+        return [(self._bottom_left.longitude, self._top_right.longitude)]
+
     def is_inside(self, point: Point) -> bool:
         """Check if the provided point is inside this bounding box."""
         if point:
@@ -0,0 +1,44 @@
+"""Value of a parsed document converted on first access."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+class LazyValue:
+    """Raw value of a parsed document, converted when it is first read.
+
+    The raw value is kept after the conversion, so that fingerprints of the
+    document do not depend on which values have been read.
+    """
+
+    __slots__ = ("_converted", "_converted_value", "_converter", "_key", "_value")
+
+    def __init__(
+        self,
+        converter: Callable[[list[str], str, str], tuple],
+        key: str,
+        value: str | dict,
+    ):
+        """Initialise lazy value."""
+        self._converter = converter
+        self._key: str = key
+        self._value: str | dict = value
+        self._converted: bool = False
+        self._converted_value = None
+
+    def __repr__(self):
+        """Return string representation of this lazy value."""
+        return f"<{self.__class__.__name__}({self._key}={self._value!r})>"
+
+    def convert(self):
+        """Convert the raw value, once."""
+        if not self._converted:
+            self._converted_value = self._converter([], self._key, self._value)[1]
+            self._converted = True
+        return self._converted_value
+
+    @property
+    def converted(self) -> bool:
+        """Return whether the raw value has been converted."""
+        return self._converted
@@ -0,0 +1,71 @@
+"""Limits enforced while parsing a feed."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from ..consts import (
+    XML_CDATA,
+    XML_TAG_ENTRY,
+    XML_TAG_GEORSS_POLYGON,
+    XML_TAG_GML_POS_LIST,
+    XML_TAG_ITEM,
+)
+from ..exceptions import GeoRssLimitExceeded
+
+KEYS_FEED_ITEM = frozenset([XML_TAG_ITEM, XML_TAG_ENTRY])
+KEYS_POLYGON = frozenset([XML_TAG_GEORSS_POLYGON, XML_TAG_GML_POS_LIST])
+
+
+def check_item_count(count: int, max_items: int | None):
+    """Reject a feed with more items than the maximum."""
+    if max_items is not None and count > max_items:
+        raise GeoRssLimitExceeded(f"Feed has more than {max_items} items")
+
+
+def check_polygon_vertices(key: str, value, max_vertices: int | None):
+    """Reject a polygon with more vertices than the maximum.
+
+    Vertices are counted from the raw coordinates, before their conversion.
+    """
+    if max_vertices is None or key not in KEYS_POLYGON or not value:
+        return
+    if isinstance(value, dict):
+        value = value.get(XML_CDATA)
+    if isinstance(value, str):
+        # Each vertex consists of latitude and longitude.
+        vertices = len(value.split()) // 2
+        if vertices > max_vertices:
+            raise GeoRssLimitExceeded(
+                f"Polygon has {vertices} vertices, more than {max_vertices}"
+            )
+
+
+class LimitingPostprocessor:
+    """Postprocessor enforcing limits before converting values.
+
+    Parsers passing every element to the postprocessor, like xmltodict, also
+    get their feed items counted here. Create one instance per document.
+    """
+
+    __slots__ = ("_items", "_max_items", "_max_polygon_vertices", "_postprocessor")
+
+    def __init__(
+        self,
+        postprocessor: Callable[[list, str, str], tuple],
+        max_items: int | None = None,
+        max_polygon_vertices: int | None = None,
+    ):
+        """Initialise the limiting postprocessor."""
+        self._postprocessor = postprocessor
+        self._max_items: int | None = max_items
+        self._max_polygon_vertices: int | None = max_polygon_vertices
+        self._items: int = 0
+
+    def __call__(self, path: list, key: str, value) -> tuple:
+        """Check the limits, then convert the value."""
+        if self._max_items is not None and key in KEYS_FEED_ITEM:
+            self._items += 1
+            check_item_count(self._items, self._max_items)
+        check_polygon_vertices(key, value, self._max_polygon_vertices)
+        return self._postprocessor(path, key, value)
@@ -0,0 +1,169 @@
+"""Streaming XML parser built directly on pyexpat."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from xml.parsers import expat
+
+from ..consts import (
+    XML_CDATA,
+    XML_TAG_CHANNEL,
+    XML_TAG_ENTRY,
+    XML_TAG_FEED,
+    XML_TAG_ITEM,
+    XML_TAG_RSS,
+)
+from .feed_item import FeedItem
+from .parse_limits import check_item_count
+
+NAMESPACE_SEPARATOR = ":"
+XML_ATTR_PREFIX = "@"
+XML_ATTR_XMLNS = "xmlns"
+
+
+class StreamingXmlParser:
+    """Incremental XML parser producing the same structure as xmltodict.
+
+    Data can be fed in one go or chunk by chunk. Type conversion is only
+    attempted for the keys provided, and each feed item is handed to the
+    optional item callback as soon as its closing tag has been parsed.
+    Parsing stops as soon as the feed has more items than the maximum.
+    """
+
+    def __init__(
+        self,
+        namespaces: dict,
+        postprocessor: Callable[[list[str], str, str], tuple],
+        converted_keys: frozenset[str],
+        item_callback: Callable[[FeedItem], None] | None = None,
+        encoding: str | None = None,
+        *,
+        max_items: int | None = None,
+    ):
+        """Initialise the streaming XML parser."""
+        self._namespaces: dict = namespaces
+        self._postprocessor = postprocessor
+        self._converted_keys: frozenset[str] = converted_keys
+        self._item_callback: Callable[[FeedItem], None] | None = item_callback
+        self._max_items: int | None = max_items
+        self._items: int = 0
+        # Cache of expanded element names to their short names.
+        self._names: dict[str, str] = {}
+        self._path: list[str] = []
+        self._stack: list[tuple[dict | None, list[str]]] = []
+        self._item: dict | None = None
+        self._data: list[str] = []
+        self._namespace_declarations: dict = {}
+        self._parser = expat.ParserCreate(encoding, NAMESPACE_SEPARATOR)
+        self._parser.ordered_attributes = True
+        self._parser.buffer_text = True
+        self._parser.StartNamespaceDeclHandler = self._start_namespace_declaration
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+        self._parser.CharacterDataHandler = self._characters
+        self._parser.EntityDeclHandler = self._forbid_entities
+
+    def feed(self, data: bytes | str, final: bool = False):
+        """Feed the next chunk of data into the parser."""
+        self._parser.Parse(data, final)
+
+    def close(self) -> dict | None:
+        """Finish parsing and return the parsed document."""
+        self._parser.Parse(b"", True)
+        return self._item
+
+    @staticmethod
+    def _forbid_entities(*_args, **_kwargs):
+        """Reject entity declarations."""
+        raise ValueError("entities are disabled")
+
+    def _build_name(self, full_name: str) -> str:
+        """Map the expanded name to its configured short name."""
+        name = self._names.get(full_name)
+        if name is None:
+            i = full_name.rfind(NAMESPACE_SEPARATOR)
+            if i == -1:
+                name = full_name
+            else:
+                namespace = full_name[:i]
+                short_namespace = self._namespaces.get(namespace, namespace)
+                name = (
+                    f"{short_namespace}{NAMESPACE_SEPARATOR}{full_name[i + 1 :]}"
+                    if short_namespace
+                    else full_name[i + 1 :]
+                )
+            self._names[full_name] = name
+        return name
+
+    def _start_namespace_declaration(self, prefix: str | None, uri: str):
+        """Record namespace declarations of the next element."""
+        self._namespace_declarations[prefix or ""] = uri
+
+    def _start_element(self, full_name: str, attributes: list[str]):
+        """Handle the start of an element."""
+        self._path.append(self._build_name(full_name))
+        self._stack.append((self._item, self._data))
+        item: dict | None = None
+        if attributes:
+            item = {
+                XML_ATTR_PREFIX + self._build_name(attributes[i]): attributes[i + 1]
+                for i in range(0, len(attributes), 2)
+            }
+        if self._namespace_declarations:
+            if item is None:
+                item = {}
+            item[XML_ATTR_PREFIX + XML_ATTR_XMLNS] = self._namespace_declarations
+            self._namespace_declarations = {}
+        self._item = item
+        self._data = []
+
+    def _end_element(self, full_name: str):
+        """Handle the end of an element."""
+        name = self._path[-1]
+        data: str | None = "".join(self._data).strip() if self._data else None
+        item = self._item
+        self._item, self._data = self._stack.pop()
+        if item is not None:
+            if data:
+                item = self._push_data(item, XML_CDATA, data)
+            value = item
+        else:
+            value = data or None
+        self._item = self._push_data(self._item, name, value)
+        if self._is_feed_item(name):
+            self._items += 1
+            check_item_count(self._items, self._max_items)
+            if self._item_callback:
+                self._item_callback(FeedItem(value))
+        self._path.pop()
+
+    def _characters(self, data: str):
+        """Collect character data of the current element."""
+        self._data.append(data)
+
+    def _push_data(self, item: dict | None, key: str, data) -> dict:
+        """Add the key and data to the item, converting types if required."""
+        if key in self._converted_keys:
+            key, data = self._postprocessor(self._path, key, data)
+        if item is None:
+            item = {}
+        if key in item:
+            value = item[key]
+            if isinstance(value, list):
+                value.append(data)
+            else:
+                item[key] = [value, data]
+        else:
+            item[key] = data
+        return item
+
+    def _is_feed_item(self, name: str) -> bool:
+        """Check if the current element is an item of an RSS or Atom feed."""
+        path = self._path
+        if name == XML_TAG_ITEM:
+            return (
+                len(path) == 3 and path[0] == XML_TAG_RSS and path[1] == XML_TAG_CHANNEL
+            )
+        if name == XML_TAG_ENTRY:
+            return len(path) == 2 and path[0] == XML_TAG_FEED
+        return False
@@ -0,0 +1,79 @@
+"""Benchmarks for aio_georss_client library."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import os
+import sys
+import time
+import timeit
+
+from aiohttp import web
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def load_fixtures() -> dict[str, str]:
+    """Load all XML fixtures of the test suite."""
+    fixtures: dict[str, str] = {}
+    for filename in sorted(os.listdir(FIXTURES_PATH)):
+        if filename.endswith(".xml"):
+            with open(os.path.join(FIXTURES_PATH, filename), encoding="utf-8") as fptr:
+                fixtures[filename] = fptr.read()
+    return fixtures
+
+
+def measure(func: Callable[[], object], number: int = 100, repeat: int = 5) -> float:
+    """Return the best time in seconds of a single call of the function."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def measure_with_setup(
+    setup: Callable[[], object],
+    func: Callable[[object], object],
+    number: int = 10,
+    repeat: int = 5,
+) -> float:
+    """Return the best time in seconds of a single call, excluding its setup."""
+    best: float | None = None
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(number):
+            value = setup()
+            start = time.perf_counter()
+            func(value)
+            total += time.perf_counter() - start
+        best = total if best is None else min(best, total)
+    return best / number
+
+
+@asynccontextmanager
+async def serve(
+    body: str, content_type: str = "application/rss+xml"
+) -> AsyncIterator[str]:
+    """Serve the body from a local HTTP server and yield its URL."""
+
+    async def handler(_request: web.Request) -> web.Response:
+        return web.Response(text=body, content_type=content_type)
+
+    app = web.Application()
+    app.router.add_get("/feed", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield f"http://127.0.0.1:{runner.addresses[0][1]}/feed"
+    finally:
+        await runner.cleanup()
+
+
+def report(headers: list[str], rows: list[list]):
+    """Write a simple table to stdout."""
+    table = [headers, *[[str(value) for value in row] for row in rows]]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for row in table:
+        sys.stdout.write(
+            "  ".join(value.ljust(widths[i]) for i, value in enumerate(row)) + "\n"
+        )
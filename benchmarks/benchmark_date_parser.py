@@ -0,0 +1,76 @@
+"""Benchmark parsing the dates found in the test fixtures.
+
+Run with: python -m benchmarks.benchmark_date_parser
+"""
+
+from __future__ import annotations
+
+import re
+
+import dateutil.parser
+
+from aio_georss_client.xml_parser import KEYS_DATE, XmlParser
+
+from . import load_fixtures, measure, report
+
+DATE_TAGS = re.compile(
+    "<({})>([^<]*)</".format("|".join(re.escape(key) for key in KEYS_DATE))
+)
+
+
+def _parse_dateutil(value: str):
+    """Parse the date with dateutil, or return the error type."""
+    try:
+        return dateutil.parser.parse(value)
+    except ValueError as error:
+        return type(error).__name__
+
+
+def _parse_fast(value: str):
+    """Parse the date with the fast path, or return the error type."""
+    try:
+        return XmlParser._parse_date(value)  # noqa: SLF001
+    except ValueError as error:
+        return type(error).__name__
+
+
+def main():
+    """Compare parity and speed of dateutil and the fast path."""
+    values = sorted(
+        {
+            match.group(2).strip()
+            for xml in load_fixtures().values()
+            for match in DATE_TAGS.finditer(xml)
+        }
+    )
+    rows = []
+    total_dateutil = total_fast = 0.0
+    for value in values:
+        parity = _parse_dateutil(value) == _parse_fast(value)
+        time_dateutil = measure(lambda value=value: _parse_dateutil(value), 1000)
+        time_fast = measure(lambda value=value: _parse_fast(value), 1000)
+        total_dateutil += time_dateutil
+        total_fast += time_fast
+        rows.append(
+            [
+                value,
+                parity,
+                f"{time_dateutil * 1e6:.2f}",
+                f"{time_fast * 1e6:.2f}",
+                f"{time_dateutil / time_fast:.1f}x",
+            ]
+        )
+    rows.append(
+        [
+            "all",
+            "",
+            f"{total_dateutil * 1e6:.2f}",
+            f"{total_fast * 1e6:.2f}",
+            f"{total_dateutil / total_fast:.1f}x",
+        ]
+    )
+    report(["date", "parity", "dateutil (us)", "fast path (us)", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
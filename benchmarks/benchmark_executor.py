@@ -0,0 +1,98 @@
+"""Benchmark the event loop latency while updating a large feed.
+
+Run with: python -m benchmarks.benchmark_executor
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import logging
+import time
+
+import aiohttp
+
+from tests import MockGeoRssFeed
+
+from . import report, serve
+from .feed_generator import generate_feed
+
+HOME_COORDINATES = (-31.0, 151.0)
+FILTER_RADIUS = 500.0
+ENTRIES = 20000
+TICK = 0.001
+UPDATES = 5
+
+
+class ExecutorGeoRssFeed(MockGeoRssFeed):
+    """GeoRSS feed parsing responses in the provided executor."""
+
+    def __init__(self, *args, executor: Executor | None, **kwargs):
+        """Initialise the feed."""
+        super().__init__(*args, **kwargs)
+        self._benchmark_executor = executor
+
+    def _executor(self) -> Executor | None:
+        """Define the executor parsing responses and creating entries."""
+        return self._benchmark_executor
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event):
+    """Record how late the event loop wakes up a periodic task."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _measure(url: str, executor: Executor | None) -> tuple[float, float]:
+    """Return the worst event loop lag and the mean update time in seconds."""
+    async with aiohttp.ClientSession() as websession:
+        feed = ExecutorGeoRssFeed(
+            websession,
+            HOME_COORDINATES,
+            url,
+            filter_radius=FILTER_RADIUS,
+            executor=executor,
+        )
+        # Warm up connection and executor workers.
+        await feed.update()
+        lags: list[float] = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(lags, stop))
+        await asyncio.sleep(TICK * 10)
+        start = time.perf_counter()
+        for _ in range(UPDATES):
+            await feed.update()
+        duration = (time.perf_counter() - start) / UPDATES
+        stop.set()
+        await ticker
+    return max(lags), duration
+
+
+async def _run():
+    """Serve a large feed locally and update it with different executors."""
+    rows = []
+    async with serve(generate_feed(ENTRIES)) as url:
+        for name, executor_class in (
+            ("inline", None),
+            ("thread pool", ThreadPoolExecutor),
+            ("process pool", ProcessPoolExecutor),
+        ):
+            if executor_class is None:
+                max_lag, duration = await _measure(url, None)
+            else:
+                with executor_class(max_workers=1) as executor:
+                    max_lag, duration = await _measure(url, executor)
+            rows.append([name, f"{max_lag * 1e3:.1f}", f"{duration * 1e3:.1f}"])
+    report(["executor", "max loop lag (ms)", "update (ms)"], rows)
+
+
+def main():
+    """Compare event loop latency with and without an executor."""
+    logging.disable(logging.WARNING)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the per-entry cost of feed entries.
+
+Run with: python -m benchmarks.benchmark_feed_entry
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import tracemalloc
+
+from aio_georss_client.xml_parser import XmlParser
+from tests import MockFeedEntry
+
+from . import load_fixtures, measure, report
+
+HOME_COORDINATES = (-31.0, 151.0)
+FILTER_RADIUS = 500.0
+
+
+def _poll(entries: list[MockFeedEntry]):
+    """Access entries the same way as a feed update and feed manager do."""
+    for entry in entries:
+        if entry.geometries and entry.distance_to_home <= FILTER_RADIUS:
+            _ = entry.external_id
+            _ = entry.coordinates
+            _ = entry.distance_to_home
+
+
+def _poll_recomputed(entries: list[MockFeedEntry]):
+    """Run the same access pattern, recomputing all values on every access."""
+    for entry in entries:
+        rss_entry = entry._rss_entry  # noqa: SLF001
+        for _ in range(2):
+            rss_entry._geometries = None  # noqa: SLF001
+            entry._create_geometries()  # noqa: SLF001
+        if entry._calculate_distance_to_home() <= FILTER_RADIUS:  # noqa: SLF001
+            for _ in range(3):
+                rss_entry._geometries = None  # noqa: SLF001
+                entry._create_geometries()  # noqa: SLF001
+            _ = entry._rss_entry.guid  # noqa: SLF001
+            entry._create_coordinates()  # noqa: SLF001
+            entry._calculate_distance_to_home()  # noqa: SLF001
+
+
+def main():
+    """Measure access time and memory per entry."""
+    logging.disable(logging.WARNING)
+    fixtures = load_fixtures()
+    rows = []
+    for filename in ("generic_feed_1.xml", "generic_feed_3.xml", "generic_feed_7.xml"):
+        feed = XmlParser().parse(fixtures[filename])
+
+        def create_entries(feed=feed) -> list[MockFeedEntry]:
+            """Create fresh entries from fresh feed items."""
+            return [MockFeedEntry(HOME_COORDINATES, item) for item in feed.entries]
+
+        time_cached = measure(lambda create=create_entries: _poll(create()))
+        time_recomputed = measure(
+            lambda create=create_entries: _poll_recomputed(create())
+        )
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+        entries = create_entries()
+        _poll(entries)
+        snapshot_after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        allocated = sum(
+            stat.size_diff
+            for stat in snapshot_after.compare_to(snapshot_before, "filename")
+        )
+        count = len(entries)
+        rows.append(
+            [
+                filename,
+                count,
+                f"{time_recomputed / count * 1e6:.1f}",
+                f"{time_cached / count * 1e6:.1f}",
+                f"{time_recomputed / time_cached:.2f}x",
+                sys.getsizeof(entries[0]),
+                allocated // count,
+            ]
+        )
+    report(
+        [
+            "fixture",
+            "entries",
+            "recomputed (us/entry)",
+            "memoised (us/entry)",
+            "speedup",
+            "entry size (bytes)",
+            "allocated (bytes/entry)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Benchmark the stages of a feed update on synthetic feeds.
+
+Run with: python -m benchmarks.benchmark_feed_update
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+
+import aiohttp
+
+from aio_georss_client.consts import UPDATE_OK
+from aio_georss_client.feed_entry import FeedEntry
+from aio_georss_client.feed_manager import FeedManagerBase
+from aio_georss_client.xml_parser import Feed, XmlParser
+from tests import MockFeedEntry, MockGeoRssFeed
+
+from . import measure_with_setup, report, serve
+from .feed_generator import (
+    DATE_FORMAT_ISO_8601,
+    DATE_FORMAT_OTHER,
+    DATE_FORMAT_RFC_822,
+    GEOMETRY_BBOX,
+    GEOMETRY_GEO_LAT_LONG,
+    GEOMETRY_POINT,
+    GEOMETRY_POLYGON,
+    GEOMETRY_POS_LIST,
+    GEOMETRY_TYPES,
+    generate_feed,
+)
+
+HOME_COORDINATES = (-33.0, 151.0)
+FILTER_RADIUS = 500.0
+SIZES = (100, 1000, 10000)
+# Feeds of each size, as keyword arguments of the feed generator.
+SCENARIOS = {
+    "rss points": {"geometries": (GEOMETRY_POINT,)},
+    "atom points": {
+        "atom": True,
+        "geometries": (GEOMETRY_POINT, GEOMETRY_GEO_LAT_LONG),
+        "date_format": DATE_FORMAT_ISO_8601,
+    },
+    "rss mixed": {
+        "geometries": GEOMETRY_TYPES,
+        "date_format": DATE_FORMAT_RFC_822,
+    },
+    "rss polygons": {
+        "geometries": (GEOMETRY_POLYGON, GEOMETRY_POS_LIST, GEOMETRY_BBOX),
+        "polygon_vertices": 64,
+    },
+    "rss dateutil": {"date_format": DATE_FORMAT_OTHER},
+}
+UPDATES = 5
+
+
+class PreparedGeoRssFeed(MockGeoRssFeed):
+    """Feed returning prepared lists of entries in turn."""
+
+    def __init__(self, entries: list[list[MockFeedEntry]]):
+        """Initialise the feed."""
+        super().__init__(None, HOME_COORDINATES, "http://127.0.0.1/feed")
+        self._entries = itertools.cycle(entries)
+
+    async def update(self) -> tuple[str, list[MockFeedEntry]]:
+        """Return the next list of entries."""
+        return UPDATE_OK, next(self._entries)
+
+
+def _create_entries(feed: Feed) -> list[MockFeedEntry]:
+    """Create fresh entries from fresh feed items."""
+    return [MockFeedEntry(HOME_COORDINATES, item) for item in feed.entries]
+
+
+def _create_entries_with_geometries(feed: Feed) -> list[MockFeedEntry]:
+    """Create fresh entries and their geometries."""
+    entries = _create_entries(feed)
+    for entry in entries:
+        _ = entry.geometries
+    return entries
+
+
+async def _ignore(_external_id: str) -> None:
+    """Ignore entity changes."""
+
+
+async def _measure_diff(feed: Feed, count: int) -> float:
+    """Return the mean time of a feed manager update replacing 10% of entries."""
+    entries = _create_entries(feed)
+    changed = count // 10
+    feed_manager = FeedManagerBase(
+        PreparedGeoRssFeed(
+            [entries[:count], entries[changed : count + changed]],
+        ),
+        _ignore,
+        _ignore,
+        _ignore,
+    )
+    await feed_manager.update()
+    start = time.perf_counter()
+    for _ in range(UPDATES * 2):
+        await feed_manager.update()
+    return (time.perf_counter() - start) / (UPDATES * 2)
+
+
+async def _measure_update(xml: str) -> float:
+    """Return the mean time of a full update from a local HTTP server."""
+    async with serve(xml) as url, aiohttp.ClientSession() as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES, url, filter_radius=FILTER_RADIUS
+        )
+        # Warm up the connection.
+        await feed.update()
+        start = time.perf_counter()
+        for _ in range(UPDATES):
+            await feed.update()
+        return (time.perf_counter() - start) / UPDATES
+
+
+def main():
+    """Measure parse, entries, filter, distance, diff and update per feed."""
+    logging.disable(logging.WARNING)
+    parser = XmlParser()
+    rows = []
+    for scenario, options in SCENARIOS.items():
+        for count in SIZES:
+            number = max(1, 1000 // count)
+            xml = generate_feed(count, **options)
+            # Extra entries replace the first ones when diffing.
+            diff_feed = parser.parse(generate_feed(count + count // 10, **options))
+            feed = parser.parse(xml)
+            geo_rss_feed = MockGeoRssFeed(
+                None, HOME_COORDINATES, "", filter_radius=FILTER_RADIUS
+            )
+            time_parse = measure_with_setup(
+                lambda xml=xml: xml, parser.parse, number=number, repeat=3
+            )
+            time_entries = measure_with_setup(
+                lambda feed=feed: feed,
+                _create_entries_with_geometries,
+                number=number,
+                repeat=3,
+            )
+            time_filter = measure_with_setup(
+                lambda feed=feed: _create_entries_with_geometries(feed),
+                geo_rss_feed._filter_entries,  # noqa: SLF001
+                number=number,
+                repeat=3,
+            )
+            time_distance = measure_with_setup(
+                lambda feed=feed: _create_entries_with_geometries(feed),
+                FeedEntry.calculate_distances_to_home,
+                number=number,
+                repeat=3,
+            )
+            time_diff = asyncio.run(_measure_diff(diff_feed, count))
+            time_update = asyncio.run(_measure_update(xml))
+            rows.append(
+                [
+                    scenario,
+                    count,
+                    f"{len(xml) / 1024:.0f}",
+                    *(
+                        f"{duration * 1e3:.2f}"
+                        for duration in (
+                            time_parse,
+                            time_entries,
+                            time_filter,
+                            time_distance,
+                            time_diff,
+                            time_update,
+                        )
+                    ),
+                ]
+            )
+    report(
+        [
+            "scenario",
+            "items",
+            "size (KiB)",
+            "parse (ms)",
+            "entries (ms)",
+            "filter (ms)",
+            "distance (ms)",
+            "diff (ms)",
+            "update (ms)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
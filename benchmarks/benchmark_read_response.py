@@ -0,0 +1,78 @@
+"""Benchmark parsing response bodies as bytes instead of decoded text.
+
+Run with: python -m benchmarks.benchmark_read_response
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import tracemalloc
+
+from aio_georss_client.consts import PARSER_BACKEND_EXPAT, PARSER_BACKEND_XMLTODICT
+from aio_georss_client.xml_parser import XmlParser
+from aio_georss_client.xml_parser.encoding import detect_encoding
+
+from . import measure, report
+from .feed_generator import GEOMETRY_TYPES, generate_feed
+
+SIZES = (1000, 10000, 50000)
+
+
+def _parse_text(parser: XmlParser, body: bytes) -> dict | None:
+    """Decode the body first, like the response text, and parse the text."""
+    return parser.parse_to_dict(body.decode("utf-8"))
+
+
+def _parse_bytes(parser: XmlParser, body: bytes) -> dict | None:
+    """Detect the encoding and parse the body as is."""
+    encoding, _ = detect_encoding(body, None)
+    return parser.parse_to_dict(body, encoding)
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak memory (bytes) allocated while calling the function."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    """Compare time and peak memory of parsing text and bytes."""
+    logging.disable(logging.WARNING)
+    rows = []
+    for backend in (PARSER_BACKEND_XMLTODICT, PARSER_BACKEND_EXPAT):
+        parser = XmlParser(backend=backend)
+        for count in SIZES:
+            body = generate_feed(count, geometries=GEOMETRY_TYPES).encode("utf-8")
+            number = max(1, 1000 // count)
+            for name, parse in (("text", _parse_text), ("bytes", _parse_bytes)):
+                duration = measure(
+                    lambda parse=parse, parser=parser, body=body: parse(parser, body),
+                    number=number,
+                    repeat=3,
+                )
+                peak = _peak_memory(
+                    lambda parse=parse, parser=parser, body=body: parse(parser, body)
+                )
+                rows.append(
+                    [
+                        backend,
+                        count,
+                        f"{len(body) / 1024:.0f}",
+                        name,
+                        f"{duration * 1e3:.1f}",
+                        f"{peak / 1024 / 1024:.1f}",
+                    ]
+                )
+    report(
+        ["backend", "items", "size (KiB)", "input", "parse (ms)", "peak (MiB)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
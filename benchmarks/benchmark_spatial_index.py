@@ -0,0 +1,121 @@
+"""Benchmark the spatial index against a linear scan over all entries.
+
+Run with: python -m benchmarks.benchmark_spatial_index
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from aio_georss_client.spatial_index import SpatialIndex
+from aio_georss_client.xml_parser.geometry import BoundingBox, Point, Polygon
+from tests import MockFeedEntry, MockFeedItem
+
+from . import measure, report
+
+ENTRY_COUNTS = (1000, 10000, 100000)
+QUERY_COUNT = 20
+QUERY_RADIUS = 50.0
+
+
+def _create_entries(count: int, generator: random.Random) -> dict[str, MockFeedEntry]:
+    """Create points and small polygons spread over Australia."""
+    entries: dict[str, MockFeedEntry] = {}
+    for i in range(count):
+        latitude = generator.uniform(-43.0, -11.0)
+        longitude = generator.uniform(113.0, 153.0)
+        if i % 4:
+            geometry = Point(latitude, longitude)
+        else:
+            geometry = Polygon.from_coordinates(
+                (
+                    latitude,
+                    longitude,
+                    latitude,
+                    longitude + 0.1,
+                    latitude + 0.1,
+                    longitude + 0.1,
+                    latitude,
+                    longitude,
+                )
+            )
+        entries[str(i)] = MockFeedEntry(None, MockFeedItem(None, [geometry]))
+    return entries
+
+
+def main():
+    """Compare query times of the spatial index and the linear scan."""
+    generator = random.Random(42)
+    rows = []
+    for count in ENTRY_COUNTS:
+        entries = _create_entries(count, generator)
+        queries = [
+            (generator.uniform(-43.0, -11.0), generator.uniform(113.0, 153.0))
+            for _ in range(QUERY_COUNT)
+        ]
+        start = time.perf_counter()
+        spatial_index = SpatialIndex()
+        spatial_index.update(entries)
+        build_time = time.perf_counter() - start
+        parity = all(
+            spatial_index.entries_within_radius(coordinates, QUERY_RADIUS)
+            == SpatialIndex.filter_within_radius(
+                entries.values(), coordinates, QUERY_RADIUS
+            )
+            for coordinates in queries
+        )
+        number = max(1, 10000 // count)
+
+        def query_index(index=spatial_index, queries=queries):
+            """Run all radius and bounding box queries against the index."""
+            for latitude, longitude in queries:
+                index.entries_within_radius((latitude, longitude), QUERY_RADIUS)
+                index.entries_within_bounding_box(
+                    BoundingBox(
+                        Point(latitude, longitude),
+                        Point(latitude + 0.5, longitude + 0.5),
+                    )
+                )
+
+        def query_linear(entries=entries, queries=queries):
+            """Run all radius and bounding box queries with a linear scan."""
+            for latitude, longitude in queries:
+                SpatialIndex.filter_within_radius(
+                    entries.values(), (latitude, longitude), QUERY_RADIUS
+                )
+                SpatialIndex.filter_within_bounding_box(
+                    entries.values(),
+                    BoundingBox(
+                        Point(latitude, longitude),
+                        Point(latitude + 0.5, longitude + 0.5),
+                    ),
+                )
+
+        time_index = measure(query_index, number=number, repeat=3) / QUERY_COUNT
+        time_linear = measure(query_linear, number=1, repeat=3) / QUERY_COUNT
+        rows.append(
+            [
+                count,
+                parity,
+                f"{build_time * 1e3:.1f}",
+                f"{time_linear * 1e3:.3f}",
+                f"{time_index * 1e3:.3f}",
+                f"{time_linear / time_index:.1f}x",
+            ]
+        )
+    report(
+        [
+            "entries",
+            "parity",
+            "index build (ms)",
+            "linear scan (ms/query)",
+            "index (ms/query)",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
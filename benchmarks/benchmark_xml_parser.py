@@ -0,0 +1,65 @@
+"""Benchmark the XML parser backends.
+
+Run with: python -m benchmarks.benchmark_xml_parser
+"""
+
+from __future__ import annotations
+
+import logging
+
+import xmltodict
+
+from aio_georss_client.consts import PARSER_BACKEND_EXPAT, PARSER_BACKEND_XMLTODICT
+from aio_georss_client.xml_parser import DEFAULT_NAMESPACES, XmlParser
+
+from . import load_fixtures, measure, report
+
+
+def _parse_xmltodict(xml: str) -> dict:
+    """Parse the document into a dict with xmltodict."""
+    return xmltodict.parse(
+        xml,
+        process_namespaces=True,
+        namespaces=DEFAULT_NAMESPACES,
+        postprocessor=XmlParser.postprocessor,
+    )
+
+
+def _parse_expat(xml: str) -> dict:
+    """Parse the document into a dict with the streaming parser."""
+    streaming_parser = XmlParser().streaming_parser(encoding="utf-8")
+    streaming_parser.feed(xml.encode("utf-8"))
+    return streaming_parser.close()
+
+
+def main():
+    """Compare parity and speed of both backends on all fixtures."""
+    # Some fixtures deliberately contain invalid values.
+    logging.disable(logging.WARNING)
+    xmltodict_parser = XmlParser(backend=PARSER_BACKEND_XMLTODICT)
+    expat_parser = XmlParser(backend=PARSER_BACKEND_EXPAT)
+    rows = []
+    for filename, xml in load_fixtures().items():
+        try:
+            parity = _parse_xmltodict(xml) == _parse_expat(xml)
+        except Exception as error:  # noqa: BLE001
+            # Both backends are expected to reject the same documents.
+            parity = type(error).__name__
+            rows.append([filename, parity, "-", "-", "-"])
+            continue
+        time_xmltodict = measure(lambda xml=xml: xmltodict_parser.parse(xml))
+        time_expat = measure(lambda xml=xml: expat_parser.parse(xml))
+        rows.append(
+            [
+                filename,
+                parity,
+                f"{time_xmltodict * 1e6:.1f}",
+                f"{time_expat * 1e6:.1f}",
+                f"{time_xmltodict / time_expat:.2f}x",
+            ]
+        )
+    report(["fixture", "parity", "xmltodict (us)", "expat (us)", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Generator of synthetic GeoRSS feeds for benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import datetime
+import math
+import random
+
+GEOMETRY_POINT = "point"
+GEOMETRY_POLYGON = "polygon"
+GEOMETRY_POS_LIST = "pos_list"
+GEOMETRY_BBOX = "bbox"
+GEOMETRY_GEO_LAT_LONG = "geo_lat_long"
+GEOMETRY_TYPES = (
+    GEOMETRY_POINT,
+    GEOMETRY_POLYGON,
+    GEOMETRY_POS_LIST,
+    GEOMETRY_BBOX,
+    GEOMETRY_GEO_LAT_LONG,
+)
+
+DATE_FORMAT_RFC_822 = "rfc822"
+DATE_FORMAT_ISO_8601 = "iso8601"
+# Only parsed by dateutil.
+DATE_FORMAT_OTHER = "other"
+DATE_FORMATS = {
+    DATE_FORMAT_RFC_822: "%a, %d %b %Y %H:%M:%S GMT",
+    DATE_FORMAT_ISO_8601: "%Y-%m-%dT%H:%M:%S+00:00",
+    DATE_FORMAT_OTHER: "%B %d, %Y %H:%M",
+}
+
+NAMESPACES = (
+    'xmlns:georss="http://www.georss.org/georss" '
+    'xmlns:gml="http://www.opengis.net/gml" '
+    'xmlns:geo="http://www.w3.org/2003/01/geo/wgs84_pos#" '
+    'xmlns:gdacs="http://www.gdacs.org"'
+)
+START_DATE = datetime.datetime(2018, 12, 9, 7, 30, tzinfo=datetime.UTC)
+
+
+def generate_feed(
+    count: int,
+    *,
+    atom: bool = False,
+    geometries: Sequence[str] = (GEOMETRY_POINT,),
+    polygon_vertices: int = 8,
+    date_format: str = DATE_FORMAT_RFC_822,
+    center: tuple[float, float] = (-33.0, 151.0),
+    spread: float = 10.0,
+    seed: int = 0,
+) -> str:
+    """Generate an RSS or Atom feed with the given number of items.
+
+    The geometry types are assigned to the items in turn, so that for example
+    (GEOMETRY_POINT, GEOMETRY_POINT, GEOMETRY_POLYGON) produces two points
+    for every polygon. Items are placed randomly within the spread (degrees)
+    around the center, and the output is reproducible for the same seed.
+    """
+    rng = random.Random(seed)
+    date_pattern = DATE_FORMATS[date_format]
+    items = []
+    for i in range(count):
+        latitude = center[0] + rng.uniform(-spread, spread)
+        longitude = center[1] + rng.uniform(-spread, spread)
+        geometry = _geometry(
+            geometries[i % len(geometries)],
+            latitude,
+            longitude,
+            polygon_vertices,
+            rng.uniform(0.05, 0.5),
+        )
+        date = (START_DATE + datetime.timedelta(minutes=i)).strftime(date_pattern)
+        if atom:
+            items.append(
+                f"<entry><id>{i}</id><title>Title {i}</title>"
+                f'<category term="Category {i % 7}"/>'
+                f"<summary>Description {i}</summary>"
+                f"<published>{date}</published><updated>{date}</updated>"
+                f"{geometry}</entry>"
+            )
+        else:
+            items.append(
+                f"<item><guid>{i}</guid><title>Title {i}</title>"
+                f"<category>Category {i % 7}</category>"
+                f"<description>Description {i}</description>"
+                f"<pubDate>{date}</pubDate>{geometry}</item>"
+            )
+    if atom:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<feed xmlns="http://www.w3.org/2005/Atom" {NAMESPACES}>'
+            f"<title>Synthetic Feed</title>{''.join(items)}</feed>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0" {NAMESPACES}><channel>'
+        f"<title>Synthetic Feed</title><ttl>5</ttl>{''.join(items)}"
+        "</channel></rss>"
+    )
+
+
+def _geometry(
+    geometry_type: str,
+    latitude: float,
+    longitude: float,
+    vertices: int,
+    radius: float,
+) -> str:
+    """Return the XML of a geometry of the given type."""
+    if geometry_type == GEOMETRY_POINT:
+        return f"<georss:point>{latitude:.5f} {longitude:.5f}</georss:point>"
+    if geometry_type == GEOMETRY_GEO_LAT_LONG:
+        return f"<geo:lat>{latitude:.5f}</geo:lat><geo:long>{longitude:.5f}</geo:long>"
+    if geometry_type == GEOMETRY_BBOX:
+        # Longitudes first: lonmin lonmax latmin latmax.
+        return (
+            f"<gdacs:bbox>{longitude - radius:.5f} {longitude + radius:.5f} "
+            f"{latitude - radius:.5f} {latitude + radius:.5f}</gdacs:bbox>"
+        )
+    # Closed ring around the location.
+    ring = [
+        (
+            latitude + radius * math.sin(2 * math.pi * j / vertices),
+            longitude + radius * math.cos(2 * math.pi * j / vertices),
+        )
+        for j in range(vertices)
+    ]
+    ring.append(ring[0])
+    coordinates = " ".join(f"{lat:.5f} {lon:.5f}" for lat, lon in ring)
+    if geometry_type == GEOMETRY_POLYGON:
+        return f"<georss:polygon>{coordinates}</georss:polygon>"
+    if geometry_type == GEOMETRY_POS_LIST:
+        return (
+            "<georss:where><gml:Polygon><gml:exterior><gml:LinearRing>"
+            f"<gml:posList>{coordinates}</gml:posList>"
+            "</gml:LinearRing></gml:exterior></gml:Polygon></georss:where>"
+        )
+    raise ValueError(f"Unsupported geometry type: {geometry_type}")
@@ -6,6 +6,7 @@ from typing import Final
 
 from aio_georss_client.feed import GeoRssFeed
 from aio_georss_client.feed_entry import DEFAULT_FEATURES, FeedEntry
+from aio_georss_client.multi_home_feed import MultiHomeGeoRssFeed
 from aio_georss_client.xml_parser.feed_item import FeedItem
 from aio_georss_client.xml_parser.geometry import Geometry
 
@@ -15,6 +16,8 @@ MOCK_HOME_COORDINATES: Final = (0.0, 0.0)
 class MockFeedEntry(FeedEntry):
     """Generic feed entry."""
 
+    __slots__ = ()
+
     @property
     def attribution(self) -> str | None:
         """Return attribution."""
@@ -34,9 +37,19 @@ class MockGeoRssFeed(GeoRssFeed[MockFeedEntry]):
         return MockFeedEntry(home_coordinates, rss_entry)
 
 
+class MockUnchangedDetectingGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed detecting unchanged responses."""
+
+    def _detect_unchanged_response(self) -> bool:
+        """Define whether to skip processing an unchanged response."""
+        return True
+
+
 class MockSimpleFeedEntry(FeedEntry):
     """Mock feed entry."""
 
+    __slots__ = ("_features",)
+
     def __init__(
         self,
         home_coordinates: tuple[float, float] | None,
@@ -61,6 +74,8 @@ class MockSimpleFeedEntry(FeedEntry):
 class MockFeedItem(FeedItem):
     """Mock feed item."""
 
+    __slots__ = ()
+
     def __init__(self, source: dict | None, geometries: list[Geometry] | None):
         """Initialise feed item."""
         super().__init__(source)
@@ -70,3 +85,20 @@ class MockFeedItem(FeedItem):
     def geometries(self) -> list[Geometry] | None:
         """Return geometries."""
         return self._geometries
+
+
+class MockMultiHomeGeoRssFeed(MultiHomeGeoRssFeed[MockFeedEntry]):
+    """Mock GeoRSS feed for multiple home locations."""
+
+    def _new_entry(
+        self,
+        home_coordinates: tuple[float, float],
+        rss_entry: FeedItem,
+        global_data: dict,
+    ) -> MockFeedEntry:
+        """Generate a new entry."""
+        return MockFeedEntry(home_coordinates, rss_entry)
+
+    def _detect_unchanged_response(self) -> bool:
+        """Define whether to skip processing an unchanged response."""
+        return True
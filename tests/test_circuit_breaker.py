@@ -0,0 +1,65 @@
+"""Test for the circuit breaker."""
+
+import pytest
+
+from aio_georss_client.circuit_breaker import CircuitBreaker
+from aio_georss_client.exceptions import GeoRssException
+
+
+class FakeClock:
+    """Clock advanced manually."""
+
+    def __init__(self):
+        """Initialise the clock."""
+        self.time = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.time
+
+
+def test_circuit_breaker():
+    """Test suspending and resuming requests to a failing host."""
+    clock = FakeClock()
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60.0, clock=clock
+    )
+    url = "http://test.url/testpath"
+    assert circuit_breaker.allow(url)
+    circuit_breaker.record_failure(url)
+    assert circuit_breaker.allow(url)
+    circuit_breaker.record_failure(url)
+    assert circuit_breaker.is_open(url)
+    assert not circuit_breaker.allow(url)
+    assert not circuit_breaker.allow("http://test.url/otherpath")
+    # Other hosts are not affected.
+    assert circuit_breaker.allow("http://other.url/testpath")
+    assert circuit_breaker.open_hosts == ["test.url"]
+    assert repr(circuit_breaker) == "<CircuitBreaker(open=1)>"
+
+    # A single trial request is let through after the timeout.
+    clock.time = 1060.0
+    assert circuit_breaker.allow(url)
+    assert not circuit_breaker.allow(url)
+    circuit_breaker.record_failure(url)
+    clock.time = 1119.0
+    assert not circuit_breaker.allow(url)
+
+    clock.time = 1120.0
+    assert circuit_breaker.allow(url)
+    circuit_breaker.record_success(url)
+    assert not circuit_breaker.is_open(url)
+    assert circuit_breaker.allow(url)
+    assert circuit_breaker.open_hosts == []
+
+    # Failures only count while consecutive.
+    circuit_breaker.record_failure(url)
+    circuit_breaker.record_success(url)
+    circuit_breaker.record_failure(url)
+    assert circuit_breaker.allow(url)
+
+
+def test_invalid_failure_threshold():
+    """Test creating a circuit breaker without failure threshold."""
+    with pytest.raises(GeoRssException):
+        CircuitBreaker(failure_threshold=0)
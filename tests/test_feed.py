@@ -1,23 +1,160 @@
 """Tests for base classes."""
 
 import asyncio
+import codecs
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
+import gzip
 from http import HTTPStatus
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aiohttp import ClientOSError
 import pytest
 
-from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_georss_client.circuit_breaker import CircuitBreaker
+from aio_georss_client.consts import (
+    METRIC_COUNT_BYTES,
+    METRIC_COUNT_WIRE_BYTES,
+    PARSER_BACKEND_EXPAT,
+    UPDATE_ERROR,
+    UPDATE_ERROR_LIMIT_EXCEEDED,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from aio_georss_client.feed import SUPPORTED_CONTENT_ENCODINGS
+from aio_georss_client.retry_policy import RetryPolicy
 from aio_georss_client.xml_parser.geometry import BoundingBox, Point, Polygon
-from tests import MockGeoRssFeed
+from tests import MockGeoRssFeed, MockUnchangedDetectingGeoRssFeed
 from tests.utils import load_fixture
 
 HOME_COORDINATES_1 = (-31.0, 151.0)
 HOME_COORDINATES_2 = (-37.0, 150.0)
 
 
+class MockExpatGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed using the expat parser backend."""
+
+    def _parser_backend(self) -> str:
+        """Define the XML parser backend."""
+        return PARSER_BACKEND_EXPAT
+
+
+class MockStreamingGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed parsing the response while downloading it."""
+
+    def _streaming_response(self) -> bool:
+        """Define whether to parse the response while downloading it."""
+        return True
+
+
+class MockLazyGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed converting dates and coordinates on first access."""
+
+    def _lazy_conversion(self) -> bool:
+        """Define whether to convert dates and coordinates on first access."""
+        return True
+
+
+class MockExecutorGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed parsing responses in an executor."""
+
+    def __init__(self, *args, executor: Executor, **kwargs):
+        """Initialise the mock feed."""
+        super().__init__(*args, **kwargs)
+        self._mock_executor = executor
+
+    def _executor(self) -> Executor:
+        """Define the executor parsing responses and creating entries."""
+        return self._mock_executor
+
+
+class MockStreamingUnchangedDetectingGeoRssFeed(MockUnchangedDetectingGeoRssFeed):
+    """Mock GeoRSS feed streaming and detecting unchanged responses."""
+
+    def _streaming_response(self) -> bool:
+        """Define whether to parse the response while downloading it."""
+        return True
+
+
+class MockCompressedGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed measuring compressed responses."""
+
+    def __init__(self, *args, streaming: bool, **kwargs):
+        """Initialise the mock feed."""
+        super().__init__(*args, **kwargs)
+        self._streaming = streaming
+
+    def _streaming_response(self) -> bool:
+        """Define whether to parse the response while downloading it."""
+        return self._streaming
+
+    def _collect_metrics(self) -> bool:
+        """Define whether to measure the stages of each update."""
+        return True
+
+
+class MockLimitedGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed limiting the size of responses."""
+
+    def __init__(
+        self,
+        *args,
+        streaming: bool,
+        max_response_size: int | None = None,
+        max_items: int | None = None,
+        max_polygon_vertices: int | None = None,
+        **kwargs,
+    ):
+        """Initialise the mock feed."""
+        super().__init__(*args, **kwargs)
+        self._streaming = streaming
+        self._mock_max_response_size = max_response_size
+        self._mock_max_items = max_items
+        self._mock_max_polygon_vertices = max_polygon_vertices
+
+    def _streaming_response(self) -> bool:
+        """Define whether to parse the response while downloading it."""
+        return self._streaming
+
+    def _max_response_size(self) -> int | None:
+        """Define the maximum size (bytes) of the decompressed response."""
+        return self._mock_max_response_size
+
+    def _max_items(self) -> int | None:
+        """Define the maximum number of items in the feed."""
+        return self._mock_max_items
+
+    def _max_polygon_vertices(self) -> int | None:
+        """Define the maximum number of vertices of a polygon."""
+        return self._mock_max_polygon_vertices
+
+
+class MockRetryingGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed retrying failed requests."""
+
+    def __init__(
+        self,
+        *args,
+        retry_policy: RetryPolicy | None,
+        circuit_breaker: CircuitBreaker | None,
+        **kwargs,
+    ):
+        """Initialise the mock feed."""
+        super().__init__(*args, **kwargs)
+        self._mock_retry_policy = retry_policy
+        self._mock_circuit_breaker = circuit_breaker
+
+    def _retry_policy(self) -> RetryPolicy | None:
+        """Define how to retry requests failing with transient errors."""
+        return self._mock_retry_policy
+
+    def _circuit_breaker(self) -> CircuitBreaker | None:
+        """Define the circuit breaker suspending requests to failing hosts."""
+        return self._mock_circuit_breaker
+
+
 @pytest.mark.asyncio
 async def test_update_ok(mock_aiointercept):
     """Test updating feed is ok."""
@@ -71,6 +208,32 @@ async def test_update_ok(mock_aiointercept):
         assert feed_entry.external_id == "5678"
 
 
+@pytest.mark.asyncio
+async def test_update_ok_expat_backend(mock_aiointercept):
+    """Test updating feed with the expat parser backend is ok."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockExpatGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 5
+
+        feed_entry = entries[0]
+        assert feed_entry.title == "Title 1"
+        assert feed_entry.external_id == "1234"
+        assert feed_entry.published == datetime.datetime(2018, 9, 23, 8, 30)
+        assert feed_entry.coordinates == (-37.2345, 149.1234)
+        assert round(abs(feed_entry.distance_to_home - 714.4), 1) == 0
+
+
 @pytest.mark.asyncio
 async def test_update_ok_feed_2(mock_aiointercept):
     """Test updating feed is ok."""
@@ -299,6 +462,43 @@ async def test_update_ok_with_radius_filtering(mock_aiointercept):
         assert round(abs(entries[2].distance_to_home - 84.6), 1) == 0
 
 
+@pytest.mark.asyncio
+async def test_update_ok_with_radius_filtering_lazy_conversion(mock_aiointercept):
+    """Test that values of filtered out entries are not converted."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockLazyGeoRssFeed(
+            websession,
+            HOME_COORDINATES_2,
+            "http://test.url/testpath",
+            filter_radius=90.0,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 4
+        assert round(abs(entries[0].distance_to_home - 82.0), 1) == 0
+        assert entries[0].published == datetime.datetime(2018, 9, 23, 8, 30)
+        assert [entry.updated for entry in entries] == [
+            datetime.datetime(2018, 9, 23, 8, 35),
+            datetime.datetime(2018, 9, 23, 8, 45),
+            datetime.datetime(2018, 9, 23, 8, 55),
+            datetime.datetime(2018, 9, 23, 9, 15),
+        ]
+        # Dates of filtered out entries have not been converted.
+        unconverted = [
+            item.category
+            for item in feed.feed_data.entries
+            if not item._source["updated"].converted  # noqa: SLF001
+        ]
+        assert unconverted == [["Category 4"], ["Category 6"]]
+
+
 @pytest.mark.asyncio
 async def test_update_ok_with_radius_and_category_filtering(mock_aiointercept):
     """Test updating feed is ok."""
@@ -488,3 +688,656 @@ async def test_update_not_xml(mock_aiointercept):
         status, entries = await feed.update()
         assert status == UPDATE_OK_NO_DATA
         assert entries is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_update_ok_executor(mock_aiointercept, executor_class):
+    """Test updating feed with parsing offloaded to an executor."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        with executor_class(max_workers=1) as executor:
+            feed = MockExecutorGeoRssFeed(
+                websession,
+                HOME_COORDINATES_2,
+                "http://test.url/testpath",
+                filter_radius=90.0,
+                executor=executor,
+            )
+            status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 4
+        feed_entry = entries[0]
+        assert feed_entry.title == "Title 1"
+        assert feed_entry.external_id == "1234"
+        assert feed_entry.published == datetime.datetime(2018, 9, 23, 8, 30)
+        assert feed_entry.coordinates == (-37.2345, 149.1234)
+        assert round(abs(feed_entry.distance_to_home - 82.0), 1) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_update_not_xml_executor(mock_aiointercept, executor_class):
+    """Test updating feed where the payload parsed in an executor is not XML."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body="\x00\x00\x00",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        with executor_class(max_workers=1) as executor:
+            feed = MockExecutorGeoRssFeed(
+                websession,
+                HOME_COORDINATES_1,
+                "http://test.url/testpath",
+                executor=executor,
+            )
+            status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_ok_streaming(mock_aiointercept):
+    """Test updating feed while streaming the response is ok."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 5
+
+        feed_entry = entries[0]
+        assert feed_entry.title == "Title 1"
+        assert feed_entry.external_id == "1234"
+        assert feed_entry.published == datetime.datetime(2018, 9, 23, 8, 30)
+        assert feed_entry.coordinates == (-37.2345, 149.1234)
+        assert feed.last_timestamp == datetime.datetime(2018, 9, 23, 9, 10)
+
+
+@pytest.mark.asyncio
+async def test_update_streaming_bom(mock_aiointercept):
+    """Test updating feed with BOM while streaming the response is ok."""
+    xml = (
+        "\xef\xbb\xbf<?xml version='1.0' encoding='utf-8'?>"
+        "<rss version='2.0'><channel><item><title>Title 1</title>"
+        "</item></channel></rss>"
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=xml.encode("iso-8859-1"),
+        headers={"Content-Type": "application/xml; charset=utf-8"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_streaming_chunked(mock_aiointercept):
+    """Test updating feed from a chunked response while streaming."""
+    xml = load_fixture("generic_feed_1.xml").encode("utf-8")
+
+    async def chunks():
+        """Return the response in chunks of varying sizes."""
+        yield codecs.BOM_UTF8[:1]
+        yield codecs.BOM_UTF8[1:]
+        for i in range(0, len(xml), 100):
+            yield xml[i : i + 100]
+
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=chunks(),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert len(entries) == 5
+
+
+@pytest.mark.asyncio
+async def test_update_streaming_charset(mock_aiointercept):
+    """Test updating feed with non-UTF-8 charset while streaming the response."""
+    xml = (
+        "<rss version='2.0'><channel><title>Gr\u00fc\u00dfe \u20ac</title>"
+        "<item><title>Title 1</title></item></channel></rss>"
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=xml.encode("cp1252"),
+        headers={"Content-Type": "application/rss+xml; charset=windows-1252"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert feed.feed_data.title == "Gr\u00fc\u00dfe \u20ac"
+
+
+@pytest.mark.asyncio
+async def test_update_streaming_empty(mock_aiointercept):
+    """Test updating feed with empty response while streaming."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body="",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_streaming_not_xml(mock_aiointercept):
+    """Test updating feed where streamed payload is not XML."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body="\x00\x00\x00",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_conditional_request(mock_aiointercept):
+    """Test that validators are sent and a 304 response is not parsed."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        headers={
+            "ETag": '"abc123"',
+            "Last-Modified": "Sun, 23 Sep 2018 09:30:00 GMT",
+        },
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        assert feed.etag == '"abc123"'
+        assert feed.last_modified == "Sun, 23 Sep 2018 09:30:00 GMT"
+
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.NOT_MODIFIED,
+        )
+        status, entries = await feed.update()
+        mock_aiointercept.assert_called_with(
+            "http://test.url/testpath",
+            headers={
+                "If-None-Match": '"abc123"',
+                "If-Modified-Since": "Sun, 23 Sep 2018 09:30:00 GMT",
+            },
+        )
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+        assert feed.etag == '"abc123"'
+        assert feed.last_timestamp is not None
+
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert feed.etag is None
+        assert feed.last_modified is None
+
+
+@pytest.mark.asyncio
+async def test_update_conditional_request_parse_error(mock_aiointercept):
+    """Test that validators of a response that can't be parsed are ignored."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body="\x00\x00\x00",
+        headers={"ETag": '"abc123"'},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert feed.etag is None
+
+
+@pytest.mark.parametrize(
+    "feed_class",
+    [MockUnchangedDetectingGeoRssFeed, MockStreamingUnchangedDetectingGeoRssFeed],
+)
+@pytest.mark.asyncio
+async def test_update_unchanged(mock_aiointercept, feed_class):
+    """Test that an identical response is not processed again."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        repeat=2,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = feed_class(websession, HOME_COORDINATES_1, "http://test.url/testpath")
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+
+        with patch.object(feed, "_new_entry") as mock_new_entry:
+            status, unchanged_entries = await feed.update()
+            assert status == UPDATE_OK_UNCHANGED
+            assert unchanged_entries is entries
+            mock_new_entry.assert_not_called()
+
+        # A different response is processed again.
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_4.xml"),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 3
+
+        # After an error the same response is processed again.
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_4.xml"),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming", [False, True])
+async def test_update_compressed(mock_aiointercept, streaming):
+    """Test negotiating and measuring a compressed response."""
+    body = load_fixture("generic_feed_1.xml").encode("utf-8")
+    compressed_body = gzip.compress(body)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=compressed_body,
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockCompressedGeoRssFeed(
+            websession,
+            HOME_COORDINATES_1,
+            "http://test.url/testpath",
+            streaming=streaming,
+        )
+        status, entries = await feed.update()
+        mock_aiointercept.assert_called_with(
+            "http://test.url/testpath",
+            headers={"Accept-Encoding": SUPPORTED_CONTENT_ENCODINGS},
+        )
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        assert "gzip" in SUPPORTED_CONTENT_ENCODINGS
+        assert feed.metrics.counts[METRIC_COUNT_BYTES] == len(body)
+        assert feed.metrics.counts[METRIC_COUNT_WIRE_BYTES] == len(compressed_body)
+        assert len(compressed_body) < len(body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize(
+    ("limits", "expected_status"),
+    [
+        (
+            {"max_response_size": 100000, "max_items": 5, "max_polygon_vertices": 60},
+            UPDATE_OK,
+        ),
+        ({"max_response_size": 1000}, UPDATE_ERROR_LIMIT_EXCEEDED),
+        ({"max_items": 4}, UPDATE_ERROR_LIMIT_EXCEEDED),
+        ({"max_polygon_vertices": 20}, UPDATE_ERROR_LIMIT_EXCEEDED),
+    ],
+)
+async def test_update_limits(mock_aiointercept, streaming, limits, expected_status):
+    """Test rejecting responses exceeding the limits."""
+    for _ in range(2):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_3.xml"),
+            headers={"ETag": "etag-1"},
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockLimitedGeoRssFeed(
+            websession,
+            HOME_COORDINATES_1,
+            "http://test.url/testpath",
+            streaming=streaming,
+            **limits,
+        )
+        status, entries = await feed.update()
+        assert status == expected_status
+        if expected_status == UPDATE_OK:
+            assert feed.etag == "etag-1"
+            assert entries is not None
+        else:
+            assert entries is None
+            assert feed.etag is None
+            # Limits apply to each update.
+            status, entries = await feed.update()
+            assert status == UPDATE_ERROR_LIMIT_EXCEEDED
+
+
+def _encoded_feed(declaration: str, title: str, encoding: str) -> bytes:
+    """Return a feed with the title in the encoding."""
+    return (
+        f"{declaration}<rss version='2.0'><channel><title>{title}</title>"
+        "<item><title>Title 1</title></item></channel></rss>"
+    ).encode(encoding)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("feed_class", [MockGeoRssFeed, MockStreamingGeoRssFeed])
+@pytest.mark.parametrize(
+    ("body", "content_type", "title"),
+    [
+        (
+            _encoded_feed("", "Gr\u00fc\u00dfe \u20ac", "cp1252"),
+            "application/rss+xml; charset=windows-1252",
+            "Gr\u00fc\u00dfe \u20ac",
+        ),
+        (
+            _encoded_feed("", "Gr\u00fc\u00dfe \u00a9", "iso-8859-1"),
+            "application/rss+xml; charset=iso-8859-1",
+            "Gr\u00fc\u00dfe \u00a9",
+        ),
+        (
+            _encoded_feed(
+                "<?xml version='1.0' encoding='ISO-8859-1'?>",
+                "Gr\u00fc\u00dfe \u00a9",
+                "iso-8859-1",
+            ),
+            "text/xml",
+            "Gr\u00fc\u00dfe \u00a9",
+        ),
+        (
+            _encoded_feed(
+                "<?xml version='1.0' encoding='windows-1252'?>",
+                "Gr\u00fc\u00dfe \u20ac",
+                "cp1252",
+            ),
+            "text/xml",
+            "Gr\u00fc\u00dfe \u20ac",
+        ),
+        (
+            _encoded_feed(
+                "\ufeff<?xml version='1.0'?>", "Gr\u00fc\u00dfe \u20ac", "utf-8"
+            ),
+            "text/xml; charset=iso-8859-1",
+            "Gr\u00fc\u00dfe \u20ac",
+        ),
+    ],
+)
+async def test_update_encoding(
+    mock_aiointercept, feed_class, body, content_type, title
+):
+    """Test updating feeds in different encodings without decoding them twice."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=body,
+        headers={"Content-Type": content_type},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = feed_class(websession, HOME_COORDINATES_1, "http://test.url/testpath")
+        with patch.object(aiohttp.ClientResponse, "text") as text:
+            status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert feed.feed_data.title == title
+        # The body is passed to the parser as bytes.
+        text.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 10, 1000])
+async def test_update_encoding_streaming_chunked(mock_aiointercept, chunk_size):
+    """Test streaming a feed in a declared multi-byte encoding in small chunks."""
+    body = _encoded_feed(
+        "<?xml version='1.0' encoding='shift_jis'?>", "\u5730\u9707", "shift_jis"
+    )
+
+    async def chunks():
+        """Return the response in chunks shorter than the XML declaration."""
+        for i in range(0, len(body), chunk_size):
+            yield body[i : i + chunk_size]
+
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=chunks(),
+        headers={"Content-Type": "text/xml"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert feed.feed_data.title == "\u5730\u9707"
+
+
+@pytest.mark.asyncio
+async def test_update_encoding_unsupported(mock_aiointercept):
+    """Test updating a feed in a multi-byte encoding the parser cannot handle."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=_encoded_feed("", "\u5730\u9707", "shift_jis"),
+        headers={"Content-Type": "text/xml"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockStreamingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        with patch(
+            "aio_georss_client.feed.detect_encoding",
+            return_value=("Shift_JIS", None),
+        ):
+            status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_retry(mock_aiointercept):
+    """Test retrying requests failing with transient errors."""
+    delays = []
+
+    async def _sleep(delay: float):
+        delays.append(delay)
+
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.SERVICE_UNAVAILABLE
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": "5"},
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+    mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.NOT_FOUND)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockRetryingGeoRssFeed(
+            websession,
+            HOME_COORDINATES_1,
+            "http://test.url/testpath",
+            retry_policy=RetryPolicy(backoff=2.0, jitter=0.0, sleep=_sleep),
+            circuit_breaker=None,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        assert mock_aiointercept.call_count == 3
+        # Exponential backoff, unless the server asks for a delay.
+        assert delays == [2.0, 5.0]
+
+        # Permanent errors are not retried.
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert mock_aiointercept.call_count == 4
+        assert delays == [2.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_update_circuit_breaker(mock_aiointercept):
+    """Test suspending requests to a failing host."""
+    clock_time = [1000.0]
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60.0, clock=lambda: clock_time[0]
+    )
+    for _ in range(3):
+        mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.BAD_GATEWAY)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feeds = [
+            MockRetryingGeoRssFeed(
+                websession,
+                HOME_COORDINATES_1,
+                "http://test.url/testpath",
+                retry_policy=None,
+                circuit_breaker=circuit_breaker,
+            ),
+            MockRetryingGeoRssFeed(
+                websession,
+                HOME_COORDINATES_2,
+                "http://test.url/testpath",
+                retry_policy=None,
+                circuit_breaker=circuit_breaker,
+            ),
+        ]
+        for feed in feeds:
+            status, _ = await feed.update()
+            assert status == UPDATE_ERROR
+        assert mock_aiointercept.call_count == 2
+        assert circuit_breaker.open_hosts == ["test.url"]
+
+        # Requests to the host are suspended for all feeds.
+        for feed in feeds:
+            status, entries = await feed.update()
+            assert status == UPDATE_ERROR
+            assert entries is None
+        assert mock_aiointercept.call_count == 2
+
+        # A trial request after the timeout fails and suspends requests again.
+        clock_time[0] = 1060.0
+        status, _ = await feeds[0].update()
+        assert status == UPDATE_ERROR
+        assert mock_aiointercept.call_count == 3
+        status, _ = await feeds[1].update()
+        assert mock_aiointercept.call_count == 3
+
+        clock_time[0] = 1120.0
+        status, entries = await feeds[1].update()
+        assert status == UPDATE_OK
+        assert entries is not None
+        assert circuit_breaker.open_hosts == []
+
+
+@pytest.mark.asyncio
+async def test_update_circuit_breaker_retry(mock_aiointercept):
+    """Test counting one failure per update when retrying requests."""
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.BAD_GATEWAY, repeat=True
+    )
+
+    async def _sleep(delay: float):
+        pass
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockRetryingGeoRssFeed(
+            websession,
+            HOME_COORDINATES_1,
+            "http://test.url/testpath",
+            retry_policy=RetryPolicy(max_attempts=3, sleep=_sleep),
+            circuit_breaker=circuit_breaker,
+        )
+        status, _ = await feed.update()
+        assert status == UPDATE_ERROR
+        assert mock_aiointercept.call_count == 3
+        assert circuit_breaker.open_hosts == []
+
+        status, _ = await feed.update()
+        assert status == UPDATE_ERROR
+        assert mock_aiointercept.call_count == 6
+        assert circuit_breaker.open_hosts == ["test.url"]
@@ -3,6 +3,7 @@
 import datetime
 from unittest import mock
 
+from aio_georss_client.geo_rss_distance_helper import GeoRssDistanceHelper
 from aio_georss_client.xml_parser.geometry import BoundingBox, Point, Polygon
 
 from . import MOCK_HOME_COORDINATES, MockFeedEntry, MockFeedItem, MockSimpleFeedEntry
@@ -12,6 +13,7 @@ def test_simple_feed_entry():
     """Test feed entry behaviour."""
     feed_entry = MockSimpleFeedEntry(None, None)
     assert repr(feed_entry) == "<MockSimpleFeedEntry(id=None)>"
+    assert not hasattr(feed_entry, "__dict__")
     assert feed_entry.geometries is None
     assert feed_entry.coordinates is None
     assert feed_entry.title is None
@@ -21,6 +23,7 @@ def test_simple_feed_entry():
     assert feed_entry.description is None
     assert feed_entry.published is None
     assert feed_entry.updated is None
+    assert feed_entry.fingerprint is None
     assert (
         feed_entry._search_in_external_id(r"External ID (?P<custom_attribute>.+)$")  # noqa: SLF001
         is None
@@ -86,3 +89,81 @@ def test_feed_entry_search_in_attributes():
     assert feed_entry.category == "Category 1"
     assert feed_entry.description == "Description 123"
     assert feed_entry.updated == updated
+
+
+def test_feed_entry_computed_once():
+    """Test that derived values of a feed entry are only computed once."""
+    point = Point(-37.0, 150.0)
+    polygon = Polygon([Point(-30.0, 150.0), Point(-30.0, 151.0), Point(-30.0, 150.0)])
+    feed_item = MockFeedItem(None, [polygon, point])
+    feed_entry = MockFeedEntry((-31.0, 151.0), feed_item)
+    assert not hasattr(feed_entry, "__dict__")
+    assert not hasattr(feed_item, "__dict__")
+
+    geometries = feed_entry.geometries
+    assert geometries == [polygon, point]
+    assert feed_entry.geometries is geometries
+
+    with mock.patch.object(
+        GeoRssDistanceHelper,
+        "distance_to_geometry",
+        wraps=GeoRssDistanceHelper.distance_to_geometry,
+    ) as mock_distance:
+        distance = feed_entry.distance_to_home
+        assert feed_entry.distance_to_home == distance
+        assert mock_distance.call_count == 2
+
+    with mock.patch.object(
+        GeoRssDistanceHelper,
+        "extract_coordinates",
+        wraps=GeoRssDistanceHelper.extract_coordinates,
+    ) as mock_extract:
+        assert feed_entry.coordinates == (-37.0, 150.0)
+        assert feed_entry.coordinates == (-37.0, 150.0)
+        assert mock_extract.call_count == 1
+
+
+def test_feed_entry_calculate_distances_to_home():
+    """Test calculating the distances of many feed entries in one batch."""
+    point = Point(-37.0, 150.0)
+    polygon = Polygon([Point(-30.0, 150.0), Point(-30.0, 151.0), Point(-30.0, 150.0)])
+    feed_entries = [
+        MockFeedEntry((-31.0, 151.0), MockFeedItem(None, [polygon, point])),
+        MockFeedEntry((-31.0, 151.0), MockFeedItem(None, [point])),
+        MockFeedEntry((-36.0, 150.0), MockFeedItem(None, [polygon])),
+        MockFeedEntry((-31.0, 151.0), MockFeedItem(None, [])),
+    ]
+    expected = [
+        MockFeedEntry(feed_entry._home_coordinates, feed_entry._rss_entry)  # noqa: SLF001
+        for feed_entry in feed_entries
+    ]
+
+    with mock.patch.object(
+        GeoRssDistanceHelper,
+        "distances_to_geometries",
+        wraps=GeoRssDistanceHelper.distances_to_geometries,
+    ) as mock_distances:
+        MockFeedEntry.calculate_distances_to_home(feed_entries)
+        # One batch per home coordinates.
+        assert mock_distances.call_count == 2
+        for feed_entry, expected_entry in zip(feed_entries, expected, strict=True):
+            assert feed_entry.distance_to_home == expected_entry.distance_to_home
+        # Already calculated distances are not calculated again.
+        MockFeedEntry.calculate_distances_to_home(feed_entries)
+        assert mock_distances.call_count == 2
+
+
+def test_feed_entry_intersects_envelope():
+    """Test checking feed entry geometries against an envelope."""
+    envelope = BoundingBox(Point(-32.0, 150.0), Point(-30.0, 152.0))
+    feed_entry = MockFeedEntry(
+        MOCK_HOME_COORDINATES, MockFeedItem(None, [Point(-37.0, 150.0)])
+    )
+    assert not feed_entry.intersects_envelope(envelope)
+    feed_entry = MockFeedEntry(
+        MOCK_HOME_COORDINATES,
+        MockFeedItem(None, [Point(-37.0, 150.0), Point(-31.0, 151.0)]),
+    )
+    assert feed_entry.intersects_envelope(envelope)
+    feed_entry = MockFeedEntry(MOCK_HOME_COORDINATES, MockFeedItem(None, []))
+    assert not feed_entry.intersects_envelope(envelope)
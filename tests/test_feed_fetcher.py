@@ -0,0 +1,155 @@
+"""Test for the feed fetcher."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_UNCHANGED
+from aio_georss_client.feed_fetcher import FeedFetcher
+from tests import MockGeoRssFeed
+from tests.utils import load_fixture
+
+HOME_COORDINATES = (-31.0, 151.0)
+
+
+class MockFetcherGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed sharing requests through a fetcher."""
+
+    def __init__(self, *args, fetcher: FeedFetcher, detect_unchanged: bool, **kwargs):
+        """Initialise the feed."""
+        super().__init__(*args, **kwargs)
+        self._mock_fetcher = fetcher
+        self._detect_unchanged = detect_unchanged
+
+    def _fetcher(self) -> FeedFetcher | None:
+        """Define the fetcher sharing requests with other feeds."""
+        return self._mock_fetcher
+
+    def _detect_unchanged_response(self) -> bool:
+        """Define whether to skip processing an unchanged response."""
+        return self._detect_unchanged
+
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    """Test that concurrent requests with the same key are only sent once."""
+    calls = []
+
+    async def _request(result: str) -> str:
+        calls.append(result)
+        await asyncio.sleep(0.01)
+        return result
+
+    async with FeedFetcher() as fetcher:
+        results = await asyncio.gather(
+            fetcher.coalesce("a", lambda: _request("first")),
+            fetcher.coalesce("a", lambda: _request("second")),
+            fetcher.coalesce("b", lambda: _request("third")),
+        )
+        assert results == ["first", "first", "third"]
+        assert calls == ["first", "third"]
+        assert repr(fetcher) == "<FeedFetcher(hosts=0, in_flight=0)>"
+
+        # Requests are sent again once finished.
+        assert await fetcher.coalesce("a", lambda: _request("fourth")) == "fourth"
+
+        # Cancelling one caller does not cancel the shared request.
+        task = asyncio.create_task(fetcher.coalesce("c", lambda: _request("fifth")))
+        shared = asyncio.create_task(fetcher.coalesce("c", lambda: _request("sixth")))
+        await asyncio.sleep(0)
+        task.cancel()
+        assert await shared == "fifth"
+
+
+@pytest.mark.asyncio
+async def test_session_per_host():
+    """Test that each host gets its own client session."""
+    fetcher = FeedFetcher(limit_per_host=2)
+    session = fetcher.session("http://test.url/feed1")
+    assert fetcher.session("http://test.url/feed2") is session
+    assert fetcher.session("https://test.url/feed1") is not session
+    assert fetcher.session("http://other.url/feed1") is not session
+    assert session.connector.limit_per_host == 2
+    assert fetcher.hosts == ["http://test.url", "https://test.url", "http://other.url"]
+    await fetcher.close()
+    assert session.closed
+    assert fetcher.hosts == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("detect_unchanged", [False, True])
+async def test_shared_update(mock_aiointercept, detect_unchanged):
+    """Test feeds of the same URL sharing one download and parse."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        headers={"ETag": '"abc"'},
+    )
+
+    async with FeedFetcher() as fetcher:
+        feeds = [
+            MockFetcherGeoRssFeed(
+                None,
+                HOME_COORDINATES,
+                "http://test.url/testpath",
+                filter_radius=filter_radius,
+                fetcher=fetcher,
+                detect_unchanged=detect_unchanged,
+            )
+            for filter_radius in (None, 750.0)
+        ]
+        results = await asyncio.gather(*(feed.update() for feed in feeds))
+        assert [status for status, _ in results] == [UPDATE_OK, UPDATE_OK]
+        assert [len(entries) for _, entries in results] == [5, 2]
+        assert feeds[0].feed_data is feeds[1].feed_data
+        assert feeds[1].etag == '"abc"'
+
+        # Only one response is mocked for each request.
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_1.xml"),
+        )
+        results = await asyncio.gather(*(feed.update() for feed in feeds))
+        expected_status = UPDATE_OK_UNCHANGED if detect_unchanged else UPDATE_OK
+        assert [status for status, _ in results] == [expected_status] * 2
+        assert [len(entries) for _, entries in results] == [5, 2]
+
+        mock_aiointercept.get(
+            "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+        results = await asyncio.gather(*(feed.update() for feed in feeds))
+        assert results == [(UPDATE_ERROR, None), (UPDATE_ERROR, None)]
+        assert feeds[1].etag is None
+
+
+@pytest.mark.asyncio
+async def test_shared_update_detect_unchanged(mock_aiointercept):
+    """Test that feeds processing responses differently don't share requests."""
+    for _ in range(4):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_1.xml"),
+        )
+
+    async with FeedFetcher() as fetcher:
+        feeds = [
+            MockFetcherGeoRssFeed(
+                None,
+                HOME_COORDINATES,
+                "http://test.url/testpath",
+                fetcher=fetcher,
+                detect_unchanged=detect_unchanged,
+            )
+            for detect_unchanged in (False, True)
+        ]
+        results = await asyncio.gather(*(feed.update() for feed in feeds))
+        assert [status for status, _ in results] == [UPDATE_OK, UPDATE_OK]
+        assert mock_aiointercept.call_count == 2
+
+        results = await asyncio.gather(*(feed.update() for feed in feeds))
+        assert [status for status, _ in results] == [UPDATE_OK, UPDATE_OK_UNCHANGED]
+        assert mock_aiointercept.call_count == 4
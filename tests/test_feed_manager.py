@@ -3,15 +3,39 @@
 import asyncio
 import datetime
 from http import HTTPStatus
+import pickle
 from unittest import mock as async_mock
 
 import aiohttp
+from aiohttp import hdrs
+from aiointercept import CallbackResult
 import pytest
 
-from aio_georss_client.consts import UPDATE_OK_NO_DATA
+from aio_georss_client.consts import (
+    METRIC_COUNT_BYTES,
+    METRIC_COUNT_ENTRIES,
+    METRIC_COUNT_ITEMS,
+    METRIC_COUNT_WIRE_BYTES,
+    METRIC_STAGE_DECODE,
+    METRIC_STAGE_DOWNLOAD,
+    METRIC_STAGE_ENTRIES,
+    METRIC_STAGE_FILTER,
+    METRIC_STAGE_GENERATE_CALLBACKS,
+    METRIC_STAGE_PARSE,
+    METRIC_STAGE_REMOVE_CALLBACKS,
+    METRIC_STAGE_REQUEST,
+    METRIC_STAGE_STORE,
+    METRIC_STAGE_UPDATE_CALLBACKS,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from aio_georss_client.exceptions import GeoRssException
 from aio_georss_client.feed_manager import FeedManagerBase
+from aio_georss_client.spatial_index import SpatialIndex
 from aio_georss_client.status_update import StatusUpdate
-from tests import MockGeoRssFeed
+from aio_georss_client.xml_parser.geometry import BoundingBox, Point
+from tests import MockGeoRssFeed, MockUnchangedDetectingGeoRssFeed
 from tests.utils import load_fixture
 
 HOME_COORDINATES_1 = (-31.0, 151.0)
@@ -59,10 +83,13 @@ async def test_feed_manager(mock_aiointercept):
             "url=http://test.url/testpath, "
             "radius=None, categories=None)>)>"
         )
+        assert feed_manager.feed is feed
+        assert feed_manager.last_status is None
         await feed_manager.update()
         entries = feed_manager.feed_entries
         assert entries is not None
         assert len(entries) == 5
+        assert feed_manager.last_status == UPDATE_OK
         assert feed_manager.last_update is not None
         assert feed_manager.last_timestamp == datetime.datetime(2018, 9, 23, 9, 10)
 
@@ -302,3 +329,549 @@ async def test_feed_manager_with_status_callback(mock_aiointercept):
         assert status_update[0].last_update_successful is not None
         assert status_update[0].last_update_successful == last_update_successful
         assert status_update[0].total == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_unchanged(mock_aiointercept):
+    """Test the feed manager skips callbacks for unchanged responses."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        repeat=2,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockUnchangedDetectingGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        generate_callback = async_mock.AsyncMock()
+        update_callback = async_mock.AsyncMock()
+        remove_callback = async_mock.AsyncMock()
+        status_update = []
+
+        async def _status(status_details: StatusUpdate) -> None:
+            """Capture status update details."""
+            status_update.append(status_details)
+
+        feed_manager = FeedManagerBase(
+            feed, generate_callback, update_callback, remove_callback, _status
+        )
+        await feed_manager.update()
+        assert generate_callback.await_count == 5
+        assert status_update[0].status == UPDATE_OK
+
+        generate_callback.reset_mock()
+        status_update.clear()
+        await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 5
+        generate_callback.assert_not_awaited()
+        update_callback.assert_not_awaited()
+        remove_callback.assert_not_awaited()
+        assert status_update[0].status == UPDATE_OK_UNCHANGED
+        assert status_update[0].total == 5
+        assert status_update[0].created == 0
+        assert status_update[0].updated == 0
+        assert status_update[0].removed == 0
+        assert feed_manager.last_update_successful == status_update[0].last_update
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indexed", [False, True])
+async def test_feed_manager_spatial_queries(mock_aiointercept, indexed):
+    """Test querying the feed manager's entries by location."""
+    spatial_index = SpatialIndex() if indexed else None
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        feed_manager = FeedManagerBase(
+            feed,
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            spatial_index=spatial_index,
+        )
+        await feed_manager.update()
+
+        entries = feed_manager.entries_within_radius((-37.2345, 149.1234), 40.0)
+        assert [entry.external_id for entry in entries] == ["1234", "2345"]
+        entries = feed_manager.entries_within_radius(HOME_COORDINATES_2, 10.0)
+        assert entries == []
+        entries = feed_manager.entries_within_bounding_box(
+            BoundingBox(Point(-37.7, 149.5), Point(-37.6, 149.6))
+        )
+        assert sorted(entry.external_id for entry in entries) == [
+            "5678",
+            "Title 3",
+        ]
+
+        # Entries are removed from the index after an unsuccessful update.
+        await feed_manager.update()
+        assert feed_manager.entries_within_radius((-37.2345, 149.1234), 40.0) == []
+        if spatial_index:
+            assert len(spatial_index) == 0
+
+
+class MockMetricsGeoRssFeed(MockGeoRssFeed):
+    """Mock GeoRSS feed measuring the stages of each update."""
+
+    def _collect_metrics(self) -> bool:
+        """Define whether to measure the stages of each update."""
+        return True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collect_metrics", [False, True])
+async def test_feed_manager_metrics(mock_aiointercept, collect_metrics):
+    """Test measuring the stages of feed updates."""
+    body = load_fixture("generic_feed_1.xml")
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.OK, body=body, repeat=True
+    )
+    status_callback = async_mock.AsyncMock()
+    metrics_callback = async_mock.AsyncMock()
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_class = MockMetricsGeoRssFeed if collect_metrics else MockGeoRssFeed
+        feed = feed_class(websession, HOME_COORDINATES_1, "http://test.url/testpath")
+        feed_manager = FeedManagerBase(
+            feed,
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            status_callback,
+            metrics_async_callback=metrics_callback,
+        )
+        await feed_manager.update()
+        status_update: StatusUpdate = status_callback.call_args.args[0]
+        if not collect_metrics:
+            assert feed.metrics is None
+            assert status_update.metrics is None
+            metrics_callback.assert_not_awaited()
+            return
+        metrics = status_update.metrics
+        assert metrics is feed.metrics
+        metrics_callback.assert_awaited_once_with(metrics)
+        assert set(metrics.durations) == {
+            METRIC_STAGE_REQUEST,
+            METRIC_STAGE_DOWNLOAD,
+            METRIC_STAGE_DECODE,
+            METRIC_STAGE_PARSE,
+            METRIC_STAGE_ENTRIES,
+            METRIC_STAGE_FILTER,
+            METRIC_STAGE_STORE,
+            METRIC_STAGE_REMOVE_CALLBACKS,
+            METRIC_STAGE_UPDATE_CALLBACKS,
+            METRIC_STAGE_GENERATE_CALLBACKS,
+        }
+        assert all(duration >= 0.0 for duration in metrics.durations.values())
+        assert metrics.total_duration == sum(metrics.durations.values())
+        assert metrics.counts == {
+            METRIC_COUNT_BYTES: len(body.encode("utf-8")),
+            METRIC_COUNT_WIRE_BYTES: len(body.encode("utf-8")),
+            METRIC_COUNT_ITEMS: 6,
+            METRIC_COUNT_ENTRIES: 5,
+        }
+
+        # Every update is measured separately.
+        await feed_manager.update()
+        assert feed.metrics is not metrics
+        assert feed.metrics.counts[METRIC_COUNT_ITEMS] == 6
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_concurrent_callbacks(mock_aiointercept):
+    """Test dispatching callbacks concurrently and reporting their errors."""
+    for fixture in ("generic_feed_1.xml", "generic_feed_4.xml"):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+    status_callback = async_mock.AsyncMock()
+    active = 0
+    max_active = 0
+    calls = []
+
+    def _callback(action: str, failing_external_id: str):
+        async def _call(external_id: str) -> None:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            calls.append((action, external_id))
+            if external_id == failing_external_id:
+                raise ValueError(f"{action} failed")
+
+        return _call
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        feed_manager = FeedManagerBase(
+            feed,
+            _callback("generate", "2345"),
+            _callback("update", "1234"),
+            _callback("remove", "5678"),
+            status_callback,
+            max_concurrent_callbacks=2,
+        )
+        await feed_manager.update()
+        status_update: StatusUpdate = status_callback.call_args.args[0]
+        assert status_update.created == 5
+        assert list(status_update.errors) == ["2345"]
+        assert str(status_update.errors["2345"]) == "generate failed"
+        assert len(calls) == 5
+        assert max_active == 2
+        # The entity that failed to generate is not managed.
+        assert "2345" not in feed_manager._managed_external_ids  # noqa: SLF001
+
+        calls.clear()
+        await feed_manager.update()
+        status_update = status_callback.call_args.args[0]
+        assert sorted(status_update.errors) == ["1234", "2345", "5678"]
+        # Generating the failed entity is retried.
+        assert ("generate", "2345") in calls
+        # Failing to remove an entity still stops managing it.
+        assert ("remove", "5678") in calls
+        assert feed_manager._managed_external_ids == {"1234", "6789"}  # noqa: SLF001
+
+
+def test_feed_manager_invalid_concurrent_callbacks():
+    """Test an invalid maximum of concurrent callbacks."""
+    with pytest.raises(GeoRssException, match="concurrent callbacks"):
+        FeedManagerBase(
+            None,
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            max_concurrent_callbacks=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_batch_callbacks(mock_aiointercept):
+    """Test the feed manager with one callback per update and change."""
+    for fixture in ("generic_feed_1.xml", "generic_feed_4.xml"):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    generate_callback = async_mock.AsyncMock()
+    update_callback = async_mock.AsyncMock()
+    remove_callback = async_mock.AsyncMock()
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        feed_manager = FeedManagerBase(
+            feed,
+            None,
+            None,
+            None,
+            generate_batch_async_callback=generate_callback,
+            update_batch_async_callback=update_callback,
+            remove_batch_async_callback=remove_callback,
+        )
+        await feed_manager.update()
+        generate_callback.assert_awaited_once()
+        created = generate_callback.call_args.args[0]
+        assert created == feed_manager.feed_entries
+        assert len(created) == 5
+        # Nothing to update or remove yet.
+        update_callback.assert_not_awaited()
+        remove_callback.assert_not_awaited()
+        previous_entries = feed_manager.feed_entries
+
+        await feed_manager.update()
+        created = generate_callback.call_args.args[0]
+        assert list(created) == ["6789"]
+        assert created["6789"].title == "Title 6"
+        updated = update_callback.call_args.args[0]
+        assert set(updated) == {"1234", "2345"}
+        assert updated["1234"].title == "Title 1 UPDATED"
+        removed = remove_callback.call_args.args[0]
+        assert len(removed) == 3
+        assert "5678" in removed
+        assert all(removed[key] is previous_entries[key] for key in removed)
+
+        # An error removes all entries of the previous update.
+        previous_entries = feed_manager.feed_entries
+        await feed_manager.update()
+        assert feed_manager.feed_entries == {}
+        assert remove_callback.await_count == 2
+        assert remove_callback.call_args.args[0] == previous_entries
+        assert feed_manager._managed_external_ids == set()  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_detect_changes(mock_aiointercept):
+    """Test that only changed entries are updated."""
+    for fixture in ("generic_feed_1.xml", "generic_feed_1.xml", "generic_feed_4.xml"):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+    status_callback = async_mock.AsyncMock()
+    update_callback = async_mock.AsyncMock()
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoRssFeed(
+            websession, HOME_COORDINATES_1, "http://test.url/testpath"
+        )
+        feed_manager = FeedManagerBase(
+            feed,
+            async_mock.AsyncMock(),
+            update_callback,
+            async_mock.AsyncMock(),
+            status_callback,
+            detect_changes=True,
+        )
+        await feed_manager.update()
+        status_update: StatusUpdate = status_callback.call_args.args[0]
+        assert (status_update.created, status_update.updated) == (5, 0)
+        assert status_update.unchanged == 0
+
+        # Same feed again.
+        await feed_manager.update()
+        status_update = status_callback.call_args.args[0]
+        assert (status_update.created, status_update.updated) == (0, 0)
+        assert status_update.unchanged == 5
+        update_callback.assert_not_awaited()
+
+        # Only the first entry changed, the second one is the same.
+        await feed_manager.update()
+        status_update = status_callback.call_args.args[0]
+        assert (status_update.created, status_update.updated) == (1, 1)
+        assert (status_update.unchanged, status_update.removed) == (1, 3)
+        update_callback.assert_awaited_once_with("1234")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_entries", [False, True])
+async def test_feed_manager_snapshot(mock_aiointercept, tmp_path, include_entries):
+    """Test resuming a feed manager from a snapshot."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        headers={"ETag": '"abc"', "Last-Modified": "Sun, 23 Sep 2018 08:30:00 GMT"},
+    )
+    path = tmp_path / "snapshot.pickle"
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            detect_changes=True,
+        )
+        await feed_manager.update()
+        await feed_manager.save_snapshot(path, include_entries=include_entries)
+        assert not (tmp_path / "snapshot.pickle.tmp").exists()
+
+        # Restart with a fresh feed manager.
+        generate_callback = async_mock.AsyncMock()
+        update_callback = async_mock.AsyncMock()
+        remove_callback = async_mock.AsyncMock()
+        spatial_index = SpatialIndex()
+        restored_feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            generate_callback,
+            update_callback,
+            remove_callback,
+            spatial_index=spatial_index,
+            detect_changes=True,
+        )
+        assert await restored_feed_manager.load_snapshot(path)
+        assert restored_feed_manager.last_update == feed_manager.last_update
+        assert restored_feed_manager.last_timestamp == feed_manager.last_timestamp
+        if include_entries:
+            assert restored_feed_manager.feed.etag == '"abc"'
+            assert (
+                restored_feed_manager.feed.last_modified
+                == "Sun, 23 Sep 2018 08:30:00 GMT"
+            )
+            assert restored_feed_manager.feed_entries.keys() == (
+                feed_manager.feed_entries.keys()
+            )
+            assert len(spatial_index) == 5
+        else:
+            # Without the entries, the first update must fetch the full feed.
+            assert restored_feed_manager.feed.etag is None
+            assert restored_feed_manager.feed.last_modified is None
+            assert restored_feed_manager.feed_entries == {}
+
+        # Same data again: nothing is created, updated or removed.
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_1.xml"),
+        )
+        await restored_feed_manager.update()
+        generate_callback.assert_not_awaited()
+        update_callback.assert_not_awaited()
+        remove_callback.assert_not_awaited()
+        assert len(restored_feed_manager.feed_entries) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_entries", [True, False])
+async def test_feed_manager_snapshot_not_modified(
+    mock_aiointercept, tmp_path, include_entries
+):
+    """Test resuming from a snapshot with a server honouring conditional requests."""
+
+    def _respond(url, *, headers, **kwargs) -> CallbackResult:
+        """Answer conditional requests with 304 Not Modified."""
+        if hdrs.IF_NONE_MATCH in headers or hdrs.IF_MODIFIED_SINCE in headers:
+            return CallbackResult(status=HTTPStatus.NOT_MODIFIED, headers={})
+        return CallbackResult(
+            body=load_fixture("generic_feed_1.xml"),
+            headers={
+                "ETag": '"abc"',
+                "Last-Modified": "Sun, 23 Sep 2018 08:30:00 GMT",
+                "Content-Type": "application/rss+xml",
+            },
+        )
+
+    mock_aiointercept.get("http://test.url/testpath", callback=_respond, repeat=True)
+    path = tmp_path / "snapshot.pickle"
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            detect_changes=True,
+        )
+        await feed_manager.update()
+        await feed_manager.save_snapshot(path, include_entries=include_entries)
+
+        spatial_index = SpatialIndex()
+        restored_feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            spatial_index=spatial_index,
+            detect_changes=True,
+        )
+        assert await restored_feed_manager.load_snapshot(path)
+        await restored_feed_manager.update()
+        expected_status = UPDATE_OK_NO_DATA if include_entries else UPDATE_OK
+        assert restored_feed_manager.last_status == expected_status
+        assert restored_feed_manager.feed_entries.keys() == (
+            feed_manager.feed_entries.keys()
+        )
+        assert len(spatial_index) == 5
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_snapshot_batch_remove(mock_aiointercept, tmp_path):
+    """Test removing entries unknown after restoring a snapshot without them."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    path = tmp_path / "snapshot.pickle"
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+            async_mock.AsyncMock(),
+        )
+        await feed_manager.update()
+        await feed_manager.save_snapshot(path)
+
+        remove_callback = async_mock.AsyncMock()
+        restored_feed_manager = FeedManagerBase(
+            MockGeoRssFeed(websession, HOME_COORDINATES_1, "http://test.url/testpath"),
+            None,
+            None,
+            None,
+            generate_batch_async_callback=async_mock.AsyncMock(),
+            update_batch_async_callback=async_mock.AsyncMock(),
+            remove_batch_async_callback=remove_callback,
+        )
+        assert await restored_feed_manager.load_snapshot(path)
+        await restored_feed_manager.update()
+        remove_callback.assert_awaited_once_with(
+            dict.fromkeys(feed_manager.feed_entries)
+        )
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_snapshot_unusable(tmp_path):
+    """Test loading missing, corrupt and incompatible snapshots."""
+    feed_manager = FeedManagerBase(
+        MockGeoRssFeed(None, HOME_COORDINATES_1, "http://test.url/testpath"),
+        async_mock.AsyncMock(),
+        async_mock.AsyncMock(),
+        async_mock.AsyncMock(),
+    )
+    path = tmp_path / "snapshot.pickle"
+    assert not await feed_manager.load_snapshot(path)
+
+    path.write_bytes(b"corrupt")
+    assert not await feed_manager.load_snapshot(path)
+
+    other_feed_manager = FeedManagerBase(
+        MockGeoRssFeed(None, HOME_COORDINATES_1, "http://test.url/otherpath"),
+        async_mock.AsyncMock(),
+        async_mock.AsyncMock(),
+        async_mock.AsyncMock(),
+    )
+    await other_feed_manager.save_snapshot(path, include_entries=True)
+    assert not await feed_manager.load_snapshot(path)
+    assert await other_feed_manager.load_snapshot(path)
+
+    # Snapshots referring to classes that no longer exist.
+    for data in (
+        b"cmissing_module\nMissing\n.",
+        b"caio_georss_client.feed\nMissing\n.",
+    ):
+        path.write_bytes(data)
+        assert not await feed_manager.load_snapshot(path)
+
+    # Snapshots with missing keys.
+    for snapshot in (
+        {"version": 1, "feed": {"url": "http://test.url/testpath"}},
+        {
+            "version": 1,
+            "managed_external_ids": [],
+            "fingerprints": {},
+            "last_update": None,
+            "last_update_successful": None,
+            "feed": {"url": "http://test.url/testpath"},
+        },
+    ):
+        path.write_bytes(pickle.dumps(snapshot))
+        assert not await feed_manager.load_snapshot(path)
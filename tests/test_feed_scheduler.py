@@ -0,0 +1,312 @@
+"""Test for the feed scheduler."""
+
+import asyncio
+from http import HTTPStatus
+import random
+
+import aiohttp
+import pytest
+
+from aio_georss_client.consts import (
+    UPDATE_ERROR,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+    UPDATE_OK_UNCHANGED,
+)
+from aio_georss_client.exceptions import GeoRssException
+from aio_georss_client.feed_manager import FeedManagerBase
+from aio_georss_client.feed_scheduler import FeedScheduler
+from tests import MockGeoRssFeed, MockUnchangedDetectingGeoRssFeed
+from tests.utils import load_fixture
+
+HOME_COORDINATES = (-31.0, 151.0)
+
+
+class FakeClock:
+    """Clock that only advances while sleeping."""
+
+    def __init__(self):
+        """Initialise the clock."""
+        self.time: float = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.time
+
+    async def sleep(self, delay: float):
+        """Advance the clock unless woken up by a finished poll."""
+        await asyncio.sleep(0.001)
+        self.time += delay
+
+
+class MockFeed:
+    """Feed stand-in with a URL and time to live."""
+
+    def __init__(self, url: str, ttl: int | None = None):
+        """Initialise the feed."""
+        self.url: str = url
+        self.ttl: int | None = ttl
+
+
+class MockFeedManager:
+    """Feed manager stand-in recording concurrent updates."""
+
+    active: dict[str, int] = {}
+    max_active: dict[str, int] = {}
+    started: list[str] = []
+
+    def __init__(self, url: str, ttl: int | None = None, duration: float = 0.01):
+        """Initialise the feed manager."""
+        self.feed = MockFeed(url, ttl)
+        self.last_status: str | None = None
+        self.updates: int = 0
+        self._duration: float = duration
+
+    async def update(self):
+        """Update the feed slowly and record concurrency per host and in total."""
+        host = self.feed.url.split("/")[2]
+        MockFeedManager.started.append(self.feed.url)
+        for key in (host, "total"):
+            MockFeedManager.active[key] = MockFeedManager.active.get(key, 0) + 1
+            MockFeedManager.max_active[key] = max(
+                MockFeedManager.max_active.get(key, 0), MockFeedManager.active[key]
+            )
+        await asyncio.sleep(self._duration)
+        for key in (host, "total"):
+            MockFeedManager.active[key] -= 1
+        self.updates += 1
+        self.last_status = UPDATE_OK
+
+
+def _feed_manager(websession, url: str, feed_class=MockGeoRssFeed) -> FeedManagerBase:
+    """Create a feed manager without callbacks."""
+
+    async def _callback(_external_id: str) -> None:
+        """Ignore entity updates."""
+
+    return FeedManagerBase(
+        feed_class(websession, HOME_COORDINATES, url),
+        _callback,
+        _callback,
+        _callback,
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_poll_due(mock_aiointercept):
+    """Test polling feeds that are due."""
+    for path in ("feed1", "feed2"):
+        mock_aiointercept.get(
+            f"http://test.url/{path}",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_1.xml"),
+            repeat=True,
+        )
+    clock = FakeClock()
+    scheduler = FeedScheduler(jitter=0.0, clock=clock)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager_1 = _feed_manager(websession, "http://test.url/feed1")
+        feed_manager_2 = _feed_manager(websession, "http://test.url/feed2")
+        scheduler.add(feed_manager_1, 60.0)
+        scheduler.add(feed_manager_2, 120.0)
+        assert len(scheduler) == 2
+        assert repr(scheduler) == "<FeedScheduler(feeds=2)>"
+        assert scheduler.next_poll(feed_manager_1) == 1000.0
+
+        assert await scheduler.poll_due() == 2
+        assert feed_manager_1.last_status == UPDATE_OK
+        assert len(feed_manager_1.feed_entries) == 5
+        assert feed_manager_2.last_status == UPDATE_OK
+        assert scheduler.interval(feed_manager_1) == 60.0
+        assert scheduler.next_poll(feed_manager_1) == 1060.0
+        assert scheduler.next_poll(feed_manager_2) == 1120.0
+
+        clock.time = 1059.0
+        assert await scheduler.poll_due() == 0
+        clock.time = 1060.0
+        assert await scheduler.poll_due() == 1
+        assert scheduler.next_poll(feed_manager_1) == 1120.0
+
+        scheduler.remove(feed_manager_2)
+        assert len(scheduler) == 1
+        clock.time = 1200.0
+        assert await scheduler.poll_due() == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_ttl(mock_aiointercept):
+    """Test that feeds are not polled more often than their time to live."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("xml_parser_complex_1.xml"),
+    )
+    scheduler = FeedScheduler(jitter=0.0, clock=FakeClock())
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = _feed_manager(websession, "http://test.url/testpath")
+        scheduler.add(feed_manager, 300.0)
+        await scheduler.poll_due()
+        assert feed_manager.feed.ttl == 42
+        assert scheduler.interval(feed_manager) == 42 * 60.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_backoff(mock_aiointercept):
+    """Test that intervals grow with errors and unchanged data."""
+    clock = FakeClock()
+    scheduler = FeedScheduler(jitter=0.0, max_interval=500.0, clock=clock)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = _feed_manager(
+            websession,
+            "http://test.url/testpath",
+            feed_class=MockUnchangedDetectingGeoRssFeed,
+        )
+        scheduler.add(feed_manager, 100.0)
+        intervals = []
+        for status in (
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.OK,
+            HTTPStatus.OK,
+            HTTPStatus.NOT_MODIFIED,
+            HTTPStatus.OK,
+        ):
+            mock_aiointercept.get(
+                "http://test.url/testpath",
+                status=status,
+                body=load_fixture("generic_feed_1.xml"),
+            )
+            clock.time = scheduler.next_poll(feed_manager)
+            assert await scheduler.poll_due() == 1
+            intervals.append(
+                (feed_manager.last_status, scheduler.interval(feed_manager))
+            )
+        assert intervals == [
+            (UPDATE_ERROR, 200.0),
+            (UPDATE_ERROR, 400.0),
+            (UPDATE_ERROR, 500.0),
+            (UPDATE_OK, 100.0),
+            (UPDATE_OK_UNCHANGED, 150.0),
+            (UPDATE_OK_NO_DATA, 225.0),
+            (UPDATE_OK_UNCHANGED, 337.5),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_update_exception():
+    """Test that failing updates are treated as errors."""
+    feed_manager = MockFeedManager("http://test.url/testpath")
+    feed_manager.update = None
+    scheduler = FeedScheduler(jitter=0.0, clock=FakeClock())
+    scheduler.add(feed_manager, 10.0)
+    assert await scheduler.poll_due() == 1
+    assert scheduler.interval(feed_manager) == 20.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_concurrency():
+    """Test the global and per host concurrency limits."""
+    MockFeedManager.active.clear()
+    MockFeedManager.max_active.clear()
+    feed_managers = [
+        MockFeedManager(f"http://host{i % 3}.url/feed{i}") for i in range(12)
+    ]
+    scheduler = FeedScheduler(
+        max_concurrency=4, max_concurrency_per_host=2, jitter=0.0, clock=FakeClock()
+    )
+    for feed_manager in feed_managers:
+        scheduler.add(feed_manager, 10.0)
+    assert await scheduler.poll_due() == 12
+    assert all(feed_manager.updates == 1 for feed_manager in feed_managers)
+    assert MockFeedManager.max_active.pop("total") == 4
+    assert MockFeedManager.max_active == {
+        "host0.url": 2,
+        "host1.url": 2,
+        "host2.url": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_scheduler_concurrency_busy_host():
+    """Test that polls waiting for a busy host don't block other hosts."""
+    MockFeedManager.active.clear()
+    MockFeedManager.max_active.clear()
+    MockFeedManager.started.clear()
+    urls = [
+        "http://a.url/feed1",
+        "http://a.url/feed2",
+        "http://a.url/feed3",
+        "http://b.url/feed1",
+    ]
+    feed_managers = [MockFeedManager(url, duration=0.05) for url in urls]
+    scheduler = FeedScheduler(
+        max_concurrency=3, max_concurrency_per_host=1, jitter=0.0, clock=FakeClock()
+    )
+    for feed_manager in feed_managers:
+        scheduler.add(feed_manager, 10.0)
+    assert await scheduler.poll_due() == 4
+    # The feed of the idle host starts right away.
+    assert MockFeedManager.started[:2] == ["http://a.url/feed1", "http://b.url/feed1"]
+    assert MockFeedManager.max_active == {"a.url": 1, "b.url": 1, "total": 2}
+
+
+def test_scheduler_jitter():
+    """Test that polls are spread with jitter."""
+    clock = FakeClock()
+    scheduler = FeedScheduler(
+        jitter=0.2, clock=clock, random_generator=random.Random(42)
+    )
+    feed_managers = [MockFeedManager(f"http://test.url/feed{i}") for i in range(10)]
+    for feed_manager in feed_managers:
+        scheduler.add(feed_manager, 100.0)
+    next_polls = [scheduler.next_poll(feed_manager) for feed_manager in feed_managers]
+    assert all(1000.0 <= next_poll <= 1020.0 for next_poll in next_polls)
+    assert len(set(next_polls)) == 10
+
+
+def test_scheduler_invalid_interval():
+    """Test adding a feed with an invalid interval."""
+    scheduler = FeedScheduler()
+    with pytest.raises(GeoRssException):
+        scheduler.add(MockFeedManager("http://test.url/testpath"), 0.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_run():
+    """Test running the scheduler until stopped."""
+    clock = FakeClock()
+
+    async def _sleep(delay: float):
+        """Advance the clock and stop after a while."""
+        await clock.sleep(delay)
+        if clock.time >= 1175.0:
+            scheduler.stop()
+
+    scheduler = FeedScheduler(jitter=0.0, clock=clock, sleep=_sleep)
+    feed_manager_1 = MockFeedManager("http://test.url/feed1", duration=0.0)
+    feed_manager_2 = MockFeedManager("http://test.url/feed2", ttl=1, duration=0.0)
+    scheduler.add(feed_manager_1, 10.0)
+    scheduler.add(feed_manager_2, 30.0)
+    await asyncio.wait_for(scheduler.run(), 10)
+    # Polled at 0, 10, ..., 170 and at 0, 60, 120 seconds.
+    assert feed_manager_1.updates == 18
+    assert feed_manager_2.updates == 3
+    assert scheduler.interval(feed_manager_2) == 60.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_run_cancelled():
+    """Test cancelling the scheduler while polling."""
+    scheduler = FeedScheduler(jitter=0.0)
+    feed_manager = MockFeedManager("http://test.url/testpath")
+    scheduler.add(feed_manager, 10.0)
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert feed_manager.updates == 0
@@ -38,6 +38,48 @@ def test_polygon():
     )
 
 
+def test_polygon_from_coordinates():
+    """Test polygon created from interleaved coordinates."""
+    polygon = Polygon.from_coordinates(
+        (-30.1, 150.1, -30.2, 150.2, -30.4, 150.4, -30.8, 150.8, -30.1, 150.1)
+    )
+    assert list(polygon.coordinates) == [
+        -30.1,
+        150.1,
+        -30.2,
+        150.2,
+        -30.4,
+        150.4,
+        -30.8,
+        150.8,
+        -30.1,
+        150.1,
+    ]
+    assert polygon.points == [
+        Point(-30.1, 150.1),
+        Point(-30.2, 150.2),
+        Point(-30.4, 150.4),
+        Point(-30.8, 150.8),
+        Point(-30.1, 150.1),
+    ]
+    assert polygon == Polygon(polygon.points)
+    assert polygon.edges[0] == (Point(-30.1, 150.1), Point(-30.2, 150.2))
+    assert len(polygon.edges) == 4
+    # Derived values are only computed once.
+    assert polygon.edges is polygon.edges
+    assert polygon.centroid is polygon.centroid
+    assert polygon.envelope is polygon.envelope
+
+
+def test_polygon_empty():
+    """Test polygon without coordinates."""
+    polygon = Polygon([])
+    assert polygon.points == []
+    assert polygon.edges == []
+    assert polygon.envelope is None
+    assert not polygon.is_inside(Point(-30.0, 150.0))
+
+
 def test_polygon_equality():
     """Test points."""
     polygon1 = Polygon(
@@ -59,6 +101,8 @@ def test_polygon_equality():
         ]
     )
     assert polygon1 == polygon2
+    assert hash(polygon1) == hash(polygon2)
+    assert len({polygon1, polygon2}) == 1
 
 
 def test_point_in_polygon_1():
@@ -164,3 +208,50 @@ def test_bounding_box_equality():
     bbox1 = BoundingBox(Point(10.0, 10.0), Point(20.0, 20.0))
     bbox2 = BoundingBox(Point(10.0, 10.0), Point(20.0, 20.0))
     assert bbox1 == bbox2
+
+
+def test_envelopes():
+    """Test bounding envelopes of geometries."""
+    point = Point(-37.0, 149.0)
+    assert point.envelope == BoundingBox(point, point)
+    polygon = Polygon(
+        [
+            Point(-30.0, 151.0),
+            Point(-30.0, 151.5),
+            Point(-30.5, 151.5),
+            Point(-30.5, 151.0),
+            Point(-30.0, 151.0),
+        ]
+    )
+    assert polygon.envelope == BoundingBox(Point(-30.5, 151.0), Point(-30.0, 151.5))
+    assert polygon.envelope is polygon.envelope
+    # Polygon spanning across 180 degree longitude.
+    polygon = Polygon(
+        [
+            Point(30.0, 179.0),
+            Point(30.0, -179.5),
+            Point(30.5, -179.5),
+            Point(30.5, 179.0),
+            Point(30.0, 179.0),
+        ]
+    )
+    assert polygon.envelope == BoundingBox(Point(30.0, 179.0), Point(30.5, -179.5))
+    bbox = BoundingBox(Point(-20.0, 170.0), Point(-10.0, -170.0))
+    assert bbox.envelope is bbox
+
+
+def test_bounding_box_intersects():
+    """Test intersection of bounding boxes."""
+    bbox = BoundingBox(Point(-20.0, 20.0), Point(-10.0, 30.0))
+    assert bbox.intersects(BoundingBox(Point(-15.0, 25.0), Point(-5.0, 35.0)))
+    assert bbox.intersects(BoundingBox(Point(-25.0, 10.0), Point(-5.0, 40.0)))
+    assert bbox.intersects(BoundingBox(Point(-10.0, 30.0), Point(-10.0, 30.0)))
+    assert not bbox.intersects(BoundingBox(Point(-9.0, 25.0), Point(-5.0, 35.0)))
+    assert not bbox.intersects(BoundingBox(Point(-15.0, 31.0), Point(-5.0, 35.0)))
+    # Bounding boxes spanning across 180 degree longitude.
+    bbox = BoundingBox(Point(-20.0, 170.0), Point(-10.0, -170.0))
+    assert bbox.intersects(BoundingBox(Point(-15.0, -175.0), Point(-5.0, -160.0)))
+    assert bbox.intersects(BoundingBox(Point(-15.0, 160.0), Point(-5.0, 175.0)))
+    assert bbox.intersects(BoundingBox(Point(-15.0, 175.0), Point(-5.0, -175.0)))
+    assert not bbox.intersects(BoundingBox(Point(-15.0, -160.0), Point(-5.0, 160.0)))
+    assert not bbox.intersects(BoundingBox(Point(-15.0, 20.0), Point(-5.0, 30.0)))
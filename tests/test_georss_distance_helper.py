@@ -235,3 +235,93 @@ def test_distance_to_unsupported_geometry():
         home_coordinates, mock_unsupported_geometry
     )
     assert distance == float("inf")
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_distances_to_geometries(monkeypatch, numpy_available):
+    """Test calculating distances to many geometries in one batch."""
+    if not numpy_available:
+        monkeypatch.setattr("aio_georss_client.geo_rss_distance_helper.np", None)
+    geometries = [
+        Point(-31.0, 150.0),
+        Polygon(
+            [
+                Point(30.0, 179.0),
+                Point(30.0, -179.5),
+                Point(30.5, -179.5),
+                Point(30.5, 179.0),
+                Point(30.0, 179.0),
+            ]
+        ),
+        Polygon(
+            [
+                Point(30.0, 151.0),
+                Point(30.0, 151.5),
+                Point(30.5, 151.5),
+                Point(30.5, 151.0),
+                Point(30.0, 151.0),
+            ]
+        ),
+        BoundingBox(Point(-32.0, 150.0), Point(-30.0, 152.0)),
+        MagicMock(),
+    ]
+    for home_coordinates in [(30.2, -177.0), (30.1, 178.0), (30.0, 151.3)]:
+        distances = GeoRssDistanceHelper.distances_to_geometries(
+            home_coordinates, geometries
+        )
+        expected = [
+            GeoRssDistanceHelper.distance_to_geometry(home_coordinates, geometry)
+            for geometry in geometries
+        ]
+        assert distances == pytest.approx(expected)
+    assert GeoRssDistanceHelper.distances_to_geometries((30.0, 151.0), []) == []
+
+
+def test_envelope_around():
+    """Test envelope around home coordinates."""
+    envelope = GeoRssDistanceHelper.envelope_around((-31.0, 151.0), 100.0)
+    assert envelope.bottom_left.latitude == pytest.approx(-31.9, 0.01)
+    assert envelope.top_right.latitude == pytest.approx(-30.1, 0.01)
+    assert envelope.bottom_left.longitude == pytest.approx(149.95, 0.01)
+    assert envelope.top_right.longitude == pytest.approx(152.05, 0.01)
+    # Envelope spanning across 180 degree longitude.
+    envelope = GeoRssDistanceHelper.envelope_around((30.2, -179.5), 100.0)
+    assert envelope.bottom_left.longitude == pytest.approx(179.46, 0.01)
+    assert envelope.top_right.longitude == pytest.approx(-178.46, 0.01)
+    assert envelope.is_inside(Point(30.2, 179.9))
+    assert envelope.is_inside(Point(30.2, -178.9))
+    assert not envelope.is_inside(Point(30.2, -178.0))
+    # Envelope reaching a pole covers all longitudes.
+    envelope = GeoRssDistanceHelper.envelope_around((89.5, 10.0), 100.0)
+    assert envelope == BoundingBox(
+        Point(envelope.bottom_left.latitude, -180.0), Point(90.0, 180.0)
+    )
+
+
+def test_envelope_around_contains_geometries_within_radius():
+    """Test that envelope never excludes geometries within the radius."""
+    home_coordinates = (30.2, -177.0)
+    radius = 250.0
+    envelope = GeoRssDistanceHelper.envelope_around(home_coordinates, radius)
+    polygon = Polygon(
+        [
+            Point(30.0, 179.0),
+            Point(30.0, -179.5),
+            Point(30.5, -179.5),
+            Point(30.5, 179.0),
+            Point(30.0, 179.0),
+        ]
+    )
+    assert (
+        GeoRssDistanceHelper.distance_to_geometry(home_coordinates, polygon) <= radius
+    )
+    assert polygon.envelope.intersects(envelope)
+    polygon = Polygon(
+        [
+            Point(-30.0, 151.0),
+            Point(-30.0, 151.5),
+            Point(-30.5, 151.5),
+            Point(-30.0, 151.0),
+        ]
+    )
+    assert not polygon.envelope.intersects(envelope)
@@ -0,0 +1,156 @@
+"""Test for the GeoRSS feed evaluated for multiple home locations."""
+
+import asyncio
+import datetime
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_UNCHANGED
+from aio_georss_client.home_location import HomeLocation
+from tests import MockMultiHomeGeoRssFeed
+from tests.utils import load_fixture
+
+HOME_LOCATIONS = [
+    HomeLocation("all", (-31.0, 151.0)),
+    HomeLocation("radius", (-37.0, 150.0), filter_radius=90.0),
+    HomeLocation(
+        "radius and category",
+        (-37.0, 150.0),
+        filter_radius=90.0,
+        filter_categories=["Category 2"],
+    ),
+    HomeLocation("far away", (51.5, -0.1), filter_radius=500.0),
+]
+
+
+def test_home_location():
+    """Test home location."""
+    home_location = HomeLocation(
+        "home", (-31.0, 151.0), filter_radius=50.0, filter_categories=["Category 1"]
+    )
+    assert home_location.name == "home"
+    assert home_location.coordinates == (-31.0, 151.0)
+    assert home_location.filter_radius == 50.0
+    assert home_location.filter_categories == ["Category 1"]
+    assert (
+        repr(home_location) == "<HomeLocation(name=home, coordinates=(-31.0, 151.0), "
+        "radius=50.0, categories=['Category 1'])>"
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_ok(mock_aiointercept):
+    """Test updating feed for multiple home locations with one request."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+        repeat=2,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockMultiHomeGeoRssFeed(
+            websession, HOME_LOCATIONS, "http://test.url/testpath"
+        )
+        assert (
+            repr(feed) == "<MockMultiHomeGeoRssFeed(homes=['all', 'radius', "
+            "'radius and category', 'far away'], url=http://test.url/testpath)>"
+        )
+        assert feed.home_locations == HOME_LOCATIONS
+        status, entries_by_home = await feed.update()
+        assert status == UPDATE_OK
+        assert list(entries_by_home) == [
+            "all",
+            "radius",
+            "radius and category",
+            "far away",
+        ]
+
+        entries = entries_by_home["all"]
+        assert len(entries) == 5
+        assert round(abs(entries[0].distance_to_home - 714.4), 1) == 0
+
+        entries = entries_by_home["radius"]
+        assert len(entries) == 4
+        assert round(abs(entries[0].distance_to_home - 82.0), 1) == 0
+        assert round(abs(entries[1].distance_to_home - 77.0), 1) == 0
+        assert round(abs(entries[2].distance_to_home - 84.6), 1) == 0
+
+        entries = entries_by_home["radius and category"]
+        assert len(entries) == 1
+        assert entries[0].external_id == "2345"
+
+        assert entries_by_home["far away"] == []
+        assert feed.last_timestamp == datetime.datetime(2018, 9, 23, 9, 10)
+
+        # All home locations share the same parsed feed items.
+        assert (
+            entries_by_home["all"][1]._rss_entry  # noqa: SLF001
+            is entries_by_home["radius and category"][0]._rss_entry  # noqa: SLF001
+        )
+
+        status, unchanged_entries_by_home = await feed.update()
+        assert status == UPDATE_OK_UNCHANGED
+        assert unchanged_entries_by_home is entries_by_home
+
+    mock_aiointercept.assert_called_with("http://test.url/testpath")
+
+
+@pytest.mark.asyncio
+async def test_update_error(mock_aiointercept):
+    """Test updating feed for multiple home locations results in error."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockMultiHomeGeoRssFeed(
+            websession, HOME_LOCATIONS, "http://test.url/testpath"
+        )
+        status, _ = await feed.update()
+        assert status == UPDATE_OK
+
+        status, entries_by_home = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries_by_home is None
+        assert feed.last_timestamp is None
+        assert feed._last_entries_by_home is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_snapshot(mock_aiointercept):
+    """Test restoring the entries by home location from a snapshot."""
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockMultiHomeGeoRssFeed(
+            websession, HOME_LOCATIONS, "http://test.url/testpath"
+        )
+        assert feed.snapshot(include_feed_data=True)["feed_data"] is None
+        _, entries_by_home = await feed.update()
+
+        restored_feed = MockMultiHomeGeoRssFeed(
+            websession, HOME_LOCATIONS, "http://test.url/testpath"
+        )
+        restored_entries_by_home = restored_feed.restore(
+            feed.snapshot(include_feed_data=True)
+        )
+        assert {
+            name: [entry.external_id for entry in entries]
+            for name, entries in restored_entries_by_home.items()
+        } == {
+            name: [entry.external_id for entry in entries]
+            for name, entries in entries_by_home.items()
+        }
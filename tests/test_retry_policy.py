@@ -0,0 +1,90 @@
+"""Test for the retry policy."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+import random
+from unittest.mock import MagicMock
+
+from aiohttp import ClientOSError, ClientResponseError
+import pytest
+
+from aio_georss_client.exceptions import GeoRssException
+from aio_georss_client.retry_policy import RetryPolicy, is_transient_error, retry_after
+
+
+def _response_error(status: int, headers: dict | None = None) -> ClientResponseError:
+    """Return the error raised for a response with the status."""
+    return ClientResponseError(MagicMock(), (), status=status, headers=headers or {})
+
+
+def test_is_transient_error():
+    """Test which errors are worth retrying."""
+    assert is_transient_error(ClientOSError())
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(_response_error(503))
+    assert is_transient_error(_response_error(429))
+    assert not is_transient_error(_response_error(404))
+    assert not is_transient_error(ValueError())
+
+
+def test_retry_after():
+    """Test reading the delay requested by the server."""
+    assert retry_after(ClientOSError()) is None
+    assert retry_after(_response_error(503)) is None
+    assert retry_after(_response_error(503, {"Retry-After": "12"})) == 12.0
+    assert retry_after(_response_error(503, {"Retry-After": "invalid"})) is None
+    past = format_datetime(datetime(2020, 1, 1, tzinfo=UTC), usegmt=True)
+    assert retry_after(_response_error(503, {"Retry-After": past})) == 0.0
+    future = format_datetime(datetime.now(UTC) + timedelta(seconds=120), usegmt=True)
+    assert 100.0 < retry_after(_response_error(503, {"Retry-After": future})) <= 120.0
+
+
+def test_delay():
+    """Test the exponential backoff."""
+    retry_policy = RetryPolicy(max_attempts=5, backoff=2.0, max_delay=10.0, jitter=0.0)
+    assert (
+        repr(retry_policy)
+        == "<RetryPolicy(max_attempts=5, backoff=2.0, max_delay=10.0)>"
+    )
+    assert retry_policy.max_attempts == 5
+    error = ClientOSError()
+    assert [retry_policy.delay(attempt, error) for attempt in range(1, 6)] == [
+        2.0,
+        4.0,
+        8.0,
+        10.0,
+        None,
+    ]
+    # Permanent errors are not retried.
+    assert retry_policy.delay(1, _response_error(404)) is None
+    # The server can ask for a delay, up to the maximum.
+    assert retry_policy.delay(1, _response_error(503, {"Retry-After": "7"})) == 7.0
+    assert retry_policy.delay(1, _response_error(503, {"Retry-After": "60"})) is None
+
+
+def test_delay_jitter():
+    """Test that delays are spread with random jitter."""
+    retry_policy = RetryPolicy(
+        backoff=10.0, jitter=0.2, random_generator=random.Random(1)
+    )
+    delays = {retry_policy.delay(1, ClientOSError()) for _ in range(20)}
+    assert len(delays) == 20
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+
+
+@pytest.mark.asyncio
+async def test_sleep():
+    """Test waiting before the next attempt."""
+    delays = []
+
+    async def _sleep(delay: float):
+        delays.append(delay)
+
+    await RetryPolicy(sleep=_sleep).sleep(1.5)
+    assert delays == [1.5]
+
+
+def test_invalid_max_attempts():
+    """Test creating a retry policy without attempts."""
+    with pytest.raises(GeoRssException):
+        RetryPolicy(max_attempts=0)
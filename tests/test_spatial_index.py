@@ -0,0 +1,141 @@
+"""Test for the spatial index."""
+
+import random
+
+import pytest
+
+from aio_georss_client.spatial_index import SpatialIndex
+from aio_georss_client.xml_parser.geometry import BoundingBox, Point, Polygon
+
+from . import MockFeedEntry, MockFeedItem
+
+
+def _entry(*geometries) -> MockFeedEntry:
+    """Create a feed entry with the provided geometries."""
+    return MockFeedEntry(None, MockFeedItem(None, list(geometries)))
+
+
+def test_spatial_index_update():
+    """Test adding, replacing and removing entries."""
+    spatial_index = SpatialIndex()
+    entry_1 = _entry(Point(-37.0, 149.0))
+    entry_2 = _entry(
+        Polygon([Point(-30.0, 151.0), Point(-30.0, 151.5), Point(-30.5, 151.5)])
+    )
+    spatial_index.update({"1": entry_1, "2": entry_2})
+    assert len(spatial_index) == 2
+    assert repr(spatial_index) == "<SpatialIndex(cell_size=1.0, entries=2)>"
+    assert spatial_index.entries_within_radius((-37.0, 149.1), 10.0) == [entry_1]
+    assert spatial_index.entries_within_radius((-30.2, 151.4), 10.0) == [entry_2]
+
+    # Same location, new entry object.
+    entry_1_updated = _entry(Point(-37.0, 149.0))
+    spatial_index.update({"1": entry_1_updated, "2": entry_2})
+    assert spatial_index.entries_within_radius((-37.0, 149.1), 10.0) == [
+        entry_1_updated
+    ]
+
+    # Entry moved.
+    entry_1_moved = _entry(Point(-20.0, 130.0))
+    spatial_index.update({"1": entry_1_moved})
+    assert len(spatial_index) == 1
+    assert spatial_index.entries_within_radius((-37.0, 149.1), 10.0) == []
+    assert spatial_index.entries_within_radius((-30.2, 151.4), 10.0) == []
+    assert spatial_index.entries_within_radius((-20.0, 130.0), 10.0) == [entry_1_moved]
+
+    spatial_index.clear()
+    assert len(spatial_index) == 0
+    assert spatial_index.entries_within_radius((-20.0, 130.0), 10.0) == []
+
+
+def test_spatial_index_radius_nearest_first():
+    """Test that radius queries return the nearest entries first."""
+    spatial_index = SpatialIndex(cell_size=0.5)
+    entry_1 = _entry(Point(-37.2, 149.0))
+    entry_2 = _entry(Point(-37.1, 149.0), Point(-39.0, 149.0))
+    entry_3 = _entry(Point(-35.0, 149.0))
+    entry_4 = _entry()
+    spatial_index.update({"1": entry_1, "2": entry_2, "3": entry_3, "4": entry_4})
+    assert spatial_index.entries_within_radius((-37.0, 149.0), 50.0) == [
+        entry_2,
+        entry_1,
+    ]
+
+
+def test_spatial_index_antimeridian():
+    """Test queries across 180 degree longitude."""
+    spatial_index = SpatialIndex()
+    entry_1 = _entry(Point(30.2, 179.9))
+    entry_2 = _entry(
+        Polygon(
+            [
+                Point(30.0, 179.0),
+                Point(30.0, -179.5),
+                Point(30.5, -179.5),
+                Point(30.5, 179.0),
+                Point(30.0, 179.0),
+            ]
+        )
+    )
+    entry_3 = _entry(BoundingBox(Point(-20.0, 170.0), Point(-10.0, -170.0)))
+    spatial_index.update({"1": entry_1, "2": entry_2, "3": entry_3})
+    assert spatial_index.entries_within_radius((30.2, -179.9), 30.0) == [
+        entry_2,
+        entry_1,
+    ]
+    assert spatial_index.entries_within_radius((-15.0, -175.0), 10.0) == [entry_3]
+    entries = spatial_index.entries_within_bounding_box(
+        BoundingBox(Point(-20.0, 179.5), Point(31.0, -179.8))
+    )
+    assert len(entries) == 3
+
+
+def test_spatial_index_large_geometries():
+    """Test entries and queries covering many cells."""
+    spatial_index = SpatialIndex()
+    entry_1 = _entry(BoundingBox(Point(-80.0, -170.0), Point(80.0, 170.0)))
+    entry_2 = _entry(Point(10.0, 10.0))
+    spatial_index.update({"1": entry_1, "2": entry_2})
+    assert spatial_index.entries_within_radius((50.0, 50.0), 10.0) == [entry_1]
+    assert spatial_index.entries_within_radius((10.0, 10.0), 10000.0) == [
+        entry_1,
+        entry_2,
+    ]
+
+
+@pytest.mark.parametrize("cell_size", [0.1, 1.0, 5.0])
+def test_spatial_index_same_as_linear_scan(cell_size):
+    """Test that the index finds the same entries as a linear scan."""
+    generator = random.Random(cell_size)
+    entries = {}
+    for i in range(200):
+        latitude = generator.uniform(-40.0, -30.0)
+        longitude = generator.uniform(140.0, 155.0)
+        if i % 2:
+            entries[str(i)] = _entry(Point(latitude, longitude))
+        else:
+            entries[str(i)] = _entry(
+                Polygon(
+                    [
+                        Point(latitude, longitude),
+                        Point(latitude, longitude + 0.3),
+                        Point(latitude + 0.3, longitude + 0.3),
+                        Point(latitude, longitude),
+                    ]
+                )
+            )
+    spatial_index = SpatialIndex(cell_size)
+    spatial_index.update(entries)
+    for _ in range(20):
+        coordinates = (generator.uniform(-40.0, -30.0), generator.uniform(140.0, 155.0))
+        radius = generator.choice([5.0, 50.0, 200.0])
+        assert spatial_index.entries_within_radius(
+            coordinates, radius
+        ) == SpatialIndex.filter_within_radius(entries.values(), coordinates, radius)
+        bbox = BoundingBox(
+            Point(coordinates[0], coordinates[1]),
+            Point(coordinates[0] + 1.0, coordinates[1] + 1.0),
+        )
+        assert set(spatial_index.entries_within_bounding_box(bbox)) == set(
+            SpatialIndex.filter_within_bounding_box(entries.values(), bbox)
+        )
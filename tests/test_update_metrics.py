@@ -0,0 +1,44 @@
+"""Test for update metrics."""
+
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+
+from aio_georss_client.update_metrics import UpdateMetrics, measure_stage
+
+
+def test_update_metrics():
+    """Test accumulating durations and counts."""
+    metrics = UpdateMetrics()
+    with patch(
+        "aio_georss_client.update_metrics.time.perf_counter",
+        side_effect=[1.0, 1.5, 2.0, 2.25],
+    ):
+        with metrics.stage("parse"):
+            pass
+        with measure_stage(metrics, "parse"):
+            pass
+    metrics.add_duration("request", 0.5)
+    metrics.add_count("bytes", 100)
+    metrics.add_count("bytes", 20)
+    assert metrics.durations == {"parse": 0.75, "request": 0.5}
+    assert metrics.total_duration == 1.25
+    assert metrics.counts == {"bytes": 120}
+    assert (
+        repr(metrics) == "<UpdateMetrics(durations={'parse': 0.75, "
+        "'request': 0.5}, counts={'bytes': 120})>"
+    )
+
+
+def test_update_metrics_stage_error():
+    """Test that stages raising errors are measured."""
+    metrics = UpdateMetrics()
+    with pytest.raises(ValueError, match="invalid"), metrics.stage("parse"):
+        raise ValueError("invalid")
+    assert "parse" in metrics.durations
+
+
+def test_measure_stage_disabled():
+    """Test that nothing is measured without metrics."""
+    assert isinstance(measure_stage(None, "parse"), nullcontext)
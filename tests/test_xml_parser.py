@@ -2,11 +2,21 @@
 
 import datetime
 from pyexpat import ExpatError
+from unittest.mock import patch
 
 import pytest
-
-from aio_georss_client.xml_parser import XmlParser
+import xmltodict
+
+from aio_georss_client.consts import PARSER_BACKEND_EXPAT, PARSER_BACKEND_XMLTODICT
+from aio_georss_client.exceptions import GeoRssException, GeoRssLimitExceeded
+from aio_georss_client.xml_parser import DEFAULT_NAMESPACES, XmlParser
+from aio_georss_client.xml_parser.encoding import (
+    MAX_HEAD_SIZE,
+    detect_encoding,
+    is_complete_head,
+)
 from aio_georss_client.xml_parser.geometry import Point, Polygon
+from aio_georss_client.xml_parser.lazy_value import LazyValue
 from tests.utils import load_fixture
 
 
@@ -337,6 +347,8 @@ def test_geometries_2():
     assert feed_entry.title == "Title 8"
     assert feed_entry.geometries is not None
     assert len(feed_entry.geometries) == 1
+    # Geometries are only created once.
+    assert feed_entry.geometries is feed_entry.geometries
 
 
 def test_byte_order_mark():
@@ -351,3 +363,389 @@ def test_byte_order_mark():
     # This will raise an error because the parser can't handle
     with pytest.raises(ExpatError):
         xml_parser.parse(xml)
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "generic_feed_1.xml",
+        "generic_feed_3.xml",
+        "generic_feed_8.xml",
+        "xml_parser_complex_1.xml",
+        "xml_parser_complex_2.xml",
+        "xml_parser_complex_3.xml",
+        "xml_parser_geometries_1.xml",
+        "xml_parser_simple_3.xml",
+    ],
+)
+def test_expat_backend_parity(fixture):
+    """Test that the expat backend produces the same structure as xmltodict."""
+    xml = load_fixture(fixture)
+    expected = xmltodict.parse(
+        xml,
+        process_namespaces=True,
+        namespaces=DEFAULT_NAMESPACES,
+        postprocessor=XmlParser.postprocessor,
+    )
+    streaming_parser = XmlParser().streaming_parser(encoding="utf-8")
+    streaming_parser.feed(xml.encode("utf-8"))
+    assert streaming_parser.close() == expected
+
+
+def test_expat_backend_complex_1():
+    """Test parsing an XML file with the expat backend."""
+    xml_parser = XmlParser(backend=PARSER_BACKEND_EXPAT)
+    xml = load_fixture("xml_parser_complex_1.xml")
+    feed = xml_parser.parse(xml)
+    assert feed is not None
+    assert feed.title == "Feed Title 1"
+    assert feed.ttl == 42
+    assert len(feed.entries) == 6
+    feed_entry = feed.entries[0]
+    assert feed_entry.title == "Title 1"
+    assert feed_entry.published_date == datetime.datetime(
+        2018, 12, 9, 7, 30, tzinfo=datetime.timezone.utc
+    )
+    assert feed_entry.geometries == [Point(-37.4567, 149.3456)]
+
+
+def test_expat_backend_item_callback():
+    """Test that feed items are emitted one by one while parsing."""
+    xml = load_fixture("xml_parser_complex_1.xml").encode("utf-8")
+    items = []
+    streaming_parser = XmlParser().streaming_parser(item_callback=items.append)
+    # Feed data in small chunks.
+    for i in range(0, len(xml), 64):
+        streaming_parser.feed(xml[i : i + 64])
+    feed = XmlParser.create_feed(streaming_parser.close())
+    assert feed is not None
+    assert len(items) == 6
+    assert [item.title for item in items] == [entry.title for entry in feed.entries]
+
+
+def test_expat_backend_byte_order_mark():
+    """Test parsing an XML file with byte order mark with the expat backend."""
+    xml_parser = XmlParser(backend=PARSER_BACKEND_EXPAT)
+    xml = (
+        "\xef\xbb\xbf<?xml version='1.0' encoding='utf-8'?>"
+        "<rss version='2.0'><channel><item><title>Title 1</title>"
+        "</item></channel></rss>"
+    )
+    with pytest.raises(ExpatError):
+        xml_parser.parse(xml)
+
+
+def test_unsupported_backend():
+    """Test creating a parser with an unknown backend."""
+    with pytest.raises(GeoRssException):
+        XmlParser(backend="invalid")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            "Sun, 09 Dec 2018 07:40:00 GMT",
+            datetime.datetime(2018, 12, 9, 7, 40, tzinfo=datetime.UTC),
+        ),
+        (
+            "Sun, 7 Oct 2018 19:52:00 -0200",
+            datetime.datetime(
+                2018,
+                10,
+                7,
+                19,
+                52,
+                tzinfo=datetime.timezone(-datetime.timedelta(hours=2)),
+            ),
+        ),
+        (
+            "30 Sep 2018 21:36 +1000",
+            datetime.datetime(
+                2018,
+                9,
+                30,
+                21,
+                36,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=10)),
+            ),
+        ),
+        ("2018-09-23 08:30:00", datetime.datetime(2018, 9, 23, 8, 30)),
+        (
+            "2018-12-09T07:45:00.5+00:00",
+            datetime.datetime(2018, 12, 9, 7, 45, 0, 500000, tzinfo=datetime.UTC),
+        ),
+        ("2018-12-09", datetime.datetime(2018, 12, 9)),
+        # Unusual formats handled by dateutil.
+        ("December 9, 2018 07:40", datetime.datetime(2018, 12, 9, 7, 40)),
+        (
+            "Sun, 09 Dec 18 07:40:00 GMT",
+            datetime.datetime(2018, 12, 9, 7, 40, tzinfo=datetime.UTC),
+        ),
+    ],
+)
+def test_parse_date(value, expected):
+    """Test parsing dates in common and unusual formats."""
+    parsed = XmlParser._parse_date(value)  # noqa: SLF001
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_date_invalid():
+    """Test parsing invalid dates."""
+    assert XmlParser.postprocessor([], "published", "INVALID DATE") == (
+        "published",
+        "INVALID DATE",
+    )
+    assert XmlParser.postprocessor(
+        [], "published", "Sun, 31 Feb 2018 07:40:00 GMT"
+    ) == (
+        "published",
+        "Sun, 31 Feb 2018 07:40:00 GMT",
+    )
+
+
+def _feed_properties(feed) -> list:
+    """Collect all properties of the feed, its image and its entries."""
+    properties = [
+        getattr(feed, name)
+        for name in (
+            "title",
+            "subtitle",
+            "description",
+            "summary",
+            "content",
+            "link",
+            "copyright",
+            "rights",
+            "generator",
+            "language",
+            "docs",
+            "ttl",
+            "category",
+            "published_date",
+            "pub_date",
+            "updated_date",
+            "last_build_date",
+            "author",
+            "contributor",
+            "managing_editor",
+        )
+    ]
+    if feed.image:
+        properties.extend([feed.image.url, feed.image.height, feed.image.width])
+    for entry in feed.entries:
+        properties.extend(
+            getattr(entry, name)
+            for name in (
+                "title",
+                "description",
+                "link",
+                "guid",
+                "id",
+                "source",
+                "geometries",
+                "category",
+                "published_date",
+                "updated_date",
+                "author",
+            )
+        )
+    return properties
+
+
+@pytest.mark.parametrize("backend", [PARSER_BACKEND_XMLTODICT, PARSER_BACKEND_EXPAT])
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "generic_feed_1.xml",
+        "generic_feed_2.xml",
+        "generic_feed_3.xml",
+        "generic_feed_6.xml",
+        "generic_feed_8.xml",
+        "xml_parser_complex_1.xml",
+        "xml_parser_complex_2.xml",
+        "xml_parser_complex_3.xml",
+        "xml_parser_geometries_1.xml",
+    ],
+)
+def test_lazy_conversion_parity(fixture, backend):
+    """Test that lazy conversion produces the same values as eager conversion."""
+    xml = load_fixture(fixture)
+    eager_feed = XmlParser(backend=backend).parse(xml)
+    lazy_feed = XmlParser(backend=backend, lazy_conversion=True).parse(xml)
+    assert _feed_properties(lazy_feed) == _feed_properties(eager_feed)
+    # Converted values are memoised.
+    assert _feed_properties(lazy_feed) == _feed_properties(eager_feed)
+
+
+def test_lazy_conversion_on_first_access():
+    """Test that values are only converted when they are first read."""
+    xml = load_fixture("xml_parser_complex_1.xml")
+    feed = XmlParser(lazy_conversion=True).parse(xml)
+    entry = feed.entries[0]
+    assert isinstance(entry._source["pubDate"], LazyValue)  # noqa: SLF001
+    with patch.object(
+        XmlParser,
+        "_parse_date",
+        wraps=XmlParser._parse_date,  # noqa: SLF001
+    ) as mock_parse_date:
+        assert entry.published_date == datetime.datetime(
+            2018, 12, 9, 7, 30, tzinfo=datetime.UTC
+        )
+        assert entry.published_date == datetime.datetime(
+            2018, 12, 9, 7, 30, tzinfo=datetime.UTC
+        )
+        assert mock_parse_date.call_count == 1
+    assert entry._source["pubDate"].converted  # noqa: SLF001
+    # Other entries have not been converted.
+    assert not feed.entries[1]._source["published"].converted  # noqa: SLF001
+
+
+@pytest.mark.parametrize("lazy_conversion", [False, True])
+def test_fingerprint(lazy_conversion):
+    """Test the fingerprints of feed items."""
+    parser = XmlParser(lazy_conversion=lazy_conversion)
+    entries_1 = parser.parse(load_fixture("generic_feed_1.xml")).entries
+    entries_2 = parser.parse(load_fixture("generic_feed_1.xml")).entries
+    fingerprints = [entry.fingerprint for entry in entries_1]
+    assert fingerprints == [entry.fingerprint for entry in entries_2]
+    assert len(set(fingerprints)) == len(fingerprints)
+    assert all(len(fingerprint) == 32 for fingerprint in fingerprints)
+    # Computed once, even if values are converted later.
+    _ = entries_1[0].published_date
+    assert entries_1[0].fingerprint == fingerprints[0]
+    # Independent of the values read before computing it.
+    entries_3 = parser.parse(load_fixture("generic_feed_1.xml")).entries
+    _ = [(entry.published_date, entry.updated_date) for entry in entries_3]
+    assert [entry.fingerprint for entry in entries_3] == fingerprints
+
+    entries_4 = parser.parse(load_fixture("generic_feed_4.xml")).entries
+    # The title of the first entry changed, the second one is the same.
+    assert entries_4[0].fingerprint != fingerprints[0]
+    assert entries_4[1].fingerprint == fingerprints[1]
+
+
+@pytest.mark.parametrize("backend", [PARSER_BACKEND_XMLTODICT, PARSER_BACKEND_EXPAT])
+@pytest.mark.parametrize(
+    ("limits", "exceeded"),
+    [
+        ({"max_items": 6, "max_polygon_vertices": 5}, False),
+        ({"max_items": 5}, True),
+        ({"max_polygon_vertices": 4}, True),
+    ],
+)
+def test_limits(backend, limits, exceeded):
+    """Test rejecting feeds with too many items or polygon vertices."""
+    xml_parser = XmlParser(backend=backend, **limits)
+    xml = load_fixture("xml_parser_complex_1.xml")
+    if exceeded:
+        with pytest.raises(GeoRssLimitExceeded):
+            xml_parser.parse(xml)
+    else:
+        feed = xml_parser.parse(xml)
+        assert len(feed.entries) == 6
+        assert feed.entries[4].geometries == [
+            Polygon(
+                [
+                    Point(-30.1, 150.1),
+                    Point(-30.2, 150.2),
+                    Point(-30.4, 150.4),
+                    Point(-30.8, 150.8),
+                    Point(-30.1, 150.1),
+                ]
+            )
+        ]
+
+
+def test_limits_streaming_abort():
+    """Test that streaming stops at the first item exceeding the maximum."""
+    xml = load_fixture("xml_parser_complex_1.xml").encode("utf-8")
+    items = []
+    streaming_parser = XmlParser(max_items=2).streaming_parser(
+        item_callback=items.append
+    )
+
+    def feed_in_chunks():
+        for i in range(0, len(xml), 64):
+            streaming_parser.feed(xml[i : i + 64])
+
+    with pytest.raises(GeoRssLimitExceeded):
+        feed_in_chunks()
+    assert len(items) == 2
+
+
+@pytest.mark.parametrize(
+    ("head", "charset", "expected"),
+    [
+        (b"<rss/>", None, (None, None)),
+        (b"\xef\xbb\xbf<rss/>", "windows-1252", (None, None)),
+        (b"\xff\xfe<\x00", None, (None, None)),
+        (b"<rss/>", "UTF8", ("UTF-8", None)),
+        (b"<rss/>", "latin-1", ("ISO-8859-1", None)),
+        (b"<rss/>", "windows-1252", ("UTF-8", "cp1252")),
+        (b"<rss/>", "invalid", (None, None)),
+        (b"<?xml version='1.0' encoding='ISO-8859-1'?><rss/>", None, (None, None)),
+        (
+            b'<?xml version="1.0" encoding="windows-1252"?><rss/>',
+            None,
+            ("UTF-8", "cp1252"),
+        ),
+        (
+            b'<?xml version="1.0" encoding="windows-1252"?><rss/>',
+            "utf-8",
+            ("UTF-8", None),
+        ),
+    ],
+)
+def test_detect_encoding(head, charset, expected):
+    """Test detecting the encoding to parse a document with."""
+    assert detect_encoding(head, charset) == expected
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"", False),
+        (b"\xef\xbb", False),
+        (b"\xef\xbb\xbf", True),
+        (b"\xff\xfe", True),
+        (b"<?x", False),
+        (b"<?xml version='1.0' encoding='shift_jis'", False),
+        (b"<?xml version='1.0' encoding='shift_jis'?>", True),
+        (b"<rss", True),
+        (b"<?xml " + b" " * MAX_HEAD_SIZE, True),
+    ],
+)
+def test_is_complete_head(head, expected):
+    """Test checking if enough of a document is known to detect its encoding."""
+    assert is_complete_head(head) is expected
+
+
+@pytest.mark.parametrize("backend", [PARSER_BACKEND_XMLTODICT, PARSER_BACKEND_EXPAT])
+@pytest.mark.parametrize(
+    ("xml", "encoding"),
+    [
+        (
+            "\ufeff<?xml version='1.0' encoding='utf-8'?>"
+            "<rss version='2.0'><channel><title>Gr\u00fc\u00dfe</title>"
+            "</channel></rss>".encode(),
+            None,
+        ),
+        (
+            "<?xml version='1.0' encoding='ISO-8859-1'?>"
+            "<rss version='2.0'><channel><title>Gr\u00fc\u00dfe</title>"
+            "</channel></rss>".encode("iso-8859-1"),
+            None,
+        ),
+        (
+            "<rss version='2.0'><channel><title>Gr\u00fc\u00dfe</title>"
+            "</channel></rss>".encode("iso-8859-1"),
+            "ISO-8859-1",
+        ),
+    ],
+)
+def test_parse_bytes(backend, xml, encoding):
+    """Test parsing bytes without decoding them first."""
+    feed = XmlParser(backend=backend).parse(xml, encoding)
+    assert feed.title == "Gr\u00fc\u00dfe"